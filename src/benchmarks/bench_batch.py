@@ -0,0 +1,232 @@
+"""Batched simulation throughput benchmark module.
+
+This module compares the per-drone update throughput of separate
+SimulationAPI instances against a single BatchSimulationAPI instance flying
+the same tracks, reporting the time spent per drone and timestep for each of
+them. Two scenarios are measured:
+
+- Constant: every drone keeps the same constant target state for a fixed
+  number of timesteps, flying away from its waypoints.
+- Follow: every drone steers towards its next waypoint until its simulation
+  is finished, so that waypoints are reached through the exact evaluation
+  path and finished drones are left out of the recorded data. The size of
+  the recorded data and the peak resident memory of the process are reported
+  as well, where available. Recorded data is kept for every drone and
+  timestep, so it dominates peak memory for large batches.
+
+Each scenario reports whether the batched simulation reaches the
+`TARGET_SPEEDUP` throughput target.
+
+Usage:
+    python -m benchmarks.bench_batch [drones] (from the `src` directory)
+
+Author:
+    Paulo Sanchez (@erlete)
+"""
+
+import math
+import sys
+import time
+
+import numpy as np
+
+from sdc.api.batch import BatchSimulationAPI
+from sdc.api.simulation import SimulationAPI
+from sdc.environment.generator import TrackGenerator
+
+DRONES = 10_000
+SERIAL_DRONES = 100
+SERIAL_FOLLOW_DRONES = 16
+TICKS = 100
+TRACK_COUNT = 16
+RING_COUNT = 50
+TARGET_SPEEDUP = 100
+RECORD_ROW_SIZE = 6 * 8  # Recorded float64 values per drone-step [B].
+
+
+def steer(
+    position: tuple[float, float, float],
+    waypoint: tuple[float, float, float] | None
+) -> tuple[float, float, float]:
+    """Get the target state that steers a drone towards a waypoint.
+
+    Args:
+        position (tuple[float, float, float]): drone position.
+        waypoint (tuple[float, float, float] | None): next waypoint, None if
+            the track is finished.
+
+    Returns:
+        tuple[float, float, float]: target yaw, pitch and speed.
+    """
+    if waypoint is None:
+        return 0.0, 0.0, 0.0
+
+    dx, dy, dz = (w - p for w, p in zip(waypoint, position))
+
+    return (
+        math.atan2(dy, dx),
+        math.atan2(dz, math.hypot(dx, dy)),
+        min(20.0, 2 * math.sqrt(dx * dx + dy * dy + dz * dz))
+    )
+
+
+def serial(tracks: list, drones: int) -> float:
+    """Measure the update time of separate SimulationAPI instances.
+
+    Args:
+        tracks (list): tracks to cycle through.
+        drones (int): number of drones.
+
+    Returns:
+        float: time per drone and timestep in seconds.
+    """
+    sims = [SimulationAPI([tracks[i % len(tracks)]]) for i in range(drones)]
+    for sim in sims:
+        sim.set_drone_target_state(0.5, 0.1, 10)
+
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        for sim in sims:
+            sim.update(plot=False)
+
+    return (time.perf_counter() - start) / (TICKS * drones)
+
+
+def batch(tracks: list, drones: int) -> float:
+    """Measure the update time of a BatchSimulationAPI instance.
+
+    Args:
+        tracks (list): tracks to cycle through.
+        drones (int): number of drones.
+
+    Returns:
+        float: time per drone and timestep in seconds.
+    """
+    sim = BatchSimulationAPI([tracks[i % len(tracks)] for i in range(drones)])
+    sim.set_drone_target_states(0.5, 0.1, 10)
+
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        sim.update()
+
+    return (time.perf_counter() - start) / (TICKS * drones)
+
+
+def serial_follow(tracks: list, drones: int) -> float:
+    """Measure the update time of SimulationAPI instances following tracks.
+
+    Each drone is steered towards its next waypoint until its simulation is
+    finished.
+
+    Args:
+        tracks (list): tracks to cycle through.
+        drones (int): number of drones.
+
+    Returns:
+        float: time per drone and timestep in seconds.
+    """
+    steps, elapsed = 0, 0.0
+    for i in range(drones):
+        sim = SimulationAPI([tracks[i % len(tracks)]])
+
+        start = time.perf_counter()
+        while not sim.is_simulation_finished:
+            waypoint = sim.next_waypoint
+            sim.set_drone_target_state(*steer(
+                tuple(sim.drone.position),
+                None if waypoint is None else tuple(waypoint)
+            ))
+            sim.update(plot=False)
+            steps += 1
+        elapsed += time.perf_counter() - start
+
+    return elapsed / steps
+
+
+def batch_follow(tracks: list, drones: int) -> tuple[float, int]:
+    """Measure the update time of a BatchSimulationAPI following tracks.
+
+    Each drone is steered towards its next waypoint until every simulation
+    is finished.
+
+    Args:
+        tracks (list): tracks to cycle through.
+        drones (int): number of drones.
+
+    Returns:
+        tuple[float, int]: time per drone and timestep in seconds and number
+            of recorded drone-steps.
+    """
+    sim = BatchSimulationAPI([tracks[i % len(tracks)] for i in range(drones)])
+
+    steps, recorded, elapsed = 0, 0, 0.0
+    while not sim.is_simulation_finished:
+        recorded += int(np.count_nonzero(~sim.is_finished))
+        start = time.perf_counter()
+        waypoints = sim.next_waypoints
+        dx, dy, dz = (waypoints - sim.fleet.positions).T
+        done = np.isnan(dx)
+        sim.set_drone_target_states(
+            np.where(done, 0.0, np.arctan2(dy, dx)),
+            np.where(done, 0.0, np.arctan2(dz, np.hypot(dx, dy))),
+            np.where(done, 0.0, np.minimum(
+                20.0, 2 * np.sqrt(dx * dx + dy * dy + dz * dz)
+            ))
+        )
+        sim.update()
+        elapsed += time.perf_counter() - start
+        steps += int(np.count_nonzero(~sim.is_finished))
+
+    return elapsed / steps, recorded
+
+
+def report(name: str, serial_time: float, batch_time: float) -> None:
+    """Print the results of a scenario.
+
+    Args:
+        name (str): scenario name.
+        serial_time (float): SimulationAPI time per drone and timestep.
+        batch_time (float): BatchSimulationAPI time per drone and timestep.
+    """
+    print(f"{name}:")
+    print(f"{'  SimulationAPI':<36}{serial_time * 1e9:>10.1f} ns/drone-step")
+    print(
+        f"{f'  BatchSimulationAPI ({drones} drones)':<36}"
+        + f"{batch_time * 1e9:>10.1f} ns/drone-step"
+    )
+    speedup = serial_time / batch_time
+    print(f"{'  Speedup':<36}{speedup:>10.1f} x")
+    print(
+        f"{f'  Target ({TARGET_SPEEDUP} x)':<36}"
+        + f"{'met' if speedup >= TARGET_SPEEDUP else 'not met':>10}"
+    )
+
+
+if __name__ == "__main__":
+    drones = int(sys.argv[1]) if len(sys.argv) > 1 else DRONES
+    tracks = TrackGenerator(seed=0).generate_sequence(TRACK_COUNT, RING_COUNT)
+
+    report(
+        "Constant",
+        serial(tracks, min(drones, SERIAL_DRONES)),
+        batch(tracks, drones)
+    )
+
+    follow_time, recorded = batch_follow(tracks, drones)
+    report(
+        "Follow",
+        serial_follow(tracks, min(drones, SERIAL_FOLLOW_DRONES)),
+        follow_time
+    )
+    print(
+        f"{'  Recorded data':<36}"
+        + f"{recorded * RECORD_ROW_SIZE / 2 ** 20:>10.1f} MiB"
+    )
+
+    try:
+        import resource
+    except ImportError:  # Not available on Windows.
+        pass
+    else:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2 ** 10
+        print(f"{'Peak resident memory':<36}{peak:>10.1f} MiB")
@@ -0,0 +1,72 @@
+"""Vector construction micro-benchmark module.
+
+This module compares the public, validated Vector3D and Rotator3D
+constructors against the trusted fast path used by the vector operators and
+the simulation loop, reporting execution time and allocated memory for each
+of them.
+
+Usage:
+    python -m benchmarks.bench_vector (from the `src` directory)
+
+Author:
+    Paulo Sanchez (@erlete)
+"""
+
+import timeit
+import tracemalloc
+
+from sdc.core.vector import Rotator3D, Vector3D
+
+ITERATIONS = 200_000
+
+
+def measure(label: str, statement: str, namespace: dict) -> None:
+    """Measure and print execution time and allocated memory of a statement.
+
+    Args:
+        label (str): benchmark label.
+        statement (str): statement to measure.
+        namespace (dict): namespace in which the statement is evaluated.
+    """
+    elapsed = min(timeit.repeat(
+        statement,
+        globals=namespace,
+        number=ITERATIONS,
+        repeat=5
+    ))
+
+    tracemalloc.start()
+    objects = [eval(statement, namespace) for _ in range(10_000)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+
+    print(
+        f"{label:<36}"
+        + f"{elapsed / ITERATIONS * 1e9:>10.1f} ns/op"
+        + f"{allocated / 10_000:>10.1f} B/op"
+    )
+
+
+if __name__ == "__main__":
+    namespace = {
+        "Vector3D": Vector3D,
+        "Rotator3D": Rotator3D,
+        "a": Vector3D(1, 2, 3),
+        "b": Vector3D(4, 5, 6)
+    }
+
+    measure("Vector3D(...)", "Vector3D(1.0, 2.0, 3.0)", namespace)
+    measure(
+        "Vector3D._from_floats(...)",
+        "Vector3D._from_floats(1.0, 2.0, 3.0)",
+        namespace
+    )
+    measure("Rotator3D(...)", "Rotator3D(1.0, 2.0, 3.0)", namespace)
+    measure(
+        "Rotator3D._from_floats(...)",
+        "Rotator3D._from_floats(1.0, 2.0, 3.0)",
+        namespace
+    )
+    measure("a + b", "a + b", namespace)
+    measure("a * 2.0", "a * 2.0", namespace)
@@ -19,7 +19,7 @@ from sdc.environment.reader import TrackSequenceReader
 sim = SimulationAPI(
     TrackSequenceReader(
         os.path.join(os.path.dirname(__file__), "tracks.json")
-    ).track_sequence
+    ).iter_tracks()  # Tracks are read lazily, one at a time.
 )
 
 # Simulation mainloop:
@@ -8,7 +8,9 @@ provides with statistical measurement tools for keeping track on the simulation
 progress.
 
 Modules:
+    batch: batched multi-drone simulation API.
     drone: drone API extension.
+    runner: parallel simulation runner.
     simulation: core simulation API.
     statistics: statistical measurement tools.
     track: track API extension.
@@ -0,0 +1,730 @@
+"""Batched simulation API module.
+
+This module implements the kinematics of the Simulation API for many drones
+at once, each of them flying its own track, with NumPy array operations.
+
+Author:
+    Paulo Sanchez (@erlete)
+"""
+
+
+from typing import Sequence
+
+import numpy as np
+from scoretree import Score
+
+from ..core.vector import Vector3D, distance3D
+from ..environment.track import Track
+from .drone import DroneFleet
+from .simulation import SimulationAPI
+from .statistics import TrackStatistics
+from .track import TrackAPI
+
+
+class BatchSimulationAPI:
+    """Batched simulation API class.
+
+    This class simulates N drones at once, drone i flying track i from its
+    start, and applies the same kinematics, waypoint evaluation and finish
+    conditions as N separate single-track SimulationAPI instances. The state
+    of every drone, including its target state, waypoint cursor, timer and
+    finish flags, is stored in arrays, so that each update takes a fixed
+    number of array operations regardless of N. Every operation reproduces
+    the floating-point arithmetic of the scalar implementation, so results
+    are bit-for-bit equal.
+
+    Drones whose simulation is finished are frozen, while the rest of them
+    keep being updated until all of them are finished.
+
+    Recorded data is stored in blocks of `BLOCK_SIZE` timesteps, each holding
+    only the drones that were not finished when it was allocated. Recorded
+    memory is therefore proportional to the number of recorded drone
+    timesteps, plus at most one block, and recorded data is never copied
+    while the simulation runs.
+
+    Attributes:
+        tracks (list[Track]): track of each drone.
+        fleet (DroneFleet): drone states.
+        next_waypoints (np.ndarray): (N, 3) next waypoint of each drone.
+        remaining_waypoints (np.ndarray): (N,) remaining waypoints of each
+            drone.
+        is_track_finished (np.ndarray): (N,) whether each track is finished.
+        is_finished (np.ndarray): (N,) whether each drone simulation is
+            finished.
+        is_simulation_finished (bool): whether all drone simulations are
+            finished.
+        timers (np.ndarray): (N,) simulation time of each drone in seconds.
+        scores (list[tuple[bool, list[Score]]]): score of each drone.
+        DT (float): simulation time step in seconds.
+        DV (float): simulation speed step in m/s.
+        DR (float): simulation rotation step in rad/s.
+        BLOCK_SIZE (int): number of recorded timesteps per data block.
+        DENSE_FRACTION (float): minimum fraction of unfinished drones for
+            which whole fleet columns are updated instead of gathering the
+            unfinished drones.
+    """
+
+    DT = SimulationAPI.DT
+    DV = SimulationAPI.DV
+    DR = SimulationAPI.DR
+    BLOCK_SIZE = 64
+    DENSE_FRACTION = 0.25
+
+    def __init__(self, tracks: Sequence[Track]) -> None:
+        """Initialize a BatchSimulationAPI instance.
+
+        Args:
+            tracks (Sequence[Track]): track of each drone. The same track can
+                be given to several drones.
+        """
+        tracks = list(tracks)
+
+        if not tracks:
+            raise ValueError(
+                f"{self.__class__.__name__}.tracks cannot be empty"
+            )
+
+        for i, track in enumerate(tracks):
+            if not isinstance(track, Track):
+                raise TypeError(
+                    "expected type Track for"
+                    + f" {self.__class__.__name__}.tracks but got"
+                    + f" {type(track).__name__} from item at index {i}"
+                    + " instead"
+                )
+
+        self._tracks = tracks
+        self._build_waypoints()
+
+        count = len(tracks)
+
+        # Drones whose next waypoint may be reached from their current
+        # position, so that it must be evaluated again before it is read, and
+        # timestep from which each drone must be evaluated after it moves:
+        self._near = np.arange(count)
+        self._check_steps = np.zeros(count, dtype=np.int64)
+        starts = np.array([tuple(track.start) for track in tracks])
+        self._fleet = DroneFleet(starts)
+        self._last_positions = self._fleet.positions.copy(order="F")
+        self._forwards = np.zeros((count, 3), order="F")
+        self._forwards[:, 0] = 1.0
+        self._forward_keys = np.zeros((count, 2), order="F")
+        self._timers = np.zeros(count)
+
+        self._target_rotations = np.zeros((count, 3), order="F")
+        self._target_speeds = np.zeros(count)
+
+        self._is_track_finished = np.zeros(count, dtype=bool)
+        self._is_finished = np.zeros(count, dtype=bool)
+        self._is_completed = np.zeros(count, dtype=bool)
+        self._distances_to_end = np.zeros(count)
+
+        # Recorded data blocks, as (first timestep, drone indices, data)
+        # tuples (all drones start together, so drone i is recorded at
+        # timesteps 0 to `_steps[i]` - 1):
+        self._blocks: list[tuple[int, np.ndarray, np.ndarray]] = []
+        self._block_rows = self.BLOCK_SIZE
+        self._steps = np.zeros(count, dtype=np.int64)
+        self._step = 0
+        self._add_data()
+
+    def _build_waypoints(self) -> None:
+        """Build the waypoint, ring and timeout arrays of all tracks.
+
+        Waypoints of distinct tracks are stored once, in a flat array, and
+        each drone keeps a cursor to its next waypoint in it. The last
+        waypoint of each track is its end, which has no ring. The reach of a
+        waypoint bounds the distance from it at which it can be reached,
+        either through the ring hole or within the reached threshold.
+        """
+        unique: dict[int, int] = {}
+        first = []
+        positions, normals, scales, holes, reaches = [], [], [], [], []
+        timeouts = []
+        threshold = TrackAPI.REACHED_THRESHOLD
+
+        for track in self._tracks:
+            if id(track) in unique:
+                continue
+
+            unique[id(track)] = len(first)
+            first.append(len(positions))
+            timeouts.append(track.path_length * 2 / TrackAPI.MIN_TIMEOUT_SPEED)
+
+            for ring in track.rings:
+                positions.append(tuple(ring.position))
+                normals.append(tuple(ring.rotation.matrix[:, 2].tolist()))
+                scales.append(tuple(ring.scale))
+                holes.append(ring.hole_radius ** 2)
+                reaches.append(max(
+                    threshold, ring.hole_radius * max(map(abs, ring.scale))
+                ))
+
+            positions.append(tuple(track.end))
+            normals.append((0.0, 0.0, 0.0))
+            scales.append((1.0, 1.0, 1.0))
+            holes.append(-1.0)  # No ring.
+            reaches.append(threshold)
+
+        first.append(len(positions))
+        track_ids = np.array([unique[id(track)] for track in self._tracks])
+
+        self._waypoints = np.array(positions)
+        self._ring_normals = np.array(normals)
+        self._ring_scales = np.array(scales)
+        self._ring_holes = np.array(holes)
+        self._reaches = np.array(reaches)
+        self._cursors = np.array(first)[track_ids]
+        self._last_waypoints = np.array(first)[track_ids + 1] - 1
+        self._next_waypoints = np.asfortranarray(
+            self._waypoints[self._cursors]
+        )
+        self._next_reaches = self._reaches[self._cursors]
+        self._timeouts = np.array(timeouts)[track_ids]
+
+    @property
+    def tracks(self) -> list[Track]:
+        """Get track of each drone.
+
+        Returns:
+            list[Track]: track of each drone.
+        """
+        return self._tracks
+
+    @property
+    def fleet(self) -> DroneFleet:
+        """Get drone states.
+
+        Returns:
+            DroneFleet: drone states. Drones can be inspected through it, but
+                their state must only be changed by the simulation.
+        """
+        return self._fleet
+
+    @property
+    def next_waypoints(self) -> np.ndarray:
+        """Update and return the next waypoint of each drone.
+
+        Only drones that were near their next waypoint at the last
+        evaluation are evaluated again, since the rest of them cannot reach
+        it without moving.
+
+        Returns:
+            np.ndarray: (N, 3) next waypoint of each drone, NaN for finished
+                tracks.
+        """
+        self._eval_reached_waypoints(
+            self._near[~self._is_finished[self._near]]
+        )
+
+        waypoints = self._next_waypoints.copy(order="F")
+        finished = np.flatnonzero(self._is_track_finished)
+        for column in waypoints.T:
+            column[finished] = np.nan
+
+        return waypoints
+
+    @property
+    def remaining_waypoints(self) -> np.ndarray:
+        """Get remaining waypoints of each drone (including current one).
+
+        Returns:
+            np.ndarray: (N,) remaining waypoints of each drone.
+        """
+        return np.where(
+            self._is_track_finished,
+            0,
+            self._last_waypoints - self._cursors + 1
+        )
+
+    @property
+    def is_track_finished(self) -> np.ndarray:
+        """Get whether the track of each drone is finished.
+
+        Returns:
+            np.ndarray: (N,) read-only track finish flags.
+        """
+        return self._read_only(self._is_track_finished)
+
+    @property
+    def is_finished(self) -> np.ndarray:
+        """Get whether the simulation of each drone is finished.
+
+        Returns:
+            np.ndarray: (N,) read-only simulation finish flags.
+        """
+        return self._read_only(self._is_finished)
+
+    @property
+    def is_simulation_finished(self) -> bool:
+        """Get whether the simulation of every drone is finished.
+
+        Returns:
+            bool: True if the simulation is finished, False otherwise.
+        """
+        return bool(self._is_finished.all())
+
+    @property
+    def timers(self) -> np.ndarray:
+        """Get simulation time of each drone.
+
+        Returns:
+            np.ndarray: (N,) read-only simulation time of each drone in
+                seconds.
+        """
+        return self._read_only(self._timers)
+
+    def set_drone_target_states(
+        self,
+        yaw: int | float | np.ndarray,
+        pitch: int | float | np.ndarray,
+        speed: int | float | np.ndarray
+    ) -> None:
+        """Set drone target states.
+
+        Each value can either be a number, shared by every drone, or an
+        (N,) array.
+
+        Args:
+            yaw (int | float | np.ndarray): target drone yaw in radians.
+            pitch (int | float | np.ndarray): target drone pitch in radians.
+            speed (int | float | np.ndarray): target drone speed in m/s.
+        """
+        values = []
+
+        for name, value in (("yaw", yaw), ("pitch", pitch), ("speed", speed)):
+            try:
+                values.append(np.broadcast_to(
+                    np.asarray(value, dtype=np.float64), len(self._tracks)
+                ))
+            except (TypeError, ValueError):
+                raise TypeError(
+                    f"expected a number or ({len(self._tracks)},) array for"
+                    + f" {self.__class__.__name__}.set_drone_target_states"
+                    + f" {name} but got {type(value).__name__} instead"
+                ) from None
+
+        self._target_rotations[:, 0] = values[0]
+        self._target_rotations[:, 1] = values[1]
+        self._target_speeds[:] = values[2]
+
+    def update(self) -> None:
+        """Update the state of every drone whose simulation is not finished.
+
+        Each drone goes through the same steps as in `SimulationAPI.update`:
+        finish condition evaluation, rotation and speed update, position
+        integration with the previous speed, data recording and swept
+        waypoint evaluation.
+
+        While at least `DENSE_FRACTION` of the drones are not finished, whole
+        fleet columns are updated and the values of finished drones are
+        restored before they are written, which is faster than gathering and
+        scattering the rest.
+        """
+        active = ~self._is_finished
+        np.add(self._timers, self.DT, out=self._timers, where=active)
+
+        # Simulation endpoint conditions (a stopped drone implies a finished
+        # track):
+        timed_out = self._timers >= self._timeouts
+        stopped = self._is_track_finished & (self._fleet.speeds == 0)
+
+        # On completed track finish condition:
+        for i in np.flatnonzero(active & stopped).tolist():
+            self._is_completed[i] = True
+            self._distances_to_end[i] = distance3D(
+                Vector3D._from_floats(*self._fleet.positions[i].tolist()),
+                self._tracks[i].end
+            )
+
+        active &= ~(timed_out | stopped)
+        np.logical_not(active, out=self._is_finished)
+        count = int(np.count_nonzero(active))
+
+        if not count:
+            return
+
+        drones: np.ndarray | slice = slice(None)
+        frozen: np.ndarray | None = None
+
+        if count < len(self) * self.DENSE_FRACTION:
+            drones = np.flatnonzero(active)
+        elif count < len(self):
+            frozen = np.flatnonzero(~active)
+
+        positions, rotations = self._fleet.positions, self._fleet.rotations
+        speeds = self._fleet.speeds
+
+        # Rotation update (drones start with null rolls and roll targets are
+        # always null, so rolls never change):
+        for axis in range(2):
+            column = rotations[:, axis]
+            self._put(column, drones, frozen, self._approach(
+                column[drones],
+                self._target_rotations[:, axis][drones],
+                self.DR * self.DT
+            ))
+
+        # Speed update (distance is travelled at the previous speed):
+        distances = speeds[drones] * self.DT
+        self._put(speeds, drones, frozen, np.clip(
+            self._approach(
+                speeds[drones],
+                self._target_speeds[drones],
+                self.DV * self.DT
+            ),
+            *self._fleet.SPEED_RANGE
+        ))
+
+        # Position update:
+        forwards = self._update_forwards(drones)
+        for axis in range(3):
+            column = positions[:, axis]
+            self._put(
+                column,
+                drones,
+                frozen,
+                column[drones] + forwards[axis] * distances
+            )
+
+        self._add_data()
+
+        # Swept waypoint evaluation along the segment travelled this tick,
+        # for the drones that can be near their next waypoint:
+        self._eval_reached_waypoints(
+            np.flatnonzero(active & (self._check_steps <= self._step))
+        )
+        np.copyto(self._last_positions, positions)
+
+    def _update_forwards(
+        self,
+        drones: np.ndarray | slice
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Update and return the forward vectors of a set of drones.
+
+        Forward vectors are computed as in `Rotator3D.forward`, from the X
+        (yaw) and Y (pitch) rotations, and memoized in the same way: they are
+        only recomputed for drones whose yaw or pitch changed. Recomputing
+        the vector of an unchanged drone gives the same result, so all of
+        them are recomputed when most of them changed.
+
+        Args:
+            drones (np.ndarray | slice): drone indices.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: X, Y and Z components
+                of the forward vector of each drone.
+        """
+        yaws, pitches = self._fleet.rotations.T[:2]
+        yaw_keys, pitch_keys = self._forward_keys.T
+        forwards = self._forwards.T
+        changed = (yaws[drones] != yaw_keys[drones]) | (
+            pitches[drones] != pitch_keys[drones]
+        )
+        count = np.count_nonzero(changed)
+
+        if count:
+            if count >= len(changed) * self.DENSE_FRACTION:
+                changed = drones
+            else:
+                changed = np.arange(len(self))[drones][changed]
+
+            yaw, pitch = yaws[changed], pitches[changed]
+            cos_y = np.cos(pitch)
+            forwards[0][changed] = np.cos(yaw) * cos_y
+            forwards[1][changed] = np.sin(yaw) * cos_y
+            forwards[2][changed] = np.sin(pitch)
+            yaw_keys[changed] = yaw
+            pitch_keys[changed] = pitch
+
+        return forwards[0][drones], forwards[1][drones], forwards[2][drones]
+
+    def _add_data(self) -> None:
+        """Record the state of the unfinished drones at the current timestep.
+
+        A new block is allocated for the unfinished drones once the current
+        one is full, so finished drones are left out of it. Rows are written
+        in bulk for every drone of the block, including those finished within
+        it, whose rows past their last timestep are never read. Roll is
+        always null, so it is not recorded.
+        """
+        if self._block_rows == self.BLOCK_SIZE:
+            ids = np.flatnonzero(~self._is_finished)
+            self._blocks.append((
+                self._step, ids, np.empty((self.BLOCK_SIZE, 6, len(ids)))
+            ))
+            self._block_rows = 0
+
+        _, ids, data = self._blocks[-1]
+        row = data[self._block_rows]
+        columns = (
+            *self._fleet.positions.T,
+            *self._fleet.rotations.T[:2],
+            self._fleet.speeds
+        )
+
+        if len(ids) == len(self):
+            for i, column in enumerate(columns):
+                row[i] = column
+        else:
+            for i, column in enumerate(columns):
+                np.take(column, ids, out=row[i], mode="clip")
+
+        self._steps += ~self._is_finished
+        self._block_rows += 1
+        self._step += 1
+
+    def _eval_reached_waypoints(self, drones: np.ndarray) -> None:
+        """Evaluate whether a set of drones have reached their next waypoint.
+
+        This is the vectorized version of `TrackAPI._eval_reached_waypoint`,
+        swept along the segment travelled by each drone since its previous
+        evaluation.
+
+        Only drones whose segment passes within the reach of their next
+        waypoint can reach it. Since the distance from the waypoint to the
+        segment start is at most the segment length plus the distance from
+        the waypoint to the segment, the rest of them are discarded with a
+        conservative bound before the exact evaluation. The drones left
+        within the reached threshold of their next waypoint are kept as the
+        near drones.
+
+        Drones travel a bounded distance per timestep, so the same bound
+        gives the first timestep at which each drone can be near its next
+        waypoint, and it is not evaluated again until then.
+
+        Segment starts are not updated, so that the evaluation can be
+        repeated along the same segments.
+
+        Args:
+            drones (np.ndarray): drone indices.
+        """
+        if not len(drones):
+            return
+
+        positions, starts = self._fleet.positions, self._last_positions
+        length = distance = np.zeros(len(drones))
+
+        for axis in range(3):
+            start = starts[:, axis][drones]
+            d = positions[:, axis][drones] - start
+            p = self._next_waypoints[:, axis][drones] - start
+            length = length + d * d
+            distance = distance + p * p
+
+        reaches = self._next_reaches[drones]
+        bound = reaches + np.sqrt(length)
+        near = ~self._is_track_finished[drones] & (
+            distance <= (bound * 1.001 + 1e-6) ** 2
+        )
+
+        # Segments are at most `travel` long, so the bound cannot be met
+        # until the segment start gets `slack` closer to the waypoint:
+        travel = self._fleet.SPEED_RANGE[1] * self.DT * 1.001
+        slack = np.sqrt(distance) - (reaches * 1.001 + travel + 1e-6)
+        self._check_steps[drones] = self._step + np.maximum(
+            1, np.ceil(slack / travel)
+        ).astype(np.int64)
+
+        near = pending = drones[near]
+
+        while len(pending):
+            pending = pending[self._reached(pending)]
+            ended = self._cursors[pending] == self._last_waypoints[pending]
+            self._is_track_finished[pending[ended]] = True
+            pending = pending[~ended]
+            self._cursors[pending] += 1
+            self._next_waypoints[pending] = self._waypoints[
+                self._cursors[pending]
+            ]
+            self._next_reaches[pending] = self._reaches[self._cursors[pending]]
+
+        # Rings cannot be crossed without moving, so only drones within the
+        # reached threshold of their next waypoint can reach it before they
+        # move again:
+        near = near[~self._is_track_finished[near]]
+        distance = 0.0
+
+        for axis in range(3):
+            p = self._next_waypoints[near, axis] - positions[near, axis]
+            distance = distance + p * p
+
+        self._near = near[
+            distance <= (TrackAPI.REACHED_THRESHOLD * 1.001 + 1e-6) ** 2
+        ]
+
+    def _reached(self, drones: np.ndarray) -> np.ndarray:
+        """Check whether a set of drones have reached their next waypoint.
+
+        The operations of `Ring.crosses` and `TrackAPI._segment_distance` are
+        reproduced component by component in the same order, so results are
+        equal to theirs.
+
+        Args:
+            drones (np.ndarray): drone indices.
+
+        Returns:
+            np.ndarray: (M,) boolean array, True for each drone that reached
+                its next waypoint.
+        """
+        cursors = self._cursors[drones]
+        start = self._last_positions[drones]
+        end = self._fleet.positions[drones]
+        point = self._waypoints[cursors]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Ring crossing:
+            normal = self._ring_normals[cursors]
+            scale = self._ring_scales[cursors]
+            a, b = (start - point) / scale, (end - point) / scale
+            da = a[:, 0] * normal[:, 0] + a[:, 1] * normal[:, 1] + (
+                a[:, 2] * normal[:, 2]
+            )
+            db = b[:, 0] * normal[:, 0] + b[:, 1] * normal[:, 1] + (
+                b[:, 2] * normal[:, 2]
+            )
+            t = da / (da - db)
+            hit = a + t[:, np.newaxis] * (b - a)
+            crosses = ((da <= 0) != (db <= 0)) & (
+                hit[:, 0] * hit[:, 0] + hit[:, 1] * hit[:, 1]
+                + hit[:, 2] * hit[:, 2] <= self._ring_holes[cursors]
+            )
+
+            # Segment distance:
+            d, p = end - start, point - start
+            length = d[:, 0] * d[:, 0] + d[:, 1] * d[:, 1] + d[:, 2] * d[:, 2]
+            t = np.maximum(0.0, np.minimum(1.0, (
+                p[:, 0] * d[:, 0] + p[:, 1] * d[:, 1] + p[:, 2] * d[:, 2]
+            ) / length))
+            closest = np.where(
+                (length != 0)[:, np.newaxis],
+                start + t[:, np.newaxis] * d,
+                start
+            )
+            p = point - closest
+            distances = np.sqrt(
+                p[:, 0] * p[:, 0] + p[:, 1] * p[:, 1] + p[:, 2] * p[:, 2]
+            )
+
+        return crosses | (distances <= TrackAPI.REACHED_THRESHOLD)
+
+    def statistics(self, index: int) -> TrackStatistics:
+        """Get the statistics of a drone.
+
+        Statistics are built from the recorded data, with collisions
+        evaluated, and are equal to those of a single-track SimulationAPI.
+
+        Args:
+            index (int): drone index.
+
+        Returns:
+            TrackStatistics: drone statistics.
+        """
+        index = range(len(self._tracks))[index]
+        steps = int(self._steps[index])
+        data = np.concatenate([
+            data[:steps - first, :, np.searchsorted(ids, index)]
+            for first, ids, data in self._blocks
+            if first < steps
+        ])
+        statistics = TrackStatistics._from_buffer(
+            TrackAPI(self._tracks[index]),
+            self.DT,
+            np.insert(data, 5, 0.0, axis=1)  # Null roll.
+        )
+        statistics.is_completed = bool(self._is_completed[index])
+        statistics.distance_to_end = float(self._distances_to_end[index])
+        statistics.evaluate_collisions()
+
+        return statistics
+
+    @property
+    def scores(self) -> list[tuple[bool, list[Score]]]:
+        """Get the score of each drone.
+
+        Scores of drones whose simulation is not finished are computed from
+        their current statistics.
+
+        Returns:
+            list[tuple[bool, list[Score]]]: track completion flag and list of
+                scores on each weighted area of each drone.
+        """
+        return [
+            SimulationAPI._compute_score(self.statistics(i))
+            for i in range(len(self._tracks))
+        ]
+
+    @staticmethod
+    def _approach(
+        current: np.ndarray,
+        target: np.ndarray,
+        step: float
+    ) -> np.ndarray:
+        """Move values towards targets by a maximum step.
+
+        Args:
+            current (np.ndarray): current values.
+            target (np.ndarray): target values.
+            step (float): maximum step.
+
+        Returns:
+            np.ndarray: updated values.
+        """
+        # Equivalent to `SimulationAPI._approach`, without branches:
+        return np.minimum(np.maximum(target, current - step), current + step)
+
+    @staticmethod
+    def _put(
+        column: np.ndarray,
+        drones: np.ndarray | slice,
+        frozen: np.ndarray | None,
+        values: np.ndarray
+    ) -> None:
+        """Write the new values of a set of drones into a fleet column.
+
+        Args:
+            column (np.ndarray): (N,) fleet column.
+            drones (np.ndarray | slice): drone indices.
+            frozen (np.ndarray | None): indices of finished drones whose
+                values are kept if `drones` is a slice of all of them.
+            values (np.ndarray): new values of the drones. They are modified
+                in place.
+        """
+        if frozen is not None:
+            values[frozen] = column[frozen]
+
+        column[drones] = values
+
+    @staticmethod
+    def _read_only(array: np.ndarray) -> np.ndarray:
+        """Get a read-only view of an array.
+
+        Args:
+            array (np.ndarray): array.
+
+        Returns:
+            np.ndarray: read-only view.
+        """
+        view = array.view()
+        view.flags.writeable = False
+
+        return view
+
+    def __len__(self) -> int:
+        """Get number of drones.
+
+        Returns:
+            int: number of drones.
+        """
+        return len(self._tracks)
+
+    def __repr__(self) -> str:
+        """Get short batched simulation representation.
+
+        Returns:
+            str: short batched simulation representation.
+        """
+        return (
+            f"<BatchSimulationAPI of {len(self)} drones,"
+            + f" {int(self._is_finished.sum())} finished>"
+        )
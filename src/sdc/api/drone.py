@@ -5,6 +5,12 @@ Author:
 """
 
 
+from __future__ import annotations
+
+from typing import Iterator
+
+import numpy as np
+
 from ..core.vector import Rotator3D, Vector3D
 from ..geometry.drone import Drone
 
@@ -85,3 +91,377 @@ class DroneAPI(Drone):
     rotation={self._rotation},
     speed={self._speed}
 )"""
+
+
+class DroneFleet:
+    """Drone fleet class.
+
+    This class stores the kinematic state of many drones in contiguous arrays,
+    so that it can be read and updated for all drones at once. Positions and
+    rotations are stored component-major (Fortran order), so that each
+    component of all drones is contiguous. Indexing the fleet returns a
+    DroneAPI view of a single drone, whose position, rotation and speed read
+    and write through the fleet arrays.
+
+    Attributes:
+        positions (np.ndarray): (N, 3) drone positions.
+        rotations (np.ndarray): (N, 3) drone rotations in radians.
+        speeds (np.ndarray): (N,) drone speeds in m/s.
+        SPEED_RANGE (tuple[int, int]): allowed drone speed range in m/s.
+    """
+
+    SPEED_RANGE = DroneAPI.SPEED_RANGE
+
+    def __init__(
+        self,
+        positions: np.ndarray,
+        rotations: np.ndarray | None = None,
+        speeds: np.ndarray | None = None
+    ) -> None:
+        """Initialize a DroneFleet instance.
+
+        Args:
+            positions (np.ndarray): (N, 3) drone positions.
+            rotations (np.ndarray | None, optional): (N, 3) drone rotations in
+                radians. Defaults to None (null rotations).
+            speeds (np.ndarray | None, optional): (N,) drone speeds in m/s.
+                Defaults to None (stopped drones).
+        """
+        positions = np.array(positions, dtype=np.float64, order="F")
+
+        if positions.ndim != 2 or positions.shape[1] != 3:
+            raise ValueError(
+                "expected (N, 3) positions for"
+                + f" {self.__class__.__name__} but got shape"
+                + f" {positions.shape} instead"
+            )
+
+        self._positions = positions
+        self._rotations = np.zeros_like(positions)
+        self._speeds = np.zeros(len(positions))
+
+        if rotations is not None:
+            self.rotations = rotations
+
+        if speeds is not None:
+            self.speeds = speeds
+
+    @classmethod
+    def from_drones(cls, drones: list[DroneAPI]) -> DroneFleet:
+        """Initialize a fleet from the state of individual drones.
+
+        Args:
+            drones (list[DroneAPI]): drones.
+
+        Returns:
+            DroneFleet: new fleet, holding a copy of the drone states.
+        """
+        return cls(
+            np.array([tuple(drone.position) for drone in drones]).reshape(
+                -1, 3
+            ),
+            np.array([tuple(drone.rotation) for drone in drones]).reshape(
+                -1, 3
+            ),
+            np.array([drone.speed for drone in drones])
+        )
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Get drone positions.
+
+        Returns:
+            np.ndarray: (N, 3) drone positions.
+        """
+        return self._positions
+
+    @positions.setter
+    def positions(self, value: np.ndarray) -> None:
+        """Set drone positions in place.
+
+        Args:
+            value (np.ndarray): (N, 3) drone positions.
+        """
+        self._positions[...] = self._check_shape(
+            "positions", value, self._positions.shape
+        )
+
+    @property
+    def rotations(self) -> np.ndarray:
+        """Get drone rotations.
+
+        Returns:
+            np.ndarray: (N, 3) drone rotations in radians.
+        """
+        return self._rotations
+
+    @rotations.setter
+    def rotations(self, value: np.ndarray) -> None:
+        """Set drone rotations in place.
+
+        Args:
+            value (np.ndarray): (N, 3) drone rotations in radians.
+        """
+        self._rotations[...] = self._check_shape(
+            "rotations", value, self._rotations.shape
+        )
+
+    @property
+    def speeds(self) -> np.ndarray:
+        """Get drone speeds.
+
+        Returns:
+            np.ndarray: (N,) drone speeds in m/s.
+        """
+        return self._speeds
+
+    @speeds.setter
+    def speeds(self, value: np.ndarray) -> None:
+        """Set drone speeds in place, clamped to the allowed speed range.
+
+        Args:
+            value (np.ndarray): (N,) drone speeds in m/s.
+        """
+        np.clip(
+            self._check_shape("speeds", value, self._speeds.shape),
+            *self.SPEED_RANGE,
+            out=self._speeds
+        )
+
+    def _check_shape(
+        self,
+        name: str,
+        value: np.ndarray,
+        shape: tuple[int, ...]
+    ) -> np.ndarray:
+        """Check that an array can be assigned to a fleet array.
+
+        Args:
+            name (str): fleet array name.
+            value (np.ndarray): array to assign.
+            shape (tuple[int, ...]): fleet array shape.
+
+        Raises:
+            ValueError: if the array does not broadcast to the fleet array
+                shape.
+
+        Returns:
+            np.ndarray: array to assign, as float64.
+        """
+        value = np.asarray(value, dtype=np.float64)
+
+        try:
+            valid = np.broadcast_shapes(value.shape, shape) == shape
+        except ValueError:
+            valid = False
+
+        if not valid:
+            raise ValueError(
+                f"expected shape {shape} for"
+                + f" {self.__class__.__name__}.{name} but got shape"
+                + f" {value.shape} instead"
+            )
+
+        return value
+
+    def forwards(self) -> np.ndarray:
+        """Get the unit direction vectors of the drones.
+
+        Directions are computed as in `Rotator3D.forward`, from the X (yaw)
+        and Y (pitch) rotations.
+
+        Returns:
+            np.ndarray: (N, 3) unit direction vectors.
+        """
+        yaw, pitch = self._rotations[:, 0], self._rotations[:, 1]
+        cos_pitch = np.cos(pitch)
+
+        return np.stack((
+            np.cos(yaw) * cos_pitch,
+            np.sin(yaw) * cos_pitch,
+            np.sin(pitch)
+        ), axis=1)
+
+    def __getitem__(self, index: int) -> DroneAPI:
+        """Get a view of a drone of the fleet.
+
+        Args:
+            index (int): drone index.
+
+        Returns:
+            DroneAPI: drone view, reading and writing through the fleet
+                arrays.
+        """
+        if not isinstance(index, (int, np.integer)):
+            raise TypeError(
+                "expected type int for"
+                + f" {self.__class__.__name__} index but got"
+                + f" {type(index).__name__} instead"
+            )
+
+        return _DroneView(self, range(len(self))[index])
+
+    def __iter__(self) -> Iterator[DroneAPI]:
+        """Iterate over views of the drones of the fleet.
+
+        Returns:
+            Iterator[DroneAPI]: drone view iterator.
+        """
+        return (self[i] for i in range(len(self)))
+
+    def __len__(self) -> int:
+        """Get number of drones.
+
+        Returns:
+            int: number of drones.
+        """
+        return len(self._speeds)
+
+    def __repr__(self) -> str:
+        """Get short drone fleet representation.
+
+        Returns:
+            str: short drone fleet representation.
+        """
+        return f"<DroneFleet of {len(self)} drones>"
+
+
+def _row_component(index: int) -> property:
+    """Get a property stored in an element of the `_row` array attribute.
+
+    Args:
+        index (int): element index.
+
+    Returns:
+        property: float property.
+    """
+    def getter(self) -> float:
+        """Get the component from the row.
+
+        Returns:
+            float: component value.
+        """
+        return float(self._row[index])
+
+    def setter(self, value: float) -> None:
+        """Set the component in the row.
+
+        Args:
+            value (float): component value.
+        """
+        self._row[index] = value
+
+    return property(getter, setter)
+
+
+class _RowVector3D(Vector3D):
+    """Vector3D stored in a row of a (N, 3) array."""
+
+    __slots__ = ("_row",)
+
+    _x = _row_component(0)
+    _y = _row_component(1)
+    _z = _row_component(2)
+
+    def __init__(self, row: np.ndarray) -> None:
+        """Initialize a _RowVector3D instance.
+
+        Args:
+            row (np.ndarray): (3,) array view holding the components.
+        """
+        self._row = row
+        self._version = 0
+
+    def copy(self) -> Vector3D:
+        """Get a snapshot of the vector.
+
+        Returns:
+            Vector3D: new instance with the same components.
+        """
+        return Vector3D._from_floats(*self._row.tolist())
+
+
+class _RowRotator3D(Rotator3D):
+    """Rotator3D stored in a row of a (N, 3) array."""
+
+    __slots__ = ("_row",)
+
+    _x = _row_component(0)
+    _y = _row_component(1)
+    _z = _row_component(2)
+
+    def __init__(self, row: np.ndarray) -> None:
+        """Initialize a _RowRotator3D instance.
+
+        Args:
+            row (np.ndarray): (3,) array view holding the rotations in
+                radians.
+        """
+        self._row = row
+        self._version = 0
+        self._matrix_key = self._forward_key = None
+
+    def copy(self) -> Rotator3D:
+        """Get a snapshot of the rotator.
+
+        Returns:
+            Rotator3D: new instance with the same rotations.
+        """
+        return Rotator3D._from_floats(*self._row.tolist())
+
+
+class _DroneView(DroneAPI):
+    """DroneAPI view of a drone of a DroneFleet.
+
+    Assigning a position or rotation copies its components into the fleet
+    arrays, so that the view keeps reading through them.
+    """
+
+    def __init__(self, fleet: DroneFleet, index: int) -> None:
+        """Initialize a _DroneView instance.
+
+        Args:
+            fleet (DroneFleet): drone fleet.
+            index (int): drone index.
+        """
+        self._fleet = fleet
+        self._index = index
+        self._position_row = _RowVector3D(fleet._positions[index])
+        self._rotation_row = _RowRotator3D(fleet._rotations[index])
+        super().__init__(
+            self._position_row,
+            self._rotation_row,
+            float(fleet._speeds[index])
+        )
+
+    @property
+    def _position(self) -> Vector3D:
+        """Get drone position, stored in the fleet arrays."""
+        return self._position_row
+
+    @_position.setter
+    def _position(self, value: Vector3D) -> None:
+        """Set drone position, stored in the fleet arrays."""
+        if value is not self._position_row:
+            self._position_row.set(value._x, value._y, value._z)
+
+    @property
+    def _rotation(self) -> Rotator3D:
+        """Get drone rotation, stored in the fleet arrays."""
+        return self._rotation_row
+
+    @_rotation.setter
+    def _rotation(self, value: Rotator3D) -> None:
+        """Set drone rotation, stored in the fleet arrays."""
+        if value is not self._rotation_row:
+            self._rotation_row.set(value._x, value._y, value._z)
+
+    @property
+    def _speed(self) -> float:
+        """Get drone speed, stored in the fleet arrays."""
+        return float(self._fleet._speeds[self._index])
+
+    @_speed.setter
+    def _speed(self, value: float) -> None:
+        """Set drone speed, stored in the fleet arrays."""
+        self._fleet._speeds[self._index] = value
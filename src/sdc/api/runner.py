@@ -0,0 +1,237 @@
+"""Parallel simulation runner module.
+
+Author:
+    Paulo Sanchez (@erlete)
+"""
+
+
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter as pc
+from typing import Callable, Iterable
+
+from scoretree import Score, ScoreTree
+
+from ..environment.track import Track
+from .simulation import SimulationAPI, print_summary, score_tree
+
+Controller = Callable[[SimulationAPI], None]
+
+
+class SimulationRunner:
+    """Parallel simulation runner class.
+
+    This class simulates each track of a sequence independently, spreading
+    tracks across a process pool. The controller factory is called once per
+    track, and the new controller is called once per timestep with the
+    simulation, before it is updated, and must set the drone target state
+    on it. Controllers can therefore keep state within a track, but never
+    see more than one track. Tracks are sent to workers without their cached
+    data, and workers only send back the score and timing of each track.
+
+    Since SimulationAPI runs each track from a new drone, results are equal
+    to those of a serial SimulationAPI run over the whole sequence with a
+    controller that is reset at the start of every track. Results are kept in
+    track order regardless of the order in which workers finish.
+
+    Attributes:
+        controller_factory (Callable[[], Controller]): callable that returns a
+            new controller. It must be picklable, e.g. a module-level
+            function or class.
+        tracks (list[Track]): track sequence.
+        max_workers (int | None): maximum number of simulation processes.
+        scores (list[tuple[bool, list[Score]]]): score of each track.
+        timings (list[float]): simulation time of each track in seconds.
+        workers (list[int]): process ID of the worker of each track.
+        worker_timings (dict[int, float]): total simulation time of each
+            worker in seconds.
+    """
+
+    def __init__(
+        self,
+        controller_factory: Callable[[], Controller],
+        tracks: Iterable[Track],
+        max_workers: int | None = None
+    ) -> None:
+        """Initialize a SimulationRunner instance.
+
+        Args:
+            controller_factory (Callable[[], Controller]): callable that
+                returns a new controller.
+            tracks (Iterable[Track]): track sequence.
+            max_workers (int | None, optional): maximum number of simulation
+                processes. Defaults to None (number of processors).
+        """
+        if not callable(controller_factory):
+            raise TypeError(
+                "expected a callable for"
+                + f" {self.__class__.__name__}.controller_factory but got"
+                + f" {type(controller_factory).__name__} instead"
+            )
+
+        self._controller_factory = controller_factory
+        self._tracks = list(tracks)
+        self._max_workers = max_workers
+        self._results: list[
+            tuple[tuple[bool, list[Score]], float, int]
+        ] | None = None
+
+        for i, track in enumerate(self._tracks):
+            if not isinstance(track, Track):
+                raise TypeError(
+                    "expected type Track for"
+                    + f" {self.__class__.__name__}.tracks but got"
+                    + f" {type(track).__name__} from item at index {i}"
+                    + " instead"
+                )
+
+        if not self._tracks:
+            raise ValueError(
+                f"{self.__class__.__name__}.tracks cannot be empty"
+            )
+
+    @property
+    def controller_factory(self) -> Callable[[], Controller]:
+        """Get controller factory.
+
+        Returns:
+            Callable[[], Controller]: controller factory.
+        """
+        return self._controller_factory
+
+    @property
+    def tracks(self) -> list[Track]:
+        """Get track sequence.
+
+        Returns:
+            list[Track]: track sequence.
+        """
+        return self._tracks
+
+    @property
+    def max_workers(self) -> int | None:
+        """Get maximum number of simulation processes.
+
+        Returns:
+            int | None: maximum number of simulation processes.
+        """
+        return self._max_workers
+
+    def run(self) -> None:
+        """Simulate every track of the sequence.
+
+        Tracks are simulated in a process pool unless there is a single track
+        or a single worker, in which case they are simulated in the current
+        process.
+        """
+        run_track = functools.partial(_run_track, self._controller_factory)
+
+        if len(self._tracks) > 1 and self._max_workers != 1:
+            with ProcessPoolExecutor(self._max_workers) as executor:
+                self._results = list(executor.map(run_track, self._tracks))
+        else:
+            self._results = [run_track(track) for track in self._tracks]
+
+    @property
+    def scores(self) -> list[tuple[bool, list[Score]]]:
+        """Get the score of each track, simulating tracks if needed.
+
+        Returns:
+            list[tuple[bool, list[Score]]]: track completion flag and list of
+                scores on each weighted area of each track.
+        """
+        return [score for score, _, _ in self._get_results()]
+
+    @property
+    def timings(self) -> list[float]:
+        """Get the simulation time of each track, simulating tracks if needed.
+
+        Returns:
+            list[float]: simulation time of each track in seconds.
+        """
+        return [elapsed for _, elapsed, _ in self._get_results()]
+
+    @property
+    def workers(self) -> list[int]:
+        """Get the worker of each track, simulating tracks if needed.
+
+        Returns:
+            list[int]: process ID of the worker of each track.
+        """
+        return [worker for _, _, worker in self._get_results()]
+
+    @property
+    def worker_timings(self) -> dict[int, float]:
+        """Get the total simulation time of each worker.
+
+        Returns:
+            dict[int, float]: total simulation time of each worker in
+                seconds, by process ID.
+        """
+        timings: dict[int, float] = {}
+
+        for _, elapsed, worker in self._get_results():
+            timings[worker] = timings.get(worker, 0.0) + elapsed
+
+        return timings
+
+    def score_tree(self) -> ScoreTree:
+        """Get the simulation score tree, simulating tracks if needed.
+
+        Returns:
+            ScoreTree: simulation score tree.
+        """
+        return score_tree(self.scores)
+
+    def summary(self) -> None:
+        """Print a summary of the simulation, simulating tracks if needed."""
+        print_summary(self.scores)
+
+    def _get_results(
+        self
+    ) -> list[tuple[tuple[bool, list[Score]], float, int]]:
+        """Get the result of each track, simulating tracks if needed.
+
+        Returns:
+            list[tuple[tuple[bool, list[Score]], float, int]]: score,
+                simulation time and worker process ID of each track.
+        """
+        if self._results is None:
+            self.run()
+
+        return self._results  # type: ignore
+
+    def __repr__(self) -> str:
+        """Get short simulation runner representation.
+
+        Returns:
+            str: short simulation runner representation.
+        """
+        return f"<SimulationRunner of {len(self._tracks)} tracks>"
+
+
+def _run_track(
+    controller_factory: Callable[[], Controller],
+    track: Track
+) -> tuple[tuple[bool, list[Score]], float, int]:
+    """Simulate a single track.
+
+    Args:
+        controller_factory (Callable[[], Controller]): callable that returns
+            a new controller.
+        track (Track): track.
+
+    Returns:
+        tuple[tuple[bool, list[Score]], float, int]: track score, simulation
+            time in seconds and worker process ID.
+    """
+    start = pc()
+    sim = SimulationAPI([track])
+    controller = controller_factory()
+
+    while not sim.is_simulation_finished:
+        controller(sim)
+        sim.update(plot=False)
+
+    return sim.scores[0], pc() - start, os.getpid()
@@ -11,6 +11,7 @@ Author:
 import json
 import os
 from time import perf_counter as pc
+from typing import Iterable, Iterator
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -18,7 +19,7 @@ from colorama import Fore, Style
 from scoretree import Score, ScoreArea, ScoreTree
 
 from ..core.gradient import ColorGradient
-from ..core.vector import Rotator3D, Vector3D, distance3D
+from ..core.vector import Rotator3D, Vector3D, distance3D, path_length
 from ..environment.track import Track
 from .drone import DroneAPI
 from .statistics import TrackStatistics
@@ -33,8 +34,12 @@ class SimulationAPI:
     with several methods that allow the user to get information about the
     simulation's state and control it.
 
+    Tracks are consumed lazily from any iterable, one at a time, and only the
+    scores of completed tracks are kept, so that memory usage is bounded by
+    the current track.
+
     Attributes:
-        tracks (list[TrackAPI]): track list.
+        tracks (Iterator[Track]): remaining tracks.
         drone (DroneAPI): drone element.
         next_waypoint (Vector3D | None): next waypoint data.
         remaining_waypoints (int): remaining waypoints in the track.
@@ -51,64 +56,82 @@ class SimulationAPI:
     SUMMARY_FILE_PREFIX = "summary_"
     SUMMARY_DIR = "statistics"
 
-    def __init__(self, tracks: list[Track]) -> None:
+    def __init__(self, tracks: Iterable[Track]) -> None:
         """Initialize a SimulationAPI instance.
 
         Args:
-            tracks (list[Track]): track list.
+            tracks (Iterable[Track]): track sequence. It is consumed lazily.
         """
-        self._completed_statistics: list[TrackStatistics] = []
-        self._statistics = [
-            TrackStatistics(TrackAPI(track), self.DT)
-            for track in tracks
-        ]
-        self.tracks = [TrackAPI(track) for track in tracks]  # Conversion.
+        self._completed_scores: list[tuple[bool, list[Score]]] = []
+        self.tracks = tracks
 
     @property
-    def tracks(self) -> list[TrackAPI]:
-        """Get track list.
+    def tracks(self) -> Iterator[Track]:
+        """Get remaining tracks.
 
         Returns:
-            list[TrackAPI]: track list.
+            Iterator[Track]: remaining tracks, excluding the current one.
         """
         return self._tracks
 
     @tracks.setter
-    def tracks(self, value: list[TrackAPI]) -> None:
-        """Set track list.
+    def tracks(self, value: Iterable[Track]) -> None:
+        """Set track sequence.
 
         Args:
-            value (list[TrackAPI]): track list.
+            value (Iterable[Track]): track sequence.
         """
-        if not isinstance(value, list):
+        try:
+            self._tracks = iter(value)
+        except TypeError:
             raise TypeError(
-                "expected type list[Track] for"
+                "expected type Iterable[Track] for"
                 + f" {self.__class__.__name__}.tracks but got"
                 + f" {type(value).__name__} instead"
-            )
+            ) from None
+
+        # Internal attributes reset:
+        self._track_index = -1
+        self._is_simulation_finished = False
+        self._target_rotation = Rotator3D()
+        self._target_speed = 0.0
 
-        if not value:
+        if not self._next_track():
             raise ValueError(
                 f"{self.__class__.__name__}.tracks cannot be empty"
             )
 
-        for i, track in enumerate(value):
-            if not isinstance(track, TrackAPI):
-                raise TypeError(
-                    "expected type Track for"
-                    + f" {self.__class__.__name__}.tracks but got"
-                    + f" {type(track).__name__} from item at index {i} instead"
-                )
+    def _next_track(self) -> bool:
+        """Load the next track of the sequence as the current one.
 
-        self._tracks = value
+        Returns:
+            bool: True if a track was loaded, False if there are no tracks
+                left.
+        """
+        track = next(self._tracks, None)
 
-        # Internal attributes reset:
-        self._is_simulation_finished = False
-        self._current_track = self._tracks.pop(0)
-        self._current_statistics = self._statistics.pop(0)
+        if track is None:
+            return False
+
+        self._track_index += 1
+
+        if not isinstance(track, Track):
+            raise TypeError(
+                "expected type Track for"
+                + f" {self.__class__.__name__}.tracks but got"
+                + f" {type(track).__name__} from item at index"
+                + f" {self._track_index} instead"
+            )
+
+        self._current_track = TrackAPI(track)
+        self._current_statistics = TrackStatistics(TrackAPI(track), self.DT)
         self._current_timer = 0.0
-        self._target_rotation = Rotator3D()
-        self._target_speed = 0.0
+
+        # The timeout is fixed when the track starts, as in batch simulations,
+        # so that the track version is not checked on every update:
+        self._current_timeout = self._current_track.timeout
+
+        return True
 
     @property
     def drone(self) -> DroneAPI:
@@ -180,11 +203,7 @@ class SimulationAPI:
                 + f" but got {type(speed).__name__} instead"
             )
 
-        self._target_rotation = Rotator3D(
-            np.rad2deg(yaw),
-            np.rad2deg(pitch),
-            0
-        )
+        self._target_rotation.set(float(yaw), float(pitch), 0.0)
         self._target_speed = speed
 
     def update(
@@ -206,7 +225,7 @@ class SimulationAPI:
         self._current_timer += self.DT
 
         # Simulation endpoint conditions' definition for later use:
-        c1 = self._current_timer >= self._current_track.timeout
+        c1 = self._current_timer >= self._current_timeout
         c2 = self._current_track.is_track_finished
         c3 = self._current_track.is_drone_stopped
 
@@ -221,59 +240,75 @@ class SimulationAPI:
         # On each of the simulation finish conditions:
         if c1 or (c2 and c3):
 
+            # Ring collision evaluation for the whole trajectory:
+            self._current_statistics.evaluate_collisions()
+
             # Plot current track statistics:
             if plot:
                 self.plot(dark_mode, fullscreen)
 
-            # Save current statistics:
-            self._completed_statistics.append(self._current_statistics)
+            # Save current score (statistics are released with the track):
+            self._completed_scores.append(
+                self._compute_score(self._current_statistics)
+            )
 
             # Get next track and reset time counter:
-            if self._tracks:
-                self._current_track = self._tracks.pop(0)
-                self._current_statistics = self._statistics.pop(0)
-                self._current_timer = 0.0
-            else:
+            if not self._next_track():
                 self._is_simulation_finished = True
 
             return
 
-        # Rotation update:
-        self._current_track.drone.rotation = Rotator3D(
-            *[
-                np.rad2deg(
-                    min(curr_rot + self.DR * self.DT, tg_rot)
-                    if curr_rot < tg_rot else
-                    max(curr_rot - self.DR * self.DT, tg_rot)
-                ) for curr_rot, tg_rot in zip(
-                    self._current_track.drone.rotation,
-                    self._target_rotation
-                )
-            ]
+        # Rotation update (in place):
+        drone = self._current_track.drone
+        rotation, target = drone.rotation, self._target_rotation
+        rotation.set(
+            self._approach(rotation.x, target.x, self.DR * self.DT),
+            self._approach(rotation.y, target.y, self.DR * self.DT),
+            self._approach(rotation.z, target.z, self.DR * self.DT)
         )
 
         # Speed update:
-        speed = self._current_track.drone.speed
-        self._current_track.drone.speed = (
-            min(speed + self.DV * self.DT, self._target_speed)
-            if self._target_speed >= speed else
-            max(speed - self.DV * self.DT, self._target_speed)
+        speed = drone.speed
+        drone.speed = self._approach(
+            speed,
+            self._target_speed,
+            self.DV * self.DT
         )
 
-        # Position update:
-        rot = self._current_track.drone.rotation
-        self._current_track.drone.position += (
-            Vector3D(
-                speed * self.DT * np.cos(rot.x) * np.cos(rot.y),
-                speed * self.DT * np.sin(rot.x) * np.cos(rot.y),
-                speed * self.DT * np.sin(rot.y)
-            )
+        # Position update (in place):
+        position, forward = drone.position, rotation.forward
+        distance = speed * self.DT
+        position.set(
+            position.x + forward.x * distance,
+            position.y + forward.y * distance,
+            position.z + forward.z * distance
         )
 
         self._current_statistics.add_data(
-            position=self._current_track.drone.position,
-            rotation=self._current_track.drone.rotation,
-            speed=self._current_track.drone.speed
+            position=position,
+            rotation=rotation,
+            speed=drone.speed
+        )
+
+        # Swept waypoint evaluation along the segment travelled this tick:
+        self._current_track._eval_reached_waypoint()
+
+    @staticmethod
+    def _approach(current: float, target: float, step: float) -> float:
+        """Move a value towards a target by a maximum step.
+
+        Args:
+            current (float): current value.
+            target (float): target value.
+            step (float): maximum step.
+
+        Returns:
+            float: updated value.
+        """
+        return (
+            min(current + step, target)
+            if current < target else
+            max(current - step, target)
         )
 
     def plot(self, dark_mode: bool, fullscreen: bool) -> None:
@@ -286,16 +321,8 @@ class SimulationAPI:
         # Variable definition for later use:
         times = np.arange(0, self._current_track.timeout, self.DT)
         speeds = self._current_statistics.speeds
-        rotations = [
-            [rot.x for rot in self._current_statistics.rotations],
-            [rot.y for rot in self._current_statistics.rotations],
-            [rot.z for rot in self._current_statistics.rotations]
-        ]
-        positions = [
-            [pos.x for pos in self._current_statistics.positions],
-            [pos.y for pos in self._current_statistics.positions],
-            [pos.z for pos in self._current_statistics.positions]
-        ]
+        rotations = self._current_statistics.rotation_array.array.T
+        positions = self._current_statistics.position_array.array.T
         gradient = ColorGradient("#dc143c", "#15b01a", len(positions[0]))
 
         # Figure and axes setup:
@@ -338,8 +365,13 @@ class SimulationAPI:
         # 3D ax configuration:
         self._current_track._track.plot(ax1)
 
-        for x, y, z, c in zip(*positions, gradient.steps):
-            ax1.plot(x, y, z, "D", color=ColorGradient.rgb_to_hex(c), ms=2)
+        ax1.scatter(
+            *positions,
+            c=gradient.steps_array[:len(positions[0])] / 255,
+            marker="D",
+            s=4,
+            depthshade=False
+        )
 
         ax1.plot(*positions, "k--", alpha=.75, lw=.75)
 
@@ -355,8 +387,9 @@ class SimulationAPI:
         )
         plt.show()
 
+    @classmethod
     def _compute_score(
-        self,
+        cls,
         statistics: TrackStatistics
     ) -> tuple[bool, list[Score]]:
         """Compute track simulation score from statistics.
@@ -369,31 +402,24 @@ class SimulationAPI:
                 list of scores on each weighted area.
         """
         # Variable definition for later use:
-        waypoints = statistics.track.track.waypoints  # Track waypoints.
-        positions = statistics.positions  # Drone positions during simulation.
-        max_sp = self.drone.SPEED_RANGE[1]  # Max drone speeed.
+        positions = statistics.position_array  # Drone positions.
+        max_sp = DroneAPI.SPEED_RANGE[1]  # Max drone speeed.
 
         # Track Distance (TD):
-        min_td = sum([
-            distance3D(waypoints[i], waypoints[i+1])
-            for i in range(len(waypoints) - 1)
-        ])
+        min_td = statistics.track.track.path_length
         max_td = 2 * min_td
-        td = sum([
-            distance3D(positions[i], positions[i+1])
-            for i in range(len(positions) - 1)
-        ])
+        td = path_length(positions)
 
         # Distance To End (DTE):
-        max_tte = max_sp / self.DV  # Max time to end.
+        max_tte = max_sp / cls.DV  # Max time to end.
         min_dte = 0
-        max_dte = max_sp * max_tte - .5 * self.DV * max_tte ** 2
+        max_dte = max_sp * max_tte - .5 * cls.DV * max_tte ** 2
         dte = statistics.distance_to_end
 
         # Track Time (TT):
         min_tt = max_td / max_sp + min_dte
-        max_tt = (max_td / self.DV + max_tte) * 2
-        tt = len(statistics.positions) * self.DT
+        max_tt = (max_td / cls.DV + max_tte) * 2
+        tt = len(positions) * cls.DT
 
         # Pondered score:
         return (
@@ -424,34 +450,65 @@ class SimulationAPI:
             ]
         )
 
+    @property
+    def scores(self) -> list[tuple[bool, list[Score]]]:
+        """Get the scores of the completed tracks.
+
+        Returns:
+            list[tuple[bool, list[Score]]]: track completion flag and list of
+                scores on each weighted area of each completed track.
+        """
+        return list(self._completed_scores)
+
     def summary(self) -> None:
         """Print a summary of the simulation."""
-        # Track weight computation:
-        weight_range = range(1, len(self._completed_statistics) + 1)
-        track_weights = [
-            i / sum(weight_range)
-            for i in weight_range
-        ]
-
-        # Score tree generation:
-        st = ScoreTree([ScoreArea("Simulation", 1, [
-            Score(f"Track {i + 1} (DNF)", 1, (0, 1), 0)
-            if not score[0] else
-            ScoreArea(f"Track {i + 1}", weight, score[1])
-            for (i, weight), score in zip(
-                enumerate(track_weights), [
-                    self._compute_score(stat)
-                    for stat in self._completed_statistics
-                ]
-            )
-        ])], colorized=True)
-
-        print(
-            Fore.BLUE + Style.BRIGHT
-            + " Simulation statistics ".center(80, "=")
-            + Style.RESET_ALL + "\n"
-            + str(st)
-            + Fore.BLUE + Style.BRIGHT + "\n"
-            + f" Total score: {st.score * 100:.2f}% ".center(80, "=")
-            + Style.RESET_ALL
-        )
+        print_summary(self._completed_scores)
+
+
+def score_tree(scores: list[tuple[bool, list[Score]]]) -> ScoreTree:
+    """Build the simulation score tree from the scores of each track.
+
+    Later tracks have higher weights, and tracks that were not completed are
+    scored as zero.
+
+    Args:
+        scores (list[tuple[bool, list[Score]]]): track completion flag and
+            list of scores on each weighted area of each track.
+
+    Returns:
+        ScoreTree: simulation score tree.
+    """
+    # Track weight computation:
+    weight_range = range(1, len(scores) + 1)
+    track_weights = [
+        i / sum(weight_range)
+        for i in weight_range
+    ]
+
+    # Score tree generation:
+    return ScoreTree([ScoreArea("Simulation", 1, [
+        Score(f"Track {i + 1} (DNF)", 1, (0, 1), 0)
+        if not score[0] else
+        ScoreArea(f"Track {i + 1}", weight, score[1])
+        for (i, weight), score in zip(enumerate(track_weights), scores)
+    ])], colorized=True)
+
+
+def print_summary(scores: list[tuple[bool, list[Score]]]) -> None:
+    """Print a summary of a simulation from the scores of each track.
+
+    Args:
+        scores (list[tuple[bool, list[Score]]]): track completion flag and
+            list of scores on each weighted area of each track.
+    """
+    st = score_tree(scores)
+
+    print(
+        Fore.BLUE + Style.BRIGHT
+        + " Simulation statistics ".center(80, "=")
+        + Style.RESET_ALL + "\n"
+        + str(st)
+        + Fore.BLUE + Style.BRIGHT + "\n"
+        + f" Total score: {st.score * 100:.2f}% ".center(80, "=")
+        + Style.RESET_ALL
+    )
@@ -5,11 +5,40 @@ Author:
 """
 
 
+from __future__ import annotations
+
+import numpy as np
+
 from ..api.track import TrackAPI
-from ..core.vector import Rotator3D, Vector3D
+from ..core.vector import Rotator3D, Vector3D, Vector3DArray
 
 
 class TrackStatistics:
+    """Track statistics class.
+
+    This class records the drone state at each timestep of a track. Values are
+    copied into a preallocated (N, 7) buffer (position, rotation and speed),
+    so recorded data is a snapshot that does not change if the drone state is
+    later mutated in place.
+
+    Attributes:
+        track (TrackAPI): statistics track.
+        timestep (int | float): statistics timestep.
+        waypoints (list[Vector3D]): track waypoints.
+        is_completed (bool): track completion status.
+        distance_to_end (float): drone distance to track end.
+        collision_step (int | None): first timestep at which the drone is
+            inside a ring tube.
+        collision_ring (int | None): index of the ring the drone collides
+            with at `collision_step`.
+        min_clearance (float): minimum distance between the drone and any
+            ring tube.
+        data (list[tuple[Vector3D, Rotator3D, float]]): drone data at each
+            timestep.
+        INITIAL_CAPACITY (int): initial number of timesteps of the buffer.
+    """
+
+    INITIAL_CAPACITY = 1024
 
     def __init__(
         self,
@@ -29,7 +58,36 @@ class TrackStatistics:
         # Automatically generated attributes:
         self._is_completed = False
         self._distance_to_end = 0.0
-        self._data = [(track.track.start, Rotator3D(), 0.0)]  # Initial data.
+        self._collision_step: int | None = None
+        self._collision_ring: int | None = None
+        self._min_clearance = float("inf")
+        self._size = 0
+        self._buffer = np.empty((self.INITIAL_CAPACITY, 7))
+        self.add_data(track.track.start, Rotator3D(), 0.0)  # Initial data.
+
+    @classmethod
+    def _from_buffer(
+        cls,
+        track: TrackAPI,
+        timestep: int | float,
+        buffer: np.ndarray
+    ) -> TrackStatistics:
+        """Initialize an instance from trusted recorded data.
+
+        Args:
+            track (TrackAPI): statistics track.
+            timestep (int | float): statistics timestep.
+            buffer (np.ndarray): (N, 7) drone position, rotation and speed
+                at each timestep, starting with the initial data.
+
+        Returns:
+            TrackStatistics: new instance.
+        """
+        statistics = cls(track, timestep)
+        statistics._buffer = np.array(buffer, dtype=np.float64)
+        statistics._size = len(statistics._buffer)
+
+        return statistics
 
     @property
     def track(self) -> TrackAPI:
@@ -141,14 +199,56 @@ class TrackStatistics:
         self._distance_to_end = float(value)
 
     @property
-    def data(self) -> list[tuple[Vector3D, Rotator3D, int | float]]:
+    def collision_step(self) -> int | None:
+        """Get first timestep at which the drone is inside a ring tube.
+
+        Returns:
+            int | None: first colliding timestep or None if there are no
+                collisions.
+        """
+        return self._collision_step
+
+    @property
+    def collision_ring(self) -> int | None:
+        """Get index of the ring the drone collides with first.
+
+        Returns:
+            int | None: colliding ring index or None if there are no
+                collisions.
+        """
+        return self._collision_ring
+
+    @property
+    def min_clearance(self) -> float:
+        """Get minimum distance between the drone and any ring tube.
+
+        Returns:
+            float: minimum clearance (negative if the drone collided).
+        """
+        return self._min_clearance
+
+    def evaluate_collisions(self) -> None:
+        """Evaluate collisions of the recorded trajectory with the rings.
+
+        The whole trajectory is checked against all rings of the track in a
+        single vectorized pass, and the results are stored in the
+        `collision_step`, `collision_ring` and `min_clearance` attributes.
+        """
+        (
+            self._collision_step,
+            self._collision_ring,
+            self._min_clearance
+        ) = self._track.track.detect_collisions(self.position_array)
+
+    @property
+    def data(self) -> list[tuple[Vector3D, Rotator3D, float]]:
         """Get drone position, rotation and speed data at each timestep.
 
         Returns:
-            list[tuple[Vector3D, Rotator3D, int | float]]: position,
-                rotation and speed of the drone at each timestep.
+            list[tuple[Vector3D, Rotator3D, float]]: position, rotation and
+                speed of the drone at each timestep.
         """
-        return self._data
+        return list(zip(self.positions, self.rotations, self.speeds))
 
     @property
     def positions(self) -> list[Vector3D]:
@@ -157,7 +257,7 @@ class TrackStatistics:
         Returns:
             list[Vector3D]: drone positions at each timestep.
         """
-        return [data[0] for data in self._data]
+        return self.position_array.to_vectors()
 
     @property
     def rotations(self) -> list[Rotator3D]:
@@ -166,16 +266,37 @@ class TrackStatistics:
         Returns:
             list[Rotator3D]: drone rotations at each timestep.
         """
-        return [data[1] for data in self._data]
+        return [
+            Rotator3D._from_floats(*row)
+            for row in self._buffer[:self._size, 3:6].tolist()
+        ]
 
     @property
-    def speeds(self) -> list[int | float]:
+    def position_array(self) -> Vector3DArray:
+        """Get drone positions at each timestep as a vector array.
+
+        Returns:
+            Vector3DArray: drone positions at each timestep.
+        """
+        return Vector3DArray(self._buffer[:self._size, 0:3])
+
+    @property
+    def rotation_array(self) -> Vector3DArray:
+        """Get drone rotations at each timestep as a vector array.
+
+        Returns:
+            Vector3DArray: drone rotations (radians) at each timestep.
+        """
+        return Vector3DArray(self._buffer[:self._size, 3:6])
+
+    @property
+    def speeds(self) -> list[float]:
         """Get drone speeds at each timestep.
 
         Returns:
-            list[int | float]: drone speeds at each timestep.
+            list[float]: drone speeds at each timestep.
         """
-        return [data[2] for data in self._data]
+        return self._buffer[:self._size, 6].tolist()
 
     def add_data(
         self,
@@ -185,6 +306,9 @@ class TrackStatistics:
     ) -> None:
         """Add drone position, rotation and speed data.
 
+        Values are copied into the statistics buffer, so later changes to the
+        given objects are not reflected in the recorded data.
+
         Args:
             position (Vector3D): drone position.
             rotation (Rotator3D): drone rotation.
@@ -211,4 +335,22 @@ class TrackStatistics:
                 + f" {type(speed).__name__} instead"
             )
 
-        self._data.append((position, rotation, speed))
+        # Buffer growth (amortized):
+        if self._size == len(self._buffer):
+            self._buffer = np.concatenate(
+                (self._buffer, np.empty_like(self._buffer))
+            )
+
+        row = self._buffer[self._size]
+        row[0], row[1], row[2] = position.x, position.y, position.z
+        row[3], row[4], row[5] = rotation.x, rotation.y, rotation.z
+        row[6] = speed
+        self._size += 1
+
+    def __len__(self) -> int:
+        """Get the number of recorded timesteps.
+
+        Returns:
+            int: number of recorded timesteps.
+        """
+        return self._size
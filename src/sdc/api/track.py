@@ -5,8 +5,11 @@ Author:
 """
 
 
-from ..core.vector import Rotator3D, Vector3D, distance3D
+import math
+
+from ..core.vector import Rotator3D, Vector3D
 from ..environment.track import Track
+from ..geometry.ring import Ring
 from .drone import DroneAPI
 
 
@@ -43,7 +46,7 @@ class TrackAPI:
         self.track = track
 
         # Internal attributes:
-        self._drone = DroneAPI(track.start, Rotator3D())
+        self._drone = DroneAPI(track.start.copy(), Rotator3D())
 
     @property
     def track(self) -> Track:
@@ -71,6 +74,9 @@ class TrackAPI:
         # Internal attributes reset:
         self._waypoints = [*[ring.position for ring in value.rings], value.end]
         self._next_waypoint: Vector3D | None = self._waypoints.pop(0)
+        self._rings: list[Ring | None] = [*value.rings, None]
+        self._next_ring: Ring | None = self._rings.pop(0)
+        self._last_position = value.start.copy()
         self._is_track_finished = self._is_drone_stopped = False
 
         self._track = value
@@ -142,10 +148,7 @@ class TrackAPI:
         Returns:
             float: track timeout.
         """
-        return sum(
-            distance3D(*self._track.waypoints[i - 1: i + 1])
-            for i in range(1, len(self._track.waypoints))
-        ) * 2 / self.MIN_TIMEOUT_SPEED
+        return self._track.path_length * 2 / self.MIN_TIMEOUT_SPEED
 
     def _eval_reached_waypoint(self) -> None:
         """Evaluate whether the drone has reached the next waypoint.
@@ -153,19 +156,66 @@ class TrackAPI:
         This method is responsible for updating the next waypoint data if the
         drone has reached the current one. It also updates the finished track
         flag if the end of the last waypoint has been reached.
+
+        The evaluation is swept along the segment travelled by the drone since
+        the previous evaluation, so that waypoints are not missed when the
+        drone moves further than the reached threshold between two
+        evaluations. A ring waypoint is also reached if the segment goes
+        through its hole.
         """
-        # Prevent evaluation if the track is finished:
-        if self._is_track_finished:
-            return
+        position = self._drone.position
 
-        distance = distance3D(
-            self._drone.position,
-            self._next_waypoint  # type: ignore
-        )
+        while not self._is_track_finished:
+            reached = (
+                self._next_ring is not None
+                and self._next_ring.crosses(self._last_position, position)
+            ) or self._segment_distance(
+                self._last_position,
+                position,
+                self._next_waypoint  # type: ignore
+            ) <= self.REACHED_THRESHOLD
+
+            if not reached:
+                break
 
-        if distance <= self.REACHED_THRESHOLD:
             if self._waypoints:  # If there are any waypoints left:
                 self._next_waypoint = self._waypoints.pop(0)
+                self._next_ring = self._rings.pop(0)
             else:
-                self._next_waypoint = None
+                self._next_waypoint = self._next_ring = None
                 self._is_track_finished = True
+
+        self._last_position.set(position.x, position.y, position.z)
+
+    @staticmethod
+    def _segment_distance(
+        start: Vector3D,
+        end: Vector3D,
+        point: Vector3D
+    ) -> float:
+        """Get the distance between a point and a segment.
+
+        Args:
+            start (Vector3D): segment start.
+            end (Vector3D): segment end.
+            point (Vector3D): point.
+
+        Returns:
+            float: distance between the point and the closest point of the
+                segment.
+        """
+        sx, sy, sz = start.x, start.y, start.z
+        dx, dy, dz = end.x - sx, end.y - sy, end.z - sz
+        length = dx * dx + dy * dy + dz * dz
+
+        if length:
+            t = max(0.0, min(1.0, (
+                (point.x - sx) * dx
+                + (point.y - sy) * dy
+                + (point.z - sz) * dz
+            ) / length))
+            sx, sy, sz = sx + t * dx, sy + t * dy, sz + t * dz
+
+        px, py, pz = point.x - sx, point.y - sy, point.z - sz
+
+        return math.sqrt(px * px + py * py + pz * pz)
@@ -5,6 +5,11 @@ Author:
 """
 
 
+import functools
+
+import numpy as np
+
+
 class ColorGradient:
     """Color gradient representation class.
 
@@ -16,6 +21,8 @@ class ColorGradient:
         final_color (str): gradient final color.
         step_count (int): gradient step count.
         steps (list[list[int]]): gradient steps.
+        steps_array (np.ndarray): gradient steps as an (N, 3) RGB array.
+        hex_steps (tuple[str, ...]): gradient steps as hex color strings.
     """
 
     def __init__(
@@ -129,10 +136,39 @@ class ColorGradient:
         Returns:
             list[list[int]]: gradient steps.
         """
-        return self._compute_steps() if self._step_count > 2 else [
-            self.hex_to_rgb(self._initial_color),
-            self.hex_to_rgb(self._final_color)
-        ]
+        return self.steps_array.tolist()
+
+    @property
+    def steps_array(self) -> np.ndarray:
+        """Get gradient steps as an RGB array.
+
+        Steps are memoized and shared between gradients with the same colors
+        and step count, so the returned array is read-only.
+
+        Returns:
+            np.ndarray: (N, 3) gradient steps.
+        """
+        return _compute_steps(
+            self._initial_color,
+            self._final_color,
+            self._step_count
+        )
+
+    @property
+    def hex_steps(self) -> tuple[str, ...]:
+        """Get gradient steps as hex color strings.
+
+        Steps are memoized and shared between gradients with the same colors
+        and step count.
+
+        Returns:
+            tuple[str, ...]: gradient steps.
+        """
+        return _compute_hex_steps(
+            self._initial_color,
+            self._final_color,
+            self._step_count
+        )
 
     @staticmethod
     def is_valid_hex(hex_str: str) -> bool:
@@ -175,20 +211,61 @@ class ColorGradient:
         """
         return [int(hex_str[i:i + 2], 16) for i in range(1, 6, 2)]
 
-    def _compute_steps(self) -> list[list[int]]:
-        """Compute gradient steps.
 
-        Returns:
-            list[list[int]]: gradient steps.
-        """
-        initial_rgb = self.hex_to_rgb(self.initial_color)
-        final_rgb = self.hex_to_rgb(self.final_color)
-
-        return [
-            [
-                int(
-                    initial_rgb[i] + (final_rgb[i] - initial_rgb[i])
-                    * step / self._step_count
-                ) for i in range(3)
-            ] for step in range(self._step_count)
-        ]
+@functools.lru_cache(maxsize=32)
+def _compute_steps(
+    initial_color: str,
+    final_color: str,
+    step_count: int
+) -> np.ndarray:
+    """Compute gradient steps.
+
+    Args:
+        initial_color (str): gradient initial color.
+        final_color (str): gradient final color.
+        step_count (int): gradient step count.
+
+    Returns:
+        np.ndarray: (N, 3) read-only gradient steps.
+    """
+    initial_rgb = np.array(ColorGradient.hex_to_rgb(initial_color))
+    final_rgb = np.array(ColorGradient.hex_to_rgb(final_color))
+
+    if step_count > 2:
+        steps = np.linspace(0, step_count, step_count, endpoint=False)
+        rgb = (
+            initial_rgb + (final_rgb - initial_rgb) * steps[:, np.newaxis]
+            / step_count
+        ).astype(int)
+    else:
+        rgb = np.array((initial_rgb, final_rgb))
+
+    rgb.setflags(write=False)
+
+    return rgb
+
+
+@functools.lru_cache(maxsize=32)
+def _compute_hex_steps(
+    initial_color: str,
+    final_color: str,
+    step_count: int
+) -> tuple[str, ...]:
+    """Compute gradient steps as hex color strings.
+
+    Args:
+        initial_color (str): gradient initial color.
+        final_color (str): gradient final color.
+        step_count (int): gradient step count.
+
+    Returns:
+        tuple[str, ...]: gradient steps.
+    """
+    return tuple(
+        ColorGradient.rgb_to_hex(rgb)
+        for rgb in _compute_steps(
+            initial_color,
+            final_color,
+            step_count
+        ).tolist()
+    )
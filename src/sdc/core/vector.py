@@ -10,10 +10,28 @@ Author:
 
 from __future__ import annotations
 
+import functools
+import itertools
 import math
+from typing import Any, Iterable, Iterator
 
 import numpy as np
 
+_VERSIONS = itertools.count(1)
+
+
+def next_version() -> int:
+    """Get a new modification version.
+
+    Versions are shared by all mutable geometry objects and each call returns
+    a value greater than all previous ones, so the maximum version of a group
+    of objects increases whenever any of them is modified.
+
+    Returns:
+        int: new modification version.
+    """
+    return next(_VERSIONS)
+
 
 class Vector3D:
     """3D vector representation class.
@@ -25,8 +43,11 @@ class Vector3D:
         x (float): X component of the vector.
         y (float): Y component of the vector.
         z (float): Z component of the vector.
+        version (int): modification version of the vector.
     """
 
+    __slots__ = ("_x", "_y", "_z", "_version")
+
     def __init__(
         self,
         x: int | float = 0,
@@ -44,6 +65,30 @@ class Vector3D:
         self.y = y
         self.z = z
 
+    @classmethod
+    def _from_floats(cls, x: float, y: float, z: float) -> Vector3D:
+        """Initialize an instance from trusted float components.
+
+        This constructor skips the validation and coercion performed by the
+        property setters, so it must only be used with values that are already
+        known to be floats.
+
+        Args:
+            x (float): X component of the vector.
+            y (float): Y component of the vector.
+            z (float): Z component of the vector.
+
+        Returns:
+            Vector3D: new instance.
+        """
+        vector = object.__new__(cls)
+        vector._x = x
+        vector._y = y
+        vector._z = z
+        vector._version = 0
+
+        return vector
+
     @property
     def x(self) -> float:
         """Get X component of the vector.
@@ -68,6 +113,7 @@ class Vector3D:
             )
 
         self._x = float(value)
+        self._version = next(_VERSIONS)
 
     @property
     def y(self) -> float:
@@ -93,6 +139,7 @@ class Vector3D:
             )
 
         self._y = float(value)
+        self._version = next(_VERSIONS)
 
     @property
     def z(self) -> float:
@@ -118,6 +165,49 @@ class Vector3D:
             )
 
         self._z = float(value)
+        self._version = next(_VERSIONS)
+
+    def set(self, x: float, y: float, z: float) -> Vector3D:
+        """Set all components of the vector in place.
+
+        This is a fast mutator that skips the validation and coercion
+        performed by the property setters, so it must only be used with values
+        that are already known to be floats.
+
+        Args:
+            x (float): X component of the vector.
+            y (float): Y component of the vector.
+            z (float): Z component of the vector.
+
+        Returns:
+            Vector3D: the vector itself.
+        """
+        self._x = x
+        self._y = y
+        self._z = z
+        self._version = next(_VERSIONS)
+
+        return self
+
+    @property
+    def version(self) -> int:
+        """Get modification version of the vector.
+
+        The version is increased by every component change, so objects that
+        cache data derived from the vector can detect in-place changes.
+
+        Returns:
+            int: modification version of the vector.
+        """
+        return self._version
+
+    def copy(self) -> Vector3D:
+        """Get a snapshot of the vector.
+
+        Returns:
+            Vector3D: new instance with the same components.
+        """
+        return self._from_floats(self._x, self._y, self._z)
 
     def plot(self, ax, *args, **kwargs) -> None:
         """Plot the vector.
@@ -127,6 +217,40 @@ class Vector3D:
         """
         ax.plot(*[[c, c] for c in self], *args, **kwargs)
 
+    def norm(self) -> float:
+        """Get the euclidean norm of the vector.
+
+        Returns:
+            float: euclidean norm of the vector.
+        """
+        return (self._x ** 2 + self._y ** 2 + self._z ** 2) ** .5
+
+    def dot(self, other: Vector3D) -> float:
+        """Get the dot product of two vectors.
+
+        Args:
+            other (Vector3D): vector to multiply by.
+
+        Returns:
+            float: dot product of the two vectors.
+        """
+        return self._x * other._x + self._y * other._y + self._z * other._z
+
+    def cross(self, other: Vector3D) -> Vector3D:
+        """Get the cross product of two vectors.
+
+        Args:
+            other (Vector3D): vector to multiply by.
+
+        Returns:
+            Vector3D: resulting vector.
+        """
+        return Vector3D._from_floats(
+            self._y * other._z - self._z * other._y,
+            self._z * other._x - self._x * other._z,
+            self._x * other._y - self._y * other._x
+        )
+
     def __add__(self, other: Vector3D) -> Vector3D:
         """Add two vectors.
 
@@ -136,10 +260,10 @@ class Vector3D:
         Returns:
             Vector3D: resulting vector.
         """
-        return Vector3D(
-            self.x + other.x,
-            self.y + other.y,
-            self.z + other.z
+        return Vector3D._from_floats(
+            self._x + other._x,
+            self._y + other._y,
+            self._z + other._z
         )
 
     def __sub__(self, other: Vector3D) -> Vector3D:
@@ -151,10 +275,10 @@ class Vector3D:
         Returns:
             Vector3D: resulting vector.
         """
-        return Vector3D(
-            self.x - other.x,
-            self.y - other.y,
-            self.z - other.z
+        return Vector3D._from_floats(
+            self._x - other._x,
+            self._y - other._y,
+            self._z - other._z
         )
 
     def __mul__(self, other: int | float) -> Vector3D:
@@ -169,10 +293,10 @@ class Vector3D:
         if not isinstance(other, (int, float)):
             raise TypeError("only scalars are supported for multiplication")
 
-        return Vector3D(
-            self.x * other,
-            self.y * other,
-            self.z * other
+        return Vector3D._from_floats(
+            self._x * other,
+            self._y * other,
+            self._z * other
         )
 
     def __rmul__(self, other: int | float) -> Vector3D:
@@ -187,10 +311,10 @@ class Vector3D:
         if not isinstance(other, (int, float)):
             raise TypeError("only scalars are supported for multiplication")
 
-        return Vector3D(
-            self.x * other,
-            self.y * other,
-            self.z * other
+        return Vector3D._from_floats(
+            self._x * other,
+            self._y * other,
+            self._z * other
         )
 
     def __truediv__(self, other: int | float) -> Vector3D:
@@ -205,10 +329,10 @@ class Vector3D:
         if not isinstance(other, (int, float)):
             raise TypeError("only scalars are supported for division")
 
-        return Vector3D(
-            self.x / other,
-            self.y / other,
-            self.z / other
+        return Vector3D._from_floats(
+            self._x / other,
+            self._y / other,
+            self._z / other
         )
 
     def __floordiv__(self, other: int | float) -> Vector3D:
@@ -271,10 +395,10 @@ class Vector3D:
         Returns:
             Vector3D: resulting vector.
         """
-        return Vector3D(
-            abs(self.x),
-            abs(self.y),
-            abs(self.z)
+        return Vector3D._from_floats(
+            abs(self._x),
+            abs(self._y),
+            abs(self._z)
         )
 
     def __neg__(self) -> Vector3D:
@@ -283,10 +407,10 @@ class Vector3D:
         Returns:
             Vector3D: resulting vector.
         """
-        return Vector3D(
-            -self.x,
-            -self.y,
-            -self.z
+        return Vector3D._from_floats(
+            -self._x,
+            -self._y,
+            -self._z
         )
 
     def __pos__(self) -> Vector3D:
@@ -295,10 +419,10 @@ class Vector3D:
         Returns:
             Vector3D: resulting vector.
         """
-        return Vector3D(
-            +self.x,
-            +self.y,
-            +self.z
+        return Vector3D._from_floats(
+            +self._x,
+            +self._y,
+            +self._z
         )
 
     def __round__(self, n: int = 0) -> Vector3D:
@@ -474,6 +598,25 @@ class Vector3D:
         """
         return hash((self.x, self.y, self.z))
 
+    def __getstate__(self) -> tuple[None, dict]:
+        """Get the vector state for pickling, with a null version.
+
+        Versions are only comparable within a process, so unpickled vectors
+        start from version 0, which is lower than any later change.
+
+        Returns:
+            tuple[None, dict]: vector state, as slot values.
+        """
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if hasattr(self, name)
+        }
+        state["_version"] = 0
+
+        return None, state
+
 
 class Rotator3D(Vector3D):
     """3D rotation representation class.
@@ -485,8 +628,12 @@ class Rotator3D(Vector3D):
         x (float): X rotation (degrees).
         y (float): Y rotation (degrees).
         z (float): Z rotation (degrees).
+        matrix (np.ndarray): 3x3 rotation matrix.
+        forward (Vector3D): unit direction vector.
     """
 
+    __slots__ = ("_matrix", "_matrix_key", "_forward", "_forward_key")
+
     def __init__(
         self,
         x: int | float = 0,
@@ -500,9 +647,87 @@ class Rotator3D(Vector3D):
             y (int | float): Y rotation (degrees).
             z (int | float): Z rotation (degrees).
         """
-        self.x = np.deg2rad(x)
-        self.y = np.deg2rad(y)
-        self.z = np.deg2rad(z)
+        self.x = math.radians(x)
+        self.y = math.radians(y)
+        self.z = math.radians(z)
+
+        self._matrix_key: tuple[float, float, float] | None = None
+        self._forward_key: tuple[float, float] | None = None
+
+    @classmethod
+    def _from_floats(cls, x: float, y: float, z: float) -> Rotator3D:
+        """Initialize an instance from trusted float components.
+
+        This constructor skips the validation and coercion performed by the
+        property setters, so it must only be used with values that are already
+        known to be floats.
+
+        Args:
+            x (float): X rotation (radians).
+            y (float): Y rotation (radians).
+            z (float): Z rotation (radians).
+
+        Returns:
+            Rotator3D: new instance.
+        """
+        rotator = object.__new__(cls)
+        rotator._x = x
+        rotator._y = y
+        rotator._z = z
+        rotator._version = 0
+        rotator._matrix_key = rotator._forward_key = None
+
+        return rotator
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Get the rotation matrix of the rotator.
+
+        The matrix is computed once per distinct rotation and shared between
+        rotators, so it must be treated as read-only.
+
+        Returns:
+            np.ndarray: 3x3 rotation matrix.
+        """
+        key = (self._x, self._y, self._z)
+
+        if self._matrix_key != key:
+            self._matrix = _rotation_matrix(*key)
+            self._matrix_key = key
+
+        return self._matrix
+
+    @property
+    def forward(self) -> Vector3D:
+        """Get the unit direction vector of the rotator.
+
+        The direction is defined by the X (yaw) and Y (pitch) rotations, as
+        used by the simulation to integrate the drone position. It is
+        memoized and updated in place when the rotation changes, so it must be
+        treated as read-only.
+
+        Returns:
+            Vector3D: unit direction vector.
+        """
+        key = (self._x, self._y)
+
+        if self._forward_key != key:
+            cos_y = math.cos(self._y)
+            forward = (
+                math.cos(self._x) * cos_y,
+                math.sin(self._x) * cos_y,
+                math.sin(self._y)
+            )
+
+            # Reuse the memoized vector to avoid allocations on updates:
+            if self._forward_key is None:
+                self._forward = Vector3D._from_floats(*forward)
+            else:
+                self._forward.set(*forward)
+
+            self._forward_key = key
+
+        return self._forward
 
     def __repr__(self) -> str:
         """Get the raw representation of the rotator.
@@ -521,6 +746,413 @@ class Rotator3D(Vector3D):
         return f"({self.x}, {self.y}, {self.z})"
 
 
+@functools.lru_cache(maxsize=1024)
+def _rotation_matrix(x: float, y: float, z: float) -> np.ndarray:
+    """Compute the rotation matrix of a rotation.
+
+    Results are shared between all rotators with the same components, so the
+    returned matrix is read-only.
+
+    Args:
+        x (float): X rotation (radians).
+        y (float): Y rotation (radians).
+        z (float): Z rotation (radians).
+
+    Returns:
+        np.ndarray: 3x3 rotation matrix.
+    """
+    cos_x, cos_y, cos_z = math.cos(x), math.cos(y), math.cos(z)
+    sin_x, sin_y, sin_z = math.sin(x), math.sin(y), math.sin(z)
+
+    # Same composition as _compose_matrices, using scalar math:
+    matrix = np.array((
+        (
+            cos_x * cos_y,
+            cos_x * sin_y * sin_z - sin_x * cos_z,
+            cos_x * sin_y * cos_z + sin_x * sin_z
+        ), (
+            sin_x * cos_y,
+            sin_x * sin_y * sin_z + cos_x * cos_z,
+            sin_x * sin_y * cos_z - cos_x * sin_z
+        ), (
+            -sin_y,
+            cos_y * sin_z,
+            cos_y * cos_z
+        )
+    ))
+    matrix.setflags(write=False)
+
+    return matrix
+
+
+class Vector3DArray:
+    """3D vector array representation class.
+
+    This class represents a sequence of vectors in the 3D space, stored in a
+    contiguous (N, 3) float64 buffer. It supports the same arithmetic as
+    Vector3D, applied row-wise, so that whole trajectories can be processed
+    with a single NumPy call.
+
+    Attributes:
+        array (np.ndarray): (N, 3) float64 buffer.
+        x (np.ndarray): X components of the vectors.
+        y (np.ndarray): Y components of the vectors.
+        z (np.ndarray): Z components of the vectors.
+    """
+
+    def __init__(
+        self,
+        data: np.ndarray | Iterable[Vector3D] | None = None
+    ) -> None:
+        """Initialize a Vector3DArray instance.
+
+        Args:
+            data (np.ndarray | Iterable[Vector3D] | None): (N, 3) array-like
+                or iterable of vectors. Defaults to None (empty array).
+        """
+        self.array = np.empty((0, 3)) if data is None else data
+
+    @property
+    def array(self) -> np.ndarray:
+        """Get the (N, 3) buffer of the vector array.
+
+        Returns:
+            np.ndarray: (N, 3) buffer of the vector array.
+        """
+        return self._array
+
+    @array.setter
+    def array(self, value: np.ndarray | Iterable[Vector3D]) -> None:
+        """Set the (N, 3) buffer of the vector array.
+
+        Args:
+            value (np.ndarray | Iterable[Vector3D]): (N, 3) array-like or
+                iterable of vectors.
+        """
+        if isinstance(value, Vector3DArray):
+            value = value.array
+        elif not isinstance(value, np.ndarray):
+            value = [
+                tuple(vector) if isinstance(vector, Vector3D) else vector
+                for vector in value
+            ]
+
+        value = np.asarray(value, dtype=np.float64)
+
+        if value.size == 0:
+            value = value.reshape(0, 3)
+
+        if value.ndim != 2 or value.shape[1] != 3:
+            raise ValueError(
+                "expected shape (N, 3) for"
+                + f" {self.__class__.__name__}.array but got"
+                + f" {value.shape} instead"
+            )
+
+        self._array = value
+
+    @property
+    def x(self) -> np.ndarray:
+        """Get X components of the vectors.
+
+        Returns:
+            np.ndarray: X components of the vectors.
+        """
+        return self._array[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """Get Y components of the vectors.
+
+        Returns:
+            np.ndarray: Y components of the vectors.
+        """
+        return self._array[:, 1]
+
+    @property
+    def z(self) -> np.ndarray:
+        """Get Z components of the vectors.
+
+        Returns:
+            np.ndarray: Z components of the vectors.
+        """
+        return self._array[:, 2]
+
+    @classmethod
+    def from_vectors(cls, vectors: Iterable[Vector3D]) -> Vector3DArray:
+        """Create a vector array from an iterable of vectors.
+
+        Args:
+            vectors (Iterable[Vector3D]): vectors to convert.
+
+        Returns:
+            Vector3DArray: resulting vector array.
+        """
+        vectors = list(vectors)
+
+        for i, vector in enumerate(vectors):
+            if not isinstance(vector, Vector3D):
+                raise TypeError(
+                    "expected type Vector3D for"
+                    + f" {cls.__name__}.from_vectors but got"
+                    + f" {type(vector).__name__} from item at index {i}"
+                    + " instead"
+                )
+
+        return cls(np.array([tuple(vector) for vector in vectors]))
+
+    def to_vectors(self) -> list[Vector3D]:
+        """Convert the vector array to a list of vectors.
+
+        Returns:
+            list[Vector3D]: list of vectors.
+        """
+        return [
+            Vector3D._from_floats(*row) for row in self._array.tolist()
+        ]
+
+    def norm(self) -> np.ndarray:
+        """Get the euclidean norm of each vector.
+
+        Returns:
+            np.ndarray: (N,) euclidean norms of the vectors.
+        """
+        return np.sqrt(np.einsum("ij,ij->i", self._array, self._array))
+
+    def dot(self, other: Vector3D | Vector3DArray) -> np.ndarray:
+        """Get the row-wise dot product with a vector or vector array.
+
+        Args:
+            other (Vector3D | Vector3DArray): vector or vector array to
+                multiply by.
+
+        Returns:
+            np.ndarray: (N,) dot products.
+        """
+        return np.einsum(
+            "ij,ij->i",
+            self._array,
+            np.broadcast_to(self._operand(other), self._array.shape)
+        )
+
+    def cross(self, other: Vector3D | Vector3DArray) -> Vector3DArray:
+        """Get the row-wise cross product with a vector or vector array.
+
+        Args:
+            other (Vector3D | Vector3DArray): vector or vector array to
+                multiply by.
+
+        Returns:
+            Vector3DArray: resulting vector array.
+        """
+        return Vector3DArray(np.cross(self._array, self._operand(other)))
+
+    def plot(self, ax, *args, **kwargs) -> None:
+        """Plot the vector array as a polyline.
+
+        Args:
+            ax (Axes3D): axes to plot the vector array on.
+        """
+        ax.plot(self.x, self.y, self.z, *args, **kwargs)
+
+    def _operand(self, other: Any) -> np.ndarray:
+        """Convert a vector operand to an array broadcastable to the buffer.
+
+        Args:
+            other (Any): vector operand.
+
+        Returns:
+            np.ndarray: (3,) or (N, 3) operand array.
+        """
+        if isinstance(other, Vector3DArray):
+            if len(other) != len(self):
+                raise ValueError(
+                    "expected operand of length"
+                    + f" {len(self)} for {self.__class__.__name__} but got"
+                    + f" {len(other)} instead"
+                )
+
+            return other.array
+
+        if isinstance(other, Vector3D):
+            return np.array((other.x, other.y, other.z))
+
+        raise TypeError(
+            "expected type Vector3D | Vector3DArray for"
+            + f" {self.__class__.__name__} operand but got"
+            + f" {type(other).__name__} instead"
+        )
+
+    @staticmethod
+    def _scalar(other: Any, operation: str) -> int | float:
+        """Check that an operand is a scalar.
+
+        Args:
+            other (Any): operand to check.
+            operation (str): operation name for the error message.
+
+        Returns:
+            int | float: scalar operand.
+        """
+        if not isinstance(other, (int, float)):
+            raise TypeError(f"only scalars are supported for {operation}")
+
+        return other
+
+    def __add__(self, other: Vector3D | Vector3DArray) -> Vector3DArray:
+        """Add a vector or vector array row-wise.
+
+        Args:
+            other (Vector3D | Vector3DArray): vector or vector array to add.
+
+        Returns:
+            Vector3DArray: resulting vector array.
+        """
+        return Vector3DArray(self._array + self._operand(other))
+
+    def __sub__(self, other: Vector3D | Vector3DArray) -> Vector3DArray:
+        """Subtract a vector or vector array row-wise.
+
+        Args:
+            other (Vector3D | Vector3DArray): vector or vector array to
+                subtract.
+
+        Returns:
+            Vector3DArray: resulting vector array.
+        """
+        return Vector3DArray(self._array - self._operand(other))
+
+    def __mul__(self, other: int | float) -> Vector3DArray:
+        """Multiply the vector array by a scalar.
+
+        Args:
+            other (int | float): scalar to multiply by.
+
+        Returns:
+            Vector3DArray: resulting vector array.
+        """
+        return Vector3DArray(
+            self._array * self._scalar(other, "multiplication")
+        )
+
+    def __rmul__(self, other: int | float) -> Vector3DArray:
+        """Multiply the vector array by a scalar.
+
+        Args:
+            other (int | float): scalar to multiply by.
+
+        Returns:
+            Vector3DArray: resulting vector array.
+        """
+        return Vector3DArray(
+            self._scalar(other, "multiplication") * self._array
+        )
+
+    def __truediv__(self, other: int | float) -> Vector3DArray:
+        """Divide the vector array by a scalar (float division).
+
+        Args:
+            other (int | float): scalar to divide by.
+
+        Returns:
+            Vector3DArray: resulting vector array.
+        """
+        return Vector3DArray(self._array / self._scalar(other, "division"))
+
+    def __abs__(self) -> Vector3DArray:
+        """Get the absolute value of the vector array.
+
+        Returns:
+            Vector3DArray: resulting vector array.
+        """
+        return Vector3DArray(np.abs(self._array))
+
+    def __neg__(self) -> Vector3DArray:
+        """Get the negation of the vector array.
+
+        Returns:
+            Vector3DArray: resulting vector array.
+        """
+        return Vector3DArray(-self._array)
+
+    def __pos__(self) -> Vector3DArray:
+        """Get the positive value of the vector array.
+
+        Returns:
+            Vector3DArray: resulting vector array.
+        """
+        return Vector3DArray(self._array.copy())
+
+    def __eq__(self, other: Any) -> bool:
+        """Check if two vector arrays are equal.
+
+        Args:
+            other (Any): vector array to compare to.
+
+        Returns:
+            bool: whether the two vector arrays are equal to another.
+        """
+        return (
+            isinstance(other, Vector3DArray)
+            and np.array_equal(self._array, other.array)
+        )
+
+    def __len__(self) -> int:
+        """Get the number of vectors in the vector array.
+
+        Returns:
+            int: number of vectors in the vector array.
+        """
+        return len(self._array)
+
+    def __iter__(self) -> Iterator[Vector3D]:
+        """Get an iterator over the vectors of the vector array.
+
+        Returns:
+            Iterator[Vector3D]: iterator over the vectors.
+        """
+        return iter(self.to_vectors())
+
+    def __getitem__(self, key: int | slice) -> Vector3D | Vector3DArray:
+        """Get a vector or a sub-array of the vector array.
+
+        Args:
+            key (int | slice): vector index or slice.
+
+        Returns:
+            Vector3D | Vector3DArray: vector at the given index or vector
+                array view for the given slice.
+        """
+        if isinstance(key, slice):
+            return Vector3DArray(self._array[key])
+
+        return Vector3D._from_floats(*self._array[key].tolist())
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        """Get the NumPy representation of the vector array.
+
+        Returns:
+            np.ndarray: (N, 3) buffer of the vector array.
+        """
+        return self._array if dtype is None else self._array.astype(dtype)
+
+    def __repr__(self) -> str:
+        """Get the raw representation of the vector array.
+
+        Returns:
+            str: raw representation of the vector array.
+        """
+        return f"Vector3DArray(<{len(self)} vectors>)"
+
+    def __str__(self) -> str:
+        """Get the string representation of the vector array.
+
+        Returns:
+            str: string representation of the vector array.
+        """
+        return str(self._array)
+
+
 def distance3D(a: Vector3D, b: Vector3D) -> float:
     """Get the distance between two vectors.
 
@@ -538,3 +1170,138 @@ def distance3D(a: Vector3D, b: Vector3D) -> float:
         )
 
     return ((b.x - a.x)**2 + (b.y - a.y)**2 + (b.z - a.z)**2) ** .5
+
+
+def as_points(value: Any) -> np.ndarray:
+    """Convert a vector or a sequence of vectors to an (N, 3) array.
+
+    Args:
+        value (Any): vector, vector array, (N, 3) array-like or iterable of
+            vectors.
+
+    Returns:
+        np.ndarray: (N, 3) float64 array.
+    """
+    if isinstance(value, Vector3D):
+        return np.array(((value.x, value.y, value.z),))
+
+    if isinstance(value, Vector3DArray):
+        return value.array
+
+    return Vector3DArray(value).array
+
+
+def distances3D(
+    a: Vector3D | Vector3DArray | np.ndarray | Iterable[Vector3D],
+    b: Vector3D | Vector3DArray | np.ndarray | Iterable[Vector3D]
+) -> np.ndarray:
+    """Get the row-wise distances between two sequences of vectors.
+
+    Any of the operands can also be a single vector, in which case it is
+    broadcast against every row of the other one.
+
+    Args:
+        a (Vector3D | Vector3DArray | np.ndarray | Iterable[Vector3D]):
+            first sequence of vectors.
+        b (Vector3D | Vector3DArray | np.ndarray | Iterable[Vector3D]):
+            second sequence of vectors.
+
+    Returns:
+        np.ndarray: (N,) distances between each pair of vectors.
+    """
+    a, b = as_points(a), as_points(b)
+
+    if len(a) != len(b) and 1 not in (len(a), len(b)):
+        raise ValueError(
+            "expected operands of matching length but got"
+            + f" {len(a)} and {len(b)} instead"
+        )
+
+    difference = b - a
+
+    return np.sqrt(np.einsum("ij,ij->i", difference, difference))
+
+
+def pairwise_distances(
+    a: Vector3D | Vector3DArray | np.ndarray | Iterable[Vector3D],
+    b: Vector3D | Vector3DArray | np.ndarray | Iterable[Vector3D]
+) -> np.ndarray:
+    """Get the distances between every pair of vectors of two sequences.
+
+    Args:
+        a (Vector3D | Vector3DArray | np.ndarray | Iterable[Vector3D]):
+            first sequence of N vectors.
+        b (Vector3D | Vector3DArray | np.ndarray | Iterable[Vector3D]):
+            second sequence of M vectors.
+
+    Returns:
+        np.ndarray: (N, M) distances, where item (i, j) is the distance
+            between the i-th vector of `a` and the j-th vector of `b`.
+    """
+    a, b = as_points(a), as_points(b)
+    difference = b[np.newaxis, :, :] - a[:, np.newaxis, :]
+
+    return np.sqrt(np.einsum("ijk,ijk->ij", difference, difference))
+
+
+def path_length(
+    points: Vector3DArray | np.ndarray | Iterable[Vector3D]
+) -> float:
+    """Get the length of the polyline that joins a sequence of vectors.
+
+    Args:
+        points (Vector3DArray | np.ndarray | Iterable[Vector3D]): sequence of
+            vectors.
+
+    Returns:
+        float: sum of the distances between consecutive vectors.
+    """
+    points = as_points(points)
+
+    if len(points) < 2:
+        return 0.0
+
+    return float(distances3D(points[:-1], points[1:]).sum())
+
+
+def rotation_matrices(
+    rotators: Vector3DArray | np.ndarray | Iterable[Rotator3D]
+) -> np.ndarray:
+    """Get the rotation matrices of a sequence of rotators.
+
+    Args:
+        rotators (Vector3DArray | np.ndarray | Iterable[Rotator3D]):
+            sequence of rotators or (N, 3) array of rotations in radians.
+
+    Returns:
+        np.ndarray: (N, 3, 3) rotation matrices.
+    """
+    angles = as_points(rotators)
+
+    return _compose_matrices(np.cos(angles), np.sin(angles))
+
+
+def _compose_matrices(cos: np.ndarray, sin: np.ndarray) -> np.ndarray:
+    """Compose rotation matrices from the cosines and sines of rotations.
+
+    Args:
+        cos (np.ndarray): (N, 3) cosines of the X, Y and Z rotations.
+        sin (np.ndarray): (N, 3) sines of the X, Y and Z rotations.
+
+    Returns:
+        np.ndarray: (N, 3, 3) rotation matrices.
+    """
+    (cos_x, cos_y, cos_z), (sin_x, sin_y, sin_z) = cos.T, sin.T
+
+    matrices = np.empty((len(cos), 3, 3))
+    matrices[:, 0, 0] = cos_x * cos_y
+    matrices[:, 0, 1] = cos_x * sin_y * sin_z - sin_x * cos_z
+    matrices[:, 0, 2] = cos_x * sin_y * cos_z + sin_x * sin_z
+    matrices[:, 1, 0] = sin_x * cos_y
+    matrices[:, 1, 1] = sin_x * sin_y * sin_z + cos_x * cos_z
+    matrices[:, 1, 2] = sin_x * sin_y * cos_z - cos_x * sin_z
+    matrices[:, 2, 0] = -sin_y
+    matrices[:, 2, 1] = cos_y * sin_z
+    matrices[:, 2, 2] = cos_y * cos_z
+
+    return matrices
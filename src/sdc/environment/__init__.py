@@ -4,6 +4,9 @@ This module allows 3D environment generation from templates, data structuring
 and display in an easy way.
 
 Modules:
+    binary: binary track sequence format module.
+    generator: procedural track generator module.
+    index: spatial index module.
     reader: track template reader module.
     track: track structuring and display module.
 
@@ -0,0 +1,316 @@
+"""Binary track sequence format module.
+
+Track sequences are stored as a fixed header followed by contiguous
+little-endian arrays, so that files can be memory-mapped and tracks built
+only when accessed. The layout is:
+
+    offset  size        content
+    0       8           magic bytes, b"SDCTRACK"
+    8       4           uint32 format version (1)
+    12      4           reserved, zero
+    16      8           uint64 track count T
+    24      8           uint64 ring count R (all tracks)
+    32      T * 24      float64 (T, 3) track starts
+    ...     T * 24      float64 (T, 3) track ends
+    ...     (T + 1) * 8 int64 (T + 1,) ring offsets, from 0 to R
+    ...     R * 24      float64 (R, 3) ring positions
+    ...     R * 24      float64 (R, 3) ring rotations in degrees
+
+The rings of track i are the rows offsets[i]:offsets[i + 1] of the ring
+arrays.
+
+Author:
+    Paulo Sanchez (@erlete)
+"""
+
+
+from typing import Iterator, Sequence
+
+import numpy as np
+
+from .track import Track
+
+MAGIC = b"SDCTRACK"
+VERSION = 1
+HEADER = np.dtype([
+    ("magic", "S8"),
+    ("version", "<u4"),
+    ("reserved", "<u4"),
+    ("track_count", "<u8"),
+    ("ring_count", "<u8")
+])
+
+
+def is_binary(path: str) -> bool:
+    """Check whether a file is a binary track sequence file.
+
+    Args:
+        path (str): file path.
+
+    Returns:
+        bool: True if the file starts with the binary format magic bytes,
+            False otherwise.
+    """
+    with open(path, mode="rb") as fp:
+        return fp.read(len(MAGIC)) == MAGIC
+
+
+def write_binary(
+    path: str,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    offsets: np.ndarray,
+    positions: np.ndarray,
+    rotations: np.ndarray
+) -> None:
+    """Write a binary track sequence file.
+
+    Args:
+        path (str): output file path.
+        starts (np.ndarray): (T, 3) track starts.
+        ends (np.ndarray): (T, 3) track ends.
+        offsets (np.ndarray): (T + 1,) ring offsets of each track.
+        positions (np.ndarray): (R, 3) ring positions.
+        rotations (np.ndarray): (R, 3) ring rotations in degrees.
+    """
+    starts = np.asarray(starts, dtype="<f8").reshape(-1, 3)
+    ends = np.asarray(ends, dtype="<f8").reshape(-1, 3)
+    offsets = np.asarray(offsets, dtype="<i8")
+    positions = np.asarray(positions, dtype="<f8").reshape(-1, 3)
+    rotations = np.asarray(rotations, dtype="<f8").reshape(-1, 3)
+
+    if (
+        len(ends) != len(starts)
+        or offsets.shape != (len(starts) + 1,)
+        or len(rotations) != len(positions)
+        or offsets[0] != 0
+        or offsets[-1] != len(positions)
+        or np.any(np.diff(offsets) < 0)
+    ):
+        raise ValueError(
+            "expected matching track and ring array shapes for"
+            + " write_binary but got"
+            + f" starts {starts.shape}, ends {ends.shape},"
+            + f" offsets {offsets.shape}, positions {positions.shape}"
+            + f" and rotations {rotations.shape} instead"
+        )
+
+    header = np.array(
+        (MAGIC, VERSION, 0, len(starts), len(positions)), dtype=HEADER
+    )
+
+    with open(path, mode="wb") as fp:
+        for array in (header, starts, ends, offsets, positions, rotations):
+            fp.write(np.ascontiguousarray(array).tobytes())
+
+
+class BinaryTrackSequence(Sequence[Track]):
+    """Binary track sequence class.
+
+    This class memory-maps a binary track sequence file. Opening a file only
+    reads its header, and each track is built from the mapped arrays when it
+    is accessed.
+
+    Attributes:
+        path (str): binary track sequence file path.
+        starts (np.ndarray): (T, 3) track starts.
+        ends (np.ndarray): (T, 3) track ends.
+        offsets (np.ndarray): (T + 1,) ring offsets of each track.
+        positions (np.ndarray): (R, 3) ring positions.
+        rotations (np.ndarray): (R, 3) ring rotations in degrees.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize a BinaryTrackSequence instance.
+
+        Args:
+            path (str): binary track sequence file path.
+
+        Raises:
+            ValueError: if the file header, size or ring offsets are invalid.
+        """
+        self._path = path
+        self._map = np.memmap(path, dtype=np.uint8, mode="r")
+
+        if len(self._map) < HEADER.itemsize:
+            raise ValueError(f"{path} is not a binary track sequence file")
+
+        header = np.frombuffer(self._map, dtype=HEADER, count=1)[0]
+
+        if header["magic"] != MAGIC or header["version"] != VERSION:
+            raise ValueError(
+                f"{path} is not a version {VERSION} binary track sequence"
+                + " file"
+            )
+
+        track_count = int(header["track_count"])
+        ring_count = int(header["ring_count"])
+        sections = (
+            ("<f8", track_count * 3),
+            ("<f8", track_count * 3),
+            ("<i8", track_count + 1),
+            ("<f8", ring_count * 3),
+            ("<f8", ring_count * 3)
+        )
+
+        size = HEADER.itemsize + 8 * sum(count for _, count in sections)
+        if len(self._map) != size:
+            raise ValueError(
+                f"expected {size} bytes for binary track sequence file {path}"
+                + f" but got {len(self._map)} instead"
+            )
+
+        arrays, offset = [], HEADER.itemsize
+        for dtype, count in sections:
+            arrays.append(np.frombuffer(
+                self._map, dtype=dtype, count=count, offset=offset
+            ))
+            offset += 8 * count
+
+        self._starts = arrays[0].reshape(-1, 3)
+        self._ends = arrays[1].reshape(-1, 3)
+        self._offsets = arrays[2]
+        self._positions = arrays[3].reshape(-1, 3)
+        self._rotations = arrays[4].reshape(-1, 3)
+
+        offsets = self._offsets
+        if (
+            offsets[0] != 0
+            or offsets[-1] != ring_count
+            or not np.all(np.diff(offsets) >= 0)
+        ):
+            raise ValueError(
+                f"expected non-decreasing ring offsets from 0 to {ring_count}"
+                + f" for binary track sequence file {path} but got offsets"
+                + f" from {offsets[0]} to {offsets[-1]} instead"
+            )
+
+    @property
+    def path(self) -> str:
+        """Get binary track sequence file path.
+
+        Returns:
+            str: binary track sequence file path.
+        """
+        return self._path
+
+    @property
+    def starts(self) -> np.ndarray:
+        """Get track starts.
+
+        Returns:
+            np.ndarray: (T, 3) read-only track starts.
+        """
+        return self._starts
+
+    @property
+    def ends(self) -> np.ndarray:
+        """Get track ends.
+
+        Returns:
+            np.ndarray: (T, 3) read-only track ends.
+        """
+        return self._ends
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """Get ring offsets of each track.
+
+        Returns:
+            np.ndarray: (T + 1,) read-only ring offsets.
+        """
+        return self._offsets
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Get ring positions of all tracks.
+
+        Returns:
+            np.ndarray: (R, 3) read-only ring positions.
+        """
+        return self._positions
+
+    @property
+    def rotations(self) -> np.ndarray:
+        """Get ring rotations of all tracks.
+
+        Returns:
+            np.ndarray: (R, 3) read-only ring rotations in degrees.
+        """
+        return self._rotations
+
+    def track_arrays(
+        self,
+        index: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Get the coordinate arrays of a track.
+
+        Args:
+            index (int): track index.
+
+        Raises:
+            ValueError: if any coordinate of the track is not finite.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: (3,) track
+                start, (3,) track end, (N, 3) ring positions and (N, 3) ring
+                rotations in degrees.
+        """
+        index = range(len(self))[index]
+        first, last = self._offsets[index], self._offsets[index + 1]
+        arrays = (
+            self._starts[index],
+            self._ends[index],
+            self._positions[first:last],
+            self._rotations[first:last]
+        )
+
+        if not all(np.isfinite(array).all() for array in arrays):
+            raise ValueError(
+                f"expected finite coordinates for track {index} of binary"
+                + f" track sequence file {self._path} but got non-finite"
+                + " values instead"
+            )
+
+        return arrays
+
+    def __getitem__(self, index: int | slice) -> Track | list[Track]:
+        """Get a track or a list of tracks.
+
+        Args:
+            index (int | slice): track index or slice.
+
+        Returns:
+            Track | list[Track]: track or list of tracks.
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+
+        return Track._from_arrays(*self.track_arrays(index))
+
+    def __iter__(self) -> Iterator[Track]:
+        """Iterate over the tracks of the sequence.
+
+        Returns:
+            Iterator[Track]: track iterator.
+        """
+        return (self[i] for i in range(len(self)))
+
+    def __len__(self) -> int:
+        """Get number of tracks.
+
+        Returns:
+            int: number of tracks.
+        """
+        return len(self._starts)
+
+    def __repr__(self) -> str:
+        """Get short binary track sequence representation.
+
+        Returns:
+            str: short binary track sequence representation.
+        """
+        return (
+            f"<BinaryTrackSequence of {len(self)} tracks and"
+            + f" {len(self._positions)} rings>"
+        )
@@ -0,0 +1,395 @@
+"""Procedural track generator module.
+
+Author:
+    Paulo Sanchez (@erlete)
+"""
+
+
+import json
+
+import numpy as np
+
+from .binary import write_binary
+from .track import Track
+
+
+class TrackGenerator:
+    """Procedural track generator class.
+
+    This class is used to generate random tracks from a seeded random walk.
+    Each segment of the walk has a random length within the spacing range, a
+    heading that turns at most the turn limit from the previous segment and a
+    pitch within the pitch limit. Waypoints that leave the bounding volume are
+    reflected back into it, and rings face along the resulting path.
+
+    Attributes:
+        seed (int | None): random generator seed.
+        spacing_range (tuple[float, float]): segment length range in m.
+        turn_limit (float): maximum heading change between segments in deg.
+        pitch_limit (float): maximum segment pitch in deg.
+        bounds (tuple[tuple[float, float], ...]): (min, max) waypoint
+            coordinates on each axis in m.
+    """
+
+    def __init__(
+        self,
+        seed: int | None = None,
+        spacing_range: tuple[int | float, int | float] = (10, 30),
+        turn_limit: int | float = 45,
+        pitch_limit: int | float = 30,
+        bounds: tuple[tuple[int | float, int | float], ...] = (
+            (-500, 500),
+            (-500, 500),
+            (-100, 100)
+        )
+    ) -> None:
+        """Initialize a TrackGenerator instance.
+
+        Args:
+            seed (int | None, optional): random generator seed. Defaults to
+                None (non-reproducible tracks).
+            spacing_range (tuple[int | float, int | float], optional):
+                segment length range in m. Defaults to (10, 30).
+            turn_limit (int | float, optional): maximum heading change between
+                segments in deg. Defaults to 45.
+            pitch_limit (int | float, optional): maximum segment pitch in deg.
+                Defaults to 30.
+            bounds (tuple[tuple[int | float, int | float], ...], optional):
+                (min, max) waypoint coordinates on each axis in m. Defaults to
+                ((-500, 500), (-500, 500), (-100, 100)).
+        """
+        self.seed = seed
+        self.spacing_range = spacing_range
+        self.turn_limit = turn_limit
+        self.pitch_limit = pitch_limit
+        self.bounds = bounds
+
+    @property
+    def seed(self) -> int | None:
+        """Get random generator seed.
+
+        Returns:
+            int | None: random generator seed.
+        """
+        return self._seed
+
+    @seed.setter
+    def seed(self, value: int | None) -> None:
+        """Set random generator seed and reset the random generator.
+
+        Args:
+            value (int | None): random generator seed.
+        """
+        if value is not None and not isinstance(value, int):
+            raise TypeError(
+                "expected type int | None for"
+                + f" {self.__class__.__name__}.seed but got"
+                + f" {type(value).__name__} instead"
+            )
+
+        self._seed = value
+        self._rng = np.random.default_rng(value)
+
+    @property
+    def spacing_range(self) -> tuple[float, float]:
+        """Get segment length range.
+
+        Returns:
+            tuple[float, float]: segment length range in m.
+        """
+        return self._spacing_range
+
+    @spacing_range.setter
+    def spacing_range(self, value: tuple[int | float, int | float]) -> None:
+        """Set segment length range.
+
+        Args:
+            value (tuple[int | float, int | float]): segment length range in
+                m.
+        """
+        value = self._float_pair(value, "spacing_range")
+
+        if not 0 < value[0] <= value[1]:
+            raise ValueError(
+                "expected 0 < min <= max for"
+                + f" {self.__class__.__name__}.spacing_range but got"
+                + f" {value} instead"
+            )
+
+        self._spacing_range = value
+
+    @property
+    def turn_limit(self) -> float:
+        """Get maximum heading change between segments.
+
+        Returns:
+            float: maximum heading change between segments in deg.
+        """
+        return self._turn_limit
+
+    @turn_limit.setter
+    def turn_limit(self, value: int | float) -> None:
+        """Set maximum heading change between segments.
+
+        Args:
+            value (int | float): maximum heading change between segments in
+                deg.
+        """
+        self._turn_limit = self._limit(value, 180, "turn_limit")
+
+    @property
+    def pitch_limit(self) -> float:
+        """Get maximum segment pitch.
+
+        Returns:
+            float: maximum segment pitch in deg.
+        """
+        return self._pitch_limit
+
+    @pitch_limit.setter
+    def pitch_limit(self, value: int | float) -> None:
+        """Set maximum segment pitch.
+
+        Args:
+            value (int | float): maximum segment pitch in deg.
+        """
+        self._pitch_limit = self._limit(value, 90, "pitch_limit")
+
+    @property
+    def bounds(self) -> tuple[tuple[float, float], ...]:
+        """Get bounding volume.
+
+        Returns:
+            tuple[tuple[float, float], ...]: (min, max) waypoint coordinates
+                on each axis in m.
+        """
+        return self._bounds
+
+    @bounds.setter
+    def bounds(
+        self,
+        value: tuple[tuple[int | float, int | float], ...]
+    ) -> None:
+        """Set bounding volume.
+
+        Args:
+            value (tuple[tuple[int | float, int | float], ...]): (min, max)
+                waypoint coordinates on each axis in m.
+        """
+        if not isinstance(value, (tuple, list)) or len(value) != 3:
+            raise TypeError(
+                "expected three (min, max) pairs for"
+                + f" {self.__class__.__name__}.bounds but got"
+                + f" {value} instead"
+            )
+
+        value = tuple(self._float_pair(pair, "bounds") for pair in value)
+
+        if any(low >= high for low, high in value):
+            raise ValueError(
+                "expected min < max on every axis for"
+                + f" {self.__class__.__name__}.bounds but got"
+                + f" {value} instead"
+            )
+
+        self._bounds = value
+
+    def generate_arrays(
+        self,
+        ring_count: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Generate the coordinates of a random track.
+
+        Args:
+            ring_count (int): number of rings of the track.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: (3,) track
+                start, (3,) track end, (N, 3) ring positions and (N, 3) ring
+                rotations in degrees.
+        """
+        if not isinstance(ring_count, int) or ring_count < 0:
+            raise ValueError(
+                "expected a non-negative int ring count for"
+                + f" {self.__class__.__name__}.generate_arrays but got"
+                + f" {ring_count} instead"
+            )
+
+        rng = self._rng
+        low, high = np.array(self._bounds).T
+        segments = ring_count + 1
+
+        # Random walk segments:
+        headings = np.radians(rng.uniform(0, 360) + np.concatenate((
+            [0], np.cumsum(rng.uniform(
+                -self._turn_limit, self._turn_limit, segments - 1
+            ))
+        )))
+        pitches = np.radians(
+            rng.uniform(-self._pitch_limit, self._pitch_limit, segments)
+        )
+        lengths = rng.uniform(*self._spacing_range, segments)
+        steps = lengths[:, None] * np.stack((
+            np.cos(headings) * np.cos(pitches),
+            np.sin(headings) * np.cos(pitches),
+            np.sin(pitches)
+        ), axis=1)
+
+        start = rng.uniform(low, high)
+        waypoints = np.concatenate((
+            start[None, :], start + np.cumsum(steps, axis=0)
+        ))
+
+        # Reflection into the bounding volume:
+        width = high - low
+        folded = np.mod(waypoints - low, 2 * width)
+        waypoints = low + np.where(folded > width, 2 * width - folded, folded)
+
+        # Ring rotations, facing along the path (normal = forward vector):
+        tangents = waypoints[2:] - waypoints[:-2]
+        rotations = np.zeros((ring_count, 3))
+        rotations[:, 0] = np.degrees(
+            np.arctan2(tangents[:, 1], tangents[:, 0])
+        )
+        rotations[:, 1] = 90 - np.degrees(np.arctan2(
+            tangents[:, 2], np.hypot(tangents[:, 0], tangents[:, 1])
+        ))
+
+        return waypoints[0], waypoints[-1], waypoints[1:-1], rotations
+
+    def generate(self, ring_count: int) -> Track:
+        """Generate a random track.
+
+        Args:
+            ring_count (int): number of rings of the track.
+
+        Returns:
+            Track: random track.
+        """
+        return Track._from_arrays(*self.generate_arrays(ring_count))
+
+    def generate_sequence(
+        self,
+        track_count: int,
+        ring_count: int
+    ) -> list[Track]:
+        """Generate a sequence of random tracks.
+
+        Args:
+            track_count (int): number of tracks.
+            ring_count (int): number of rings of each track.
+
+        Returns:
+            list[Track]: random track sequence.
+        """
+        return [self.generate(ring_count) for _ in range(track_count)]
+
+    def write_json(
+        self,
+        path: str,
+        track_count: int,
+        ring_count: int
+    ) -> None:
+        """Generate a sequence of random tracks into a JSON track file.
+
+        Tracks are written straight from their coordinate arrays, in the
+        format read by `TrackSequenceReader`. Reading the file back yields the
+        same tracks that `generate_sequence` would have produced.
+
+        Args:
+            path (str): output track sequence file path.
+            track_count (int): number of tracks.
+            ring_count (int): number of rings of each track.
+        """
+        data = {}
+
+        for i in range(1, track_count + 1):
+            start, end, positions, rotations = self.generate_arrays(ring_count)
+            data[f"track{i}"] = {
+                "start": start.tolist(),
+                "end": end.tolist(),
+                "rings": [
+                    {"position": position, "rotation": rotation}
+                    for position, rotation in zip(
+                        positions.tolist(), rotations.tolist()
+                    )
+                ]
+            }
+
+        with open(path, mode="w", encoding="utf-8") as fp:
+            json.dump(data, fp, indent=4)
+
+    def write_binary(
+        self,
+        path: str,
+        track_count: int,
+        ring_count: int
+    ) -> None:
+        """Generate a sequence of random tracks into a binary track file.
+
+        Reading the file back yields the same tracks that `generate_sequence`
+        would have produced.
+
+        Args:
+            path (str): output binary track sequence file path.
+            track_count (int): number of tracks.
+            ring_count (int): number of rings of each track.
+        """
+        arrays = [self.generate_arrays(ring_count) for _ in range(track_count)]
+
+        write_binary(
+            path,
+            np.array([start for start, _, _, _ in arrays]),
+            np.array([end for _, end, _, _ in arrays]),
+            np.arange(track_count + 1) * ring_count,
+            np.concatenate([np.empty((0, 3))] + [a[2] for a in arrays]),
+            np.concatenate([np.empty((0, 3))] + [a[3] for a in arrays])
+        )
+
+    def _float_pair(self, value: tuple, name: str) -> tuple[float, float]:
+        """Validate a pair of numbers.
+
+        Args:
+            value (tuple): pair of numbers.
+            name (str): attribute name.
+
+        Returns:
+            tuple[float, float]: pair of floats.
+        """
+        if (
+            not isinstance(value, (tuple, list))
+            or len(value) != 2
+            or not all(isinstance(item, (int, float)) for item in value)
+        ):
+            raise TypeError(
+                "expected type tuple[float, float] for"
+                + f" {self.__class__.__name__}.{name} but got"
+                + f" {value} instead"
+            )
+
+        return float(value[0]), float(value[1])
+
+    def _limit(self, value: int | float, maximum: int, name: str) -> float:
+        """Validate an angle limit.
+
+        Args:
+            value (int | float): angle limit in deg.
+            maximum (int): maximum angle limit in deg.
+            name (str): attribute name.
+
+        Returns:
+            float: angle limit in deg.
+        """
+        if not isinstance(value, (int, float)):
+            raise TypeError(
+                f"expected type float for {self.__class__.__name__}.{name}"
+                + f" but got {type(value).__name__} instead"
+            )
+
+        if not 0 <= value <= maximum:
+            raise ValueError(
+                f"expected 0 <= {self.__class__.__name__}.{name} <= {maximum}"
+                + f" but got {value} instead"
+            )
+
+        return float(value)
@@ -0,0 +1,379 @@
+"""Spatial index module.
+
+Author:
+    Paulo Sanchez (@erlete)
+"""
+
+
+import functools
+
+import numpy as np
+
+
+class UniformGridIndex:
+    """Uniform grid spatial index class.
+
+    This class indexes a static set of 3D points in a uniform grid of cubic
+    cells, allowing batched nearest point and fixed radius queries without
+    scanning every point. Points are sorted by cell, so that the points of a
+    cell are a contiguous range of the sorted order.
+
+    Attributes:
+        points (np.ndarray): (N, 3) indexed points.
+        cell_size (float): grid cell edge length.
+        shape (tuple[int, int, int]): number of grid cells on each axis.
+        CHUNK_SIZE (int): maximum number of cells visited at once.
+    """
+
+    CHUNK_SIZE = 2 ** 20
+
+    def __init__(
+        self,
+        points: np.ndarray,
+        cell_size: int | float | None = None
+    ) -> None:
+        """Initialize a UniformGridIndex instance.
+
+        Args:
+            points (np.ndarray): (N, 3) points to index.
+            cell_size (int | float | None, optional): grid cell edge length.
+                Defaults to None (about one point per cell).
+        """
+        points = np.array(points, dtype=np.float64).reshape(-1, 3)
+        points.flags.writeable = False
+
+        if cell_size is not None and (
+            not isinstance(cell_size, (int, float)) or cell_size <= 0
+        ):
+            raise ValueError(
+                "expected a positive cell size for"
+                + f" {self.__class__.__name__} but got {cell_size} instead"
+            )
+
+        self._points = points
+        self._origin = points.min(axis=0) if len(points) else np.zeros(3)
+        self._bound = points.max(axis=0) if len(points) else np.zeros(3)
+        extent = self._bound - self._origin
+
+        if cell_size is None:  # About one point per cell on used axes:
+            spans = extent[extent > 0]
+            cell_size = float(
+                (np.prod(spans) / len(points)) ** (1 / len(spans))
+            ) if len(spans) else 1.0
+
+        self._cell_size = float(cell_size)
+        self._shape = np.floor(extent / self._cell_size).astype(np.int64) + 1
+
+        # Points sorted by cell key and cell ranges in the sorted order:
+        keys = self._keys(self._cells(points))
+        self._order = np.argsort(keys, kind="stable")
+        self._cell_keys, self._cell_starts, counts = np.unique(
+            keys[self._order],
+            return_index=True,
+            return_counts=True
+        )
+        self._cell_ends = self._cell_starts + counts
+
+    @property
+    def points(self) -> np.ndarray:
+        """Get indexed points.
+
+        Returns:
+            np.ndarray: (N, 3) read-only indexed points.
+        """
+        return self._points
+
+    @property
+    def cell_size(self) -> float:
+        """Get grid cell edge length.
+
+        Returns:
+            float: grid cell edge length.
+        """
+        return self._cell_size
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        """Get number of grid cells on each axis.
+
+        Returns:
+            tuple[int, int, int]: number of grid cells on each axis.
+        """
+        return tuple(self._shape.tolist())
+
+    def nearest(self, queries: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Get the nearest indexed point to each query point.
+
+        Cells are visited in shells of increasing Chebyshev distance around
+        the cell of each query, until no unvisited cell can hold a point
+        closer than the best one found. Results are exact, with ties resolved
+        to the lowest point index.
+
+        Args:
+            queries (np.ndarray): (M, 3) query points.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: (M,) nearest point indices and
+                (M,) distances to them. Indices are -1 and distances are
+                infinite if there are no indexed points.
+        """
+        queries = np.asarray(queries, dtype=np.float64).reshape(-1, 3)
+        indices = np.full(len(queries), -1, dtype=np.int64)
+        distances = np.full(len(queries), np.inf)
+
+        if not len(self._points) or not len(queries):
+            return indices, distances
+
+        # Queries outside of the grid are projected onto its bounds. Since
+        # the grid is convex, the squared distance from a query to any point
+        # is at least the squared distance from the query to its projection
+        # plus the squared distance from the projection to the point:
+        cells = self._cells(queries)
+        max_shell = np.max(
+            np.maximum(cells, self._shape - 1 - cells), axis=1
+        )
+        outside = queries - np.clip(queries, self._origin, self._bound)
+        outside = np.einsum("ij,ij->i", outside, outside)
+        active = np.arange(len(queries))
+        shell = 0
+
+        while len(active):
+            query_ids, point_ids = self._candidates(
+                cells[active], self._shell_offsets(shell, self.shape)
+            )
+            query_ids = active[query_ids]
+            candidate_distances = self._distances(
+                queries[query_ids], point_ids
+            )
+
+            # Best candidate per query (shortest distance, then lowest index):
+            sort = np.lexsort((point_ids, candidate_distances, query_ids))
+            query_ids = query_ids[sort]
+            first = np.ones(len(query_ids), dtype=bool)
+            first[1:] = query_ids[1:] != query_ids[:-1]
+            query_ids = query_ids[first]
+            best = candidate_distances[sort][first]
+            best_ids = point_ids[sort][first]
+
+            better = (best < distances[query_ids]) | (
+                (best == distances[query_ids])
+                & (best_ids < indices[query_ids])
+            )
+            indices[query_ids[better]] = best_ids[better]
+            distances[query_ids[better]] = best[better]
+
+            # Unvisited cells are at least `shell` cells away from the
+            # projected query:
+            done = (
+                distances[active] ** 2
+                <= outside[active] + (shell * self._cell_size) ** 2
+            ) | (max_shell[active] <= shell)
+            active = active[~done]
+            shell += 1
+
+        return indices, distances
+
+    def within(
+        self,
+        queries: np.ndarray,
+        radius: int | float
+    ) -> list[np.ndarray]:
+        """Get the indexed points within a radius of each query point.
+
+        Args:
+            queries (np.ndarray): (M, 3) query points.
+            radius (int | float): query radius.
+
+        Returns:
+            list[np.ndarray]: sorted indices of the points within the radius
+                of each query point.
+        """
+        queries = np.asarray(queries, dtype=np.float64).reshape(-1, 3)
+
+        if radius < 0:
+            raise ValueError(
+                "expected a non-negative radius for"
+                + f" {self.__class__.__name__}.within but got {radius}"
+                + " instead"
+            )
+
+        if not len(self._points) or not len(queries):
+            return [np.empty(0, dtype=np.int64) for _ in queries]
+
+        # Cell windows of the query spheres, bounded by the grid:
+        span = np.minimum(
+            int(np.ceil(2 * radius / self._cell_size)) + 1, self._shape
+        )
+        offsets = np.stack(np.meshgrid(
+            *[np.arange(count) for count in span], indexing="ij"
+        ), axis=-1).reshape(-1, 3)
+        query_ids, point_ids = self._candidates(
+            self._cells(queries - radius),
+            offsets,
+            self._cells(queries + radius, clip=False)
+        )
+
+        inside = self._distances(queries[query_ids], point_ids) <= radius
+        query_ids, point_ids = query_ids[inside], point_ids[inside]
+
+        sort = np.lexsort((point_ids, query_ids))
+        bounds = np.searchsorted(
+            query_ids[sort], np.arange(len(queries) + 1)
+        )
+
+        return np.split(point_ids[sort], bounds[1:-1])
+
+    def _cells(self, points: np.ndarray, clip: bool = True) -> np.ndarray:
+        """Get the grid cell of each point.
+
+        Args:
+            points (np.ndarray): (N, 3) points.
+            clip (bool, optional): whether to clip cells to the grid.
+                Defaults to True.
+
+        Returns:
+            np.ndarray: (N, 3) integer cell coordinates.
+        """
+        cells = np.floor((points - self._origin) / self._cell_size)
+
+        if clip:
+            cells = np.clip(cells, 0, self._shape - 1)
+
+        return cells.astype(np.int64)
+
+    def _keys(self, cells: np.ndarray) -> np.ndarray:
+        """Get the linear key of each grid cell.
+
+        Args:
+            cells (np.ndarray): (N, 3) in-grid cell coordinates.
+
+        Returns:
+            np.ndarray: (N,) cell keys.
+        """
+        return (
+            cells[:, 0] * self._shape[1] + cells[:, 1]
+        ) * self._shape[2] + cells[:, 2]
+
+    def _candidates(
+        self,
+        cells: np.ndarray,
+        offsets: np.ndarray,
+        upper: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get the points held by offset cells of each query cell.
+
+        Query cells are processed in chunks of at most `CHUNK_SIZE` cells.
+
+        Args:
+            cells (np.ndarray): (M, 3) query cells.
+            offsets (np.ndarray): (K, 3) cell offsets.
+            upper (np.ndarray | None, optional): (M, 3) inclusive upper cell
+                bounds of each query. Defaults to None (no bounds).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: query and sorted point indices of
+                each candidate pair.
+        """
+        rows = max(1, self.CHUNK_SIZE // max(len(offsets), 1))
+        query_ids, slots = [], []
+
+        for first in range(0, len(cells), rows):
+            neighbours = cells[first:first + rows, None, :] + offsets
+            valid = np.all(
+                (neighbours >= 0) & (neighbours < self._shape), axis=-1
+            )
+            if upper is not None:
+                valid &= np.all(
+                    neighbours <= upper[first:first + rows, None, :], axis=-1
+                )
+
+            chunk_ids, offset_ids = np.nonzero(valid)
+            keys = self._keys(neighbours[chunk_ids, offset_ids])
+            chunk_slots = np.minimum(
+                np.searchsorted(self._cell_keys, keys),
+                len(self._cell_keys) - 1
+            )
+            occupied = self._cell_keys[chunk_slots] == keys
+
+            query_ids.append(chunk_ids[occupied] + first)
+            slots.append(chunk_slots[occupied])
+
+        query_ids = np.concatenate(query_ids)
+        slots = np.concatenate(slots)
+
+        # Expand cell ranges into positions of the sorted order:
+        starts, counts = self._cell_starts[slots], (
+            self._cell_ends[slots] - self._cell_starts[slots]
+        )
+        query_ids = np.repeat(query_ids, counts)
+        positions = np.arange(counts.sum()) - np.repeat(
+            np.cumsum(counts) - counts - starts, counts
+        )
+
+        return query_ids, self._order[positions]
+
+    def _distances(
+        self,
+        queries: np.ndarray,
+        point_ids: np.ndarray
+    ) -> np.ndarray:
+        """Get the distances between query points and indexed points.
+
+        Args:
+            queries (np.ndarray): (N, 3) query points.
+            point_ids (np.ndarray): (N,) indexed point indices.
+
+        Returns:
+            np.ndarray: (N,) distances.
+        """
+        difference = self._points[point_ids] - queries
+        return np.sqrt(np.einsum("ij,ij->i", difference, difference))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _shell_offsets(
+        shell: int,
+        shape: tuple[int, int, int]
+    ) -> np.ndarray:
+        """Get the cell offsets at a Chebyshev distance.
+
+        Offsets that would leave a grid of the given shape from any of its
+        cells are discarded.
+
+        Args:
+            shell (int): Chebyshev distance.
+            shape (tuple[int, int, int]): number of grid cells on each axis.
+
+        Returns:
+            np.ndarray: (K, 3) read-only cell offsets.
+        """
+        offsets = np.stack(np.meshgrid(
+            *[
+                np.arange(-min(shell, count - 1), min(shell, count - 1) + 1)
+                for count in shape
+            ],
+            indexing="ij"
+        ), axis=-1).reshape(-1, 3)
+        offsets = offsets[np.abs(offsets).max(axis=1) == shell]
+        offsets.flags.writeable = False
+
+        return offsets
+
+    def __len__(self) -> int:
+        """Get number of indexed points.
+
+        Returns:
+            int: number of indexed points.
+        """
+        return len(self._points)
+
+    def __repr__(self) -> str:
+        """Get short index representation.
+
+        Returns:
+            str: short index representation.
+        """
+        return (
+            f"<UniformGridIndex of {len(self._points)} points in"
+            + f" {'x'.join(map(str, self.shape))} cells>"
+        )
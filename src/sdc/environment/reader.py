@@ -5,24 +5,64 @@ Author:
 """
 
 
+import glob
+import hashlib
 import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterator, Sequence
+
+import numpy as np
 
-from ..core.vector import Rotator3D, Vector3D
 from ..environment.track import Track
-from ..geometry.ring import Ring
+from .binary import BinaryTrackSequence, is_binary, write_binary
+
+
+class TrackSequenceError(ValueError):
+    """Track sequence validation error class.
+
+    Attributes:
+        errors (list[tuple[str, str]]): JSON path and description of each
+            invalid field.
+    """
+
+    def __init__(self, errors: list[tuple[str, str]]) -> None:
+        """Initialize a TrackSequenceError instance.
+
+        Args:
+            errors (list[tuple[str, str]]): JSON path and description of each
+                invalid field.
+        """
+        self.errors = errors
+        super().__init__(
+            f"found {len(errors)} invalid track sequence field(s):"
+            + "".join(f"\n    {path}: {message}" for path, message in errors)
+        )
 
 
 class TrackSequenceReader:
     """Track sequence reader class.
 
     This class is used to read a track sequence file and return a list of
-    tracks.
+    tracks. Tracks can also be streamed one at a time with `iter_tracks`,
+    which decodes the file incrementally, so that memory usage is bounded by
+    the largest track instead of the whole file.
+
+    Both JSON and binary track sequence files are supported, the latter
+    being detected by its magic bytes and memory-mapped, so that tracks are
+    only built when accessed.
 
     Attributes:
         path (str): track sequence file path.
-        track_sequence (list[Track]): track sequence.
+        track_sequence (Sequence[Track]): track sequence, read on first
+            access. It is a BinaryTrackSequence for binary files.
+        CHUNK_SIZE (int): initial number of characters read at once from
+            JSON files.
     """
 
+    CHUNK_SIZE = 2 ** 16
+
     def __init__(self, path: str) -> None:
         """Initialize a TrackSequenceReader instance.
 
@@ -30,7 +70,7 @@ class TrackSequenceReader:
             path (str): track sequence file path.
         """
         self.path = path
-        self._track_sequence = self.read()
+        self._track_sequence: Sequence[Track] | None = None
 
     @property
     def path(self) -> str:
@@ -56,35 +96,702 @@ class TrackSequenceReader:
             )
 
         self._path = value
+        self._track_sequence = None
 
     @property
-    def track_sequence(self) -> list[Track]:
+    def track_sequence(self) -> Sequence[Track]:
         """Get track sequence.
 
+        The file is read on first access, except for binary files, which are
+        memory-mapped instead.
+
         Returns:
-            list[Track]: track sequence.
+            Sequence[Track]: track sequence.
         """
+        if self._track_sequence is None:
+            self._track_sequence = (
+                BinaryTrackSequence(self.path)
+                if is_binary(self.path) else
+                self.read()
+            )
+
         return self._track_sequence
 
     def read(self) -> list[Track]:
         """Read track sequence file.
 
+        JSON files are validated as a whole before any track is built, so
+        that every invalid field is reported at once.
+
         Returns:
             list[Track]: track sequence.
         """
+        if is_binary(self.path):
+            return list(BinaryTrackSequence(self.path))
+
+        return _build_tracks(*validate_tracks(list(self._iter_values())))
+
+    def iter_tracks(self) -> Iterator[Track]:
+        """Read track sequence file lazily, one track at a time.
+
+        JSON tracks are validated one at a time, as they are decoded.
+
+        Yields:
+            Track: next track of the sequence.
+        """
+        if is_binary(self.path):
+            yield from BinaryTrackSequence(self.path)
+        else:
+            for item in self._iter_values():
+                yield from _build_tracks(*validate_tracks([item]))
+
+    def to_binary(self, path: str) -> None:
+        """Convert the track sequence file to the binary format.
+
+        JSON tracks are decoded and validated one at a time and only their
+        coordinates are kept until the binary file is written. Every invalid
+        field of the file is reported at once.
+
+        Args:
+            path (str): output binary track sequence file path.
+        """
+        if is_binary(self.path):
+            sequence = BinaryTrackSequence(self.path)
+            write_binary(
+                path,
+                sequence.starts,
+                sequence.ends,
+                sequence.offsets,
+                sequence.positions,
+                sequence.rotations
+            )
+            return
+
+        arrays, errors = [], []
+
+        for item in self._iter_values():
+            try:
+                arrays.append(validate_tracks([item]))
+            except TrackSequenceError as error:
+                errors.extend(error.errors)
+
+        if errors:
+            raise TrackSequenceError(errors)
+
+        starts, ends, offsets, positions, rotations = zip(
+            *arrays
+        ) if arrays else ((),) * 5
+
+        write_binary(
+            path,
+            np.concatenate([np.empty((0, 3)), *starts]),
+            np.concatenate([np.empty((0, 3)), *ends]),
+            np.cumsum([0, *(offset[-1] for offset in offsets)]),
+            np.concatenate([np.empty((0, 3)), *positions]),
+            np.concatenate([np.empty((0, 3)), *rotations])
+        )
+
+    def _iter_values(self) -> Iterator[tuple[str, Any]]:
+        """Decode JSON track sequence file lazily, one track at a time.
+
+        The top-level object is scanned incrementally and each track value is
+        decoded with `json.JSONDecoder.raw_decode` as soon as it is fully
+        buffered. The read size doubles while a track is incomplete, so large
+        tracks are decoded in linear time.
+
+        Yields:
+            tuple[str, Any]: next track name and decoded track.
+        """
+        decoder = json.JSONDecoder()
+
         with open(self.path, mode="r", encoding="utf-8") as fp:
-            data = json.load(fp)
-
-        return [
-            Track(
-                Vector3D(*value["start"]),
-                Vector3D(*value["end"]),
-                [
-                    Ring(
-                        Vector3D(*ring["position"]),
-                        Rotator3D(*ring["rotation"]),
+            buffer, index, size = "", 0, self.CHUNK_SIZE
+            expected = "{"
+
+            while True:
+                # Skip whitespace, reading more data if needed:
+                while True:
+                    index = self._skip_whitespace(buffer, index)
+
+                    if index < len(buffer):
+                        break
+
+                    chunk = fp.read(size)
+                    if not chunk and expected == "end":
+                        return
+                    if not chunk:
+                        raise json.JSONDecodeError(
+                            "unexpected end of track sequence file",
+                            buffer,
+                            index
+                        )
+
+                    buffer, index = buffer[index:] + chunk, 0
+
+                char = buffer[index]
+
+                if expected == "{":
+                    if char != "{":
+                        raise json.JSONDecodeError(
+                            "expected a track sequence object", buffer, index
+                        )
+                    index, expected = index + 1, "first"
+                elif char == "}" and expected in ("first", ","):
+                    index, expected = index + 1, "end"
+                elif char == "," and expected == ",":
+                    index, expected = index + 1, "key"
+                elif char == ":" and expected == ":":
+                    index, expected = index + 1, "value"
+                elif expected in ("first", "key", "value"):
+                    try:
+                        value, end = decoder.raw_decode(buffer, index)
+                    except json.JSONDecodeError:
+                        chunk = fp.read(max(size, len(buffer)))
+                        if not chunk:
+                            raise
+
+                        buffer, index = buffer[index:] + chunk, 0
+                        continue
+
+                    if expected != "value" and not isinstance(value, str):
+                        raise json.JSONDecodeError(
+                            "expected a track name", buffer, index
+                        )
+
+                    buffer, index = buffer[end:], 0
+
+                    if expected != "value":
+                        name, expected = value, ":"
+                    else:
+                        expected = ","
+                        yield name, value
+                else:
+                    raise json.JSONDecodeError(
+                        f"unexpected character {char!r}", buffer, index
                     )
-                    for ring in value["rings"]
-                ]
-            ) for value in data.values()
-        ]
+
+    @staticmethod
+    def _skip_whitespace(buffer: str, index: int) -> int:
+        """Get the index of the next non-whitespace character.
+
+        Args:
+            buffer (str): decoding buffer.
+            index (int): start index.
+
+        Returns:
+            int: index of the next non-whitespace character, or the buffer
+                length if there is none.
+        """
+        while index < len(buffer) and buffer[index] in " \t\n\r":
+            index += 1
+
+        return index
+
+
+class MultiTrackSequenceReader:
+    """Multiple track sequence file reader class.
+
+    This class reads the track sequence files matched by a directory or glob
+    pattern, in path order. Parsed files are kept in an on-disk cache in the
+    binary track sequence format, keyed by file path, modification time and
+    content hash. Cache misses are parsed in a process pool.
+
+    The cache only skips parsing: warm starts still read and hash every
+    matched file in full before memory-mapping the cached tracks. The cache
+    lives in a per-user directory by default and is bounded by
+    `max_cache_size`; least recently used entries are evicted after each
+    load, except for those of the files being loaded.
+
+    Attributes:
+        pattern (str): track sequence directory or glob pattern.
+        paths (list[str]): matched track sequence file paths.
+        cache_dir (str): parsed track cache directory.
+        max_cache_size (int): maximum parsed track cache size in bytes.
+        max_workers (int | None): maximum number of parsing processes.
+        sequences (list[Sequence[Track]]): track sequence of each file.
+        track_sequence (list[Track]): track sequence of all files.
+        cache_hits (int): number of files loaded from the cache.
+        cache_misses (int): number of files parsed into the cache.
+        DEFAULT_CACHE_DIR (str): default parsed track cache directory, under
+            the per-user cache directory of the platform.
+        DEFAULT_MAX_CACHE_SIZE (int): default maximum parsed track cache size
+            in bytes.
+    """
+
+    DEFAULT_CACHE_DIR = os.path.join(
+        os.environ.get("LOCALAPPDATA" if os.name == "nt" else "XDG_CACHE_HOME")
+        or os.path.join(os.path.expanduser("~"), ".cache"),
+        "sdc",
+        "tracks"
+    )
+    DEFAULT_MAX_CACHE_SIZE = 2 ** 30  # [B]
+
+    def __init__(
+        self,
+        pattern: str,
+        cache_dir: str | None = None,
+        max_workers: int | None = None,
+        max_cache_size: int | None = None
+    ) -> None:
+        """Initialize a MultiTrackSequenceReader instance.
+
+        Args:
+            pattern (str): track sequence directory (all of its JSON files are
+                read) or glob pattern.
+            cache_dir (str | None, optional): parsed track cache directory.
+                Defaults to None (DEFAULT_CACHE_DIR).
+            max_workers (int | None, optional): maximum number of parsing
+                processes. Defaults to None (number of processors).
+            max_cache_size (int | None, optional): maximum parsed track cache
+                size in bytes. Defaults to None (DEFAULT_MAX_CACHE_SIZE).
+        """
+        if not isinstance(pattern, str):
+            raise TypeError(
+                "expected type str for"
+                + f" {self.__class__.__name__}.pattern but got"
+                + f" {type(pattern).__name__} instead"
+            )
+
+        self._pattern = pattern
+        self._cache_dir = (
+            self.DEFAULT_CACHE_DIR if cache_dir is None else cache_dir
+        )
+        self._max_workers = max_workers
+        self._max_cache_size = (
+            self.DEFAULT_MAX_CACHE_SIZE if max_cache_size is None
+            else max_cache_size
+        )
+        self._sequences: list[Sequence[Track]] | None = None
+        self._cache_hits = self._cache_misses = 0
+
+    @property
+    def pattern(self) -> str:
+        """Get track sequence directory or glob pattern.
+
+        Returns:
+            str: track sequence directory or glob pattern.
+        """
+        return self._pattern
+
+    @property
+    def paths(self) -> list[str]:
+        """Get matched track sequence file paths.
+
+        Returns:
+            list[str]: matched track sequence file paths, sorted.
+        """
+        pattern = self._pattern
+
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, "*.json")
+
+        return sorted(
+            path for path in glob.glob(pattern) if os.path.isfile(path)
+        )
+
+    @property
+    def cache_dir(self) -> str:
+        """Get parsed track cache directory.
+
+        Returns:
+            str: parsed track cache directory.
+        """
+        return self._cache_dir
+
+    @property
+    def max_cache_size(self) -> int:
+        """Get maximum parsed track cache size.
+
+        Returns:
+            int: maximum parsed track cache size in bytes.
+        """
+        return self._max_cache_size
+
+    @property
+    def max_workers(self) -> int | None:
+        """Get maximum number of parsing processes.
+
+        Returns:
+            int | None: maximum number of parsing processes.
+        """
+        return self._max_workers
+
+    @property
+    def sequences(self) -> list[Sequence[Track]]:
+        """Get track sequence of each file.
+
+        Files are loaded on first access.
+
+        Returns:
+            list[Sequence[Track]]: track sequence of each file.
+        """
+        if self._sequences is None:
+            self.load()
+
+        return self._sequences  # type: ignore
+
+    @property
+    def track_sequence(self) -> list[Track]:
+        """Get track sequence of all files.
+
+        Returns:
+            list[Track]: track sequence of all files.
+        """
+        return list(self.iter_tracks())
+
+    @property
+    def cache_hits(self) -> int:
+        """Get number of files loaded from the cache.
+
+        Returns:
+            int: number of files loaded from the cache.
+        """
+        return self._cache_hits
+
+    @property
+    def cache_misses(self) -> int:
+        """Get number of files parsed into the cache.
+
+        Returns:
+            int: number of files parsed into the cache.
+        """
+        return self._cache_misses
+
+    def load(self) -> None:
+        """Load all matched files, parsing cache misses in a process pool.
+
+        Binary track sequence files are memory-mapped directly and are not
+        counted as cache hits or misses.
+        """
+        os.makedirs(self._cache_dir, exist_ok=True)
+
+        targets, misses, hits = [], [], 0
+        for path in self.paths:
+            if is_binary(path):
+                targets.append(path)
+                continue
+
+            target = os.path.join(
+                self._cache_dir, f"{self.cache_key(path)}.sdct"
+            )
+            targets.append(target)
+
+            if os.path.exists(target):
+                os.utime(target)  # Mark as recently used.
+                hits += 1
+            else:
+                misses.append((path, target))
+
+        if len(misses) > 1 and self._max_workers != 1:
+            with ProcessPoolExecutor(self._max_workers) as executor:
+                list(executor.map(_convert_to_binary, *zip(*misses)))
+        else:
+            for path, target in misses:
+                _convert_to_binary(path, target)
+
+        self._cache_hits += hits
+        self._cache_misses += len(misses)
+        self._sequences = [BinaryTrackSequence(path) for path in targets]
+        self._evict(set(targets))
+
+    def _evict(self, keep: set[str]) -> None:
+        """Evict least recently used cache entries beyond the size bound.
+
+        Args:
+            keep (set[str]): cache entry paths that must not be evicted.
+        """
+        entries = []
+        for entry in os.scandir(self._cache_dir):
+            if entry.name.endswith(".sdct") and entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self._max_cache_size:
+                break
+
+            if path in keep:
+                continue
+
+            try:
+                os.remove(path)
+            except OSError:  # Removed by another process or still open.
+                continue
+
+            size -= entry_size
+
+    def iter_tracks(self) -> Iterator[Track]:
+        """Read the tracks of all files lazily, one at a time.
+
+        Yields:
+            Track: next track of the sequence.
+        """
+        for sequence in self.sequences:
+            yield from sequence
+
+    @staticmethod
+    def cache_key(path: str) -> str:
+        """Get the cache key of a track sequence file.
+
+        Args:
+            path (str): track sequence file path.
+
+        Returns:
+            str: hexadecimal digest of the absolute file path, its
+                modification time and its content hash.
+        """
+        content = hashlib.sha256()
+        with open(path, mode="rb") as fp:
+            for chunk in iter(lambda: fp.read(2 ** 20), b""):
+                content.update(chunk)
+
+        return hashlib.sha256(
+            f"{os.path.abspath(path)}\0{os.stat(path).st_mtime_ns}\0".encode()
+            + content.digest()
+        ).hexdigest()
+
+    def __repr__(self) -> str:
+        """Get short reader representation.
+
+        Returns:
+            str: short reader representation.
+        """
+        return (
+            f"<MultiTrackSequenceReader of {self._pattern!r}"
+            + f" ({self._cache_hits} cache hits,"
+            + f" {self._cache_misses} cache misses)>"
+        )
+
+
+def _convert_to_binary(path: str, target: str) -> None:
+    """Convert a track sequence file to the binary format atomically.
+
+    Args:
+        path (str): track sequence file path.
+        target (str): output binary track sequence file path.
+    """
+    temporary = f"{target}.{os.getpid()}.tmp"
+    TrackSequenceReader(path).to_binary(temporary)
+    os.replace(temporary, target)
+
+
+def validate_tracks(
+    items: list[tuple[str, Any]]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Validate decoded tracks and convert them to coordinate arrays.
+
+    Starts, ends, ring positions and ring rotations of all tracks are stacked
+    into arrays whose shape, dtype and finiteness are checked at once. Only if
+    that fails are the tracks checked one field at a time, to locate every
+    invalid field.
+
+    Args:
+        items (list[tuple[str, Any]]): name and decoded value of each track.
+
+    Raises:
+        TrackSequenceError: if any track field is invalid.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+            (T, 3) track starts, (T, 3) track ends, (T + 1,) ring offsets of
+            each track, (R, 3) ring positions and (R, 3) ring rotations in
+            degrees.
+    """
+    try:
+        values = [value for _, value in items]
+        rings = [value["rings"] for value in values]
+
+        if not all(isinstance(track_rings, list) for track_rings in rings):
+            raise TypeError
+
+        return (
+            _vector_array([value["start"] for value in values]),
+            _vector_array([value["end"] for value in values]),
+            np.cumsum([0, *map(len, rings)]),
+            _vector_array([
+                ring["position"] for track_rings in rings
+                for ring in track_rings
+            ]),
+            _vector_array([
+                ring["rotation"] for track_rings in rings
+                for ring in track_rings
+            ])
+        )
+    except (KeyError, TypeError, ValueError):
+        return _validate_fields(items)
+
+
+def _vector_array(values: list[Any]) -> np.ndarray:
+    """Convert a list of vectors to a validated (N, 3) array.
+
+    Args:
+        values (list[Any]): decoded vectors.
+
+    Raises:
+        ValueError: if the vectors are not finite numeric triples.
+
+    Returns:
+        np.ndarray: (N, 3) float64 array.
+    """
+    array = np.asarray(values) if values else np.empty((0, 3))
+
+    if (
+        array.dtype.kind not in "biuf"
+        or array.shape != (len(values), 3)
+        or not np.isfinite(array).all()
+    ):
+        raise ValueError
+
+    return array.astype(np.float64)
+
+
+def _validate_fields(
+    items: list[tuple[str, Any]]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Validate decoded tracks one field at a time.
+
+    Args:
+        items (list[tuple[str, Any]]): name and decoded value of each track.
+
+    Raises:
+        TrackSequenceError: if any track field is invalid.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+            same arrays as `validate_tracks`.
+    """
+    errors: list[tuple[str, str]] = []
+    arrays: tuple[list, list, list, list, list] = ([], [], [0], [], [])
+
+    def vector(value: dict, key: str, path: str) -> list[float]:
+        """Validate a vector field, recording an error if it is invalid.
+
+        Args:
+            value (dict): decoded object containing the field.
+            key (str): field name.
+            path (str): JSON path of the field.
+
+        Returns:
+            list[float]: vector components, or zeros if the field is invalid.
+        """
+        if key not in value:
+            errors.append((path, "missing field"))
+            return [0.0] * 3
+
+        vector = value[key]
+        if (
+            not isinstance(vector, list)
+            or len(vector) != 3
+            or not all(isinstance(item, (int, float)) for item in vector)
+            or not all(map(_is_finite, vector))
+        ):
+            errors.append((path, f"expected 3 finite numbers, got {vector!r}"))
+            return [0.0] * 3
+
+        return [float(item) for item in vector]
+
+    def field(value: dict, key: str, path: str, kind: type) -> Any:
+        """Validate the type of a field, recording an error if it is invalid.
+
+        Args:
+            value (dict): decoded object containing the field.
+            key (str): field name.
+            path (str): JSON path of the field.
+            kind (type): expected field type.
+
+        Returns:
+            Any: field value, or None if the field is invalid.
+        """
+        if key not in value:
+            errors.append((path, "missing field"))
+        elif not isinstance(value[key], kind):
+            errors.append((
+                path,
+                f"expected {kind.__name__}, got {type(value[key]).__name__}"
+            ))
+        else:
+            return value[key]
+
+        return None
+
+    for name, value in items:
+        path = f"$.{name}"
+
+        if not isinstance(value, dict):
+            errors.append((path, f"expected dict, got {type(value).__name__}"))
+            continue
+
+        for key, array in zip(("start", "end"), arrays):
+            array.append(vector(value, key, f"{path}.{key}"))
+
+        rings = field(value, "rings", f"{path}.rings", list) or []
+        arrays[2].append(arrays[2][-1] + len(rings))
+
+        for i, ring in enumerate(rings):
+            ring_path = f"{path}.rings[{i}]"
+
+            if not isinstance(ring, dict):
+                errors.append((
+                    ring_path, f"expected dict, got {type(ring).__name__}"
+                ))
+                continue
+
+            for key, array in zip(("position", "rotation"), arrays[3:]):
+                array.append(vector(ring, key, f"{ring_path}.{key}"))
+
+    if errors:
+        raise TrackSequenceError(errors)
+
+    return (
+        np.array(arrays[0], dtype=np.float64).reshape(-1, 3),
+        np.array(arrays[1], dtype=np.float64).reshape(-1, 3),
+        np.array(arrays[2]),
+        np.array(arrays[3], dtype=np.float64).reshape(-1, 3),
+        np.array(arrays[4], dtype=np.float64).reshape(-1, 3)
+    )
+
+
+def _is_finite(value: int | float) -> bool:
+    """Check whether a number is finite and representable as a float.
+
+    Args:
+        value (int | float): number.
+
+    Returns:
+        bool: True if the number is finite, False otherwise.
+    """
+    try:
+        return math.isfinite(value)
+    except OverflowError:
+        return False
+
+
+def _build_tracks(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    offsets: np.ndarray,
+    positions: np.ndarray,
+    rotations: np.ndarray
+) -> list[Track]:
+    """Build tracks from validated coordinate arrays.
+
+    Args:
+        starts (np.ndarray): (T, 3) track starts.
+        ends (np.ndarray): (T, 3) track ends.
+        offsets (np.ndarray): (T + 1,) ring offsets of each track.
+        positions (np.ndarray): (R, 3) ring positions.
+        rotations (np.ndarray): (R, 3) ring rotations in degrees.
+
+    Returns:
+        list[Track]: tracks.
+    """
+    return [
+        Track._from_arrays(
+            starts[i],
+            ends[i],
+            positions[offsets[i]:offsets[i + 1]],
+            rotations[offsets[i]:offsets[i + 1]]
+        )
+        for i in range(len(starts))
+    ]
@@ -5,24 +5,66 @@ Author:
 """
 
 
+from __future__ import annotations
+
+import hashlib
+
+import numpy as np
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+
 from ..core.gradient import ColorGradient
-from ..core.vector import Vector3D
-from ..geometry.ring import Ring
+from ..core.vector import (
+    Rotator3D,
+    Vector3D,
+    Vector3DArray,
+    as_points,
+    distance3D,
+    distances3D,
+    next_version,
+    rotation_matrices
+)
+from ..geometry.ring import Ring, torus_sdf, torus_surface
+from .index import UniformGridIndex
 
 
 class Track:
     """Track representation class.
 
     This class is used to represent a track composed of a start point, an end
-    point and a sequence of rings.
+    point and a sequence of rings. Start, end and the ring list are copied on
+    assignment. Cached data is keyed on the track version, so it is rebuilt
+    after any change to the track, including in-place changes to its rings
+    and vectors.
 
     Attributes:
         start (Vector3D): track start.
         end (Vector3D): track end.
         rings (list[Ring]): track rings.
+        version (int): modification version of the track.
         waypoints (list[Vector3D]): track waypoints.
+        waypoint_array (np.ndarray): (N, 3) cached track waypoints.
+        segment_lengths (np.ndarray): (N - 1,) cached distances between
+            consecutive waypoints.
+        cumulative_distances (np.ndarray): (N,) cached distances from the
+            start to each waypoint along the track.
+        path_length (float): cached total track distance.
+        index (UniformGridIndex): cached spatial index of ring positions.
+        COLLISION_CHUNK_SIZE (int): maximum number of ring-point pairs
+            evaluated at once by `detect_collisions`.
+        VERTEX_BUDGET (int): ring vertices per plot of default figure size.
+        DEFAULT_FIGURE_SIZE (tuple[float, float]): reference figure size for
+            the vertex budget, in inches.
+        LOD_COMPLEXITY_RANGE (tuple[int, int]): allowed level-of-detail ring
+            geometry complexity range.
     """
 
+    COLLISION_CHUNK_SIZE = 2 ** 20
+    VERTEX_BUDGET = 40_000
+    LOD_COMPLEXITY_RANGE = (8, 21)
+    DEFAULT_FIGURE_SIZE = (6.4, 4.8)  # [in]
+
     def __init__(
         self,
         start: Vector3D,
@@ -36,10 +78,56 @@ class Track:
             end (Vector3D): track end.
             rings (list[Ring]): track rings.
         """
+        self._waypoint_array = None
+        self._segment_lengths = None
+        self._cumulative_distances = None
+        self._path_length = None
+        self._index = None
+        self._cache_version = None
+        self._fingerprint: str | None = None
+        self._fingerprint_version = 0
         self.start = start
         self.end = end
         self.rings = rings
 
+    @classmethod
+    def _from_arrays(
+        cls,
+        start: np.ndarray,
+        end: np.ndarray,
+        positions: np.ndarray,
+        rotations: np.ndarray
+    ) -> Track:
+        """Build a track from trusted coordinate arrays.
+
+        Vectors and rotators are created without type checks, so inputs must
+        already be finite float arrays of the expected shapes.
+
+        Args:
+            start (np.ndarray): (3,) track start.
+            end (np.ndarray): (3,) track end.
+            positions (np.ndarray): (N, 3) ring positions.
+            rotations (np.ndarray): (N, 3) ring rotations in degrees, as in
+                track files.
+
+        Returns:
+            Track: track.
+        """
+        return cls(
+            Vector3D._from_floats(*np.asarray(start, dtype=float).tolist()),
+            Vector3D._from_floats(*np.asarray(end, dtype=float).tolist()),
+            [
+                Ring(
+                    Vector3D._from_floats(*position),
+                    Rotator3D._from_floats(*rotation)
+                )
+                for position, rotation in zip(
+                    np.asarray(positions, dtype=float).tolist(),
+                    np.radians(np.asarray(rotations, dtype=float)).tolist()
+                )
+            ]
+        )
+
     @property
     def start(self) -> Vector3D:
         """Get track start.
@@ -63,7 +151,8 @@ class Track:
                 + f" {type(value).__name__} instead"
             )
 
-        self._start = value
+        self._start = value.copy()
+        self._version = next_version()
 
     @property
     def end(self) -> Vector3D:
@@ -88,16 +177,21 @@ class Track:
                 + f" {type(value).__name__} instead"
             )
 
-        self._end = value
+        self._end = value.copy()
+        self._version = next_version()
 
     @property
     def rings(self) -> list[Ring]:
         """Get track rings.
 
+        The track keeps its own copy of the ring list, so rings must be added
+        or removed by setting this attribute. The rings themselves are shared
+        and can be modified in place.
+
         Returns:
-            list[Ring]: track rings.
+            list[Ring]: new list of the track rings.
         """
-        return self._rings
+        return list(self._rings)
 
     @rings.setter
     def rings(self, value: list[Ring]) -> None:
@@ -120,7 +214,25 @@ class Track:
                     + f"on element {element} instead"
                 )
 
-        self._rings = value
+        self._rings = tuple(value)
+        self._version = next_version()
+
+    @property
+    def version(self) -> int:
+        """Get modification version of the track.
+
+        The version changes whenever the start, end or rings of the track are
+        set, or any of them is changed in place.
+
+        Returns:
+            int: modification version of the track.
+        """
+        return max(
+            self._version,
+            self._start._version,
+            self._end._version,
+            *[ring.version for ring in self._rings]
+        )
 
     @property
     def waypoints(self) -> list[Vector3D]:
@@ -131,6 +243,383 @@ class Track:
         """
         return [self.start, *[ring.position for ring in self._rings], self.end]
 
+    @property
+    def waypoint_array(self) -> np.ndarray:
+        """Get cached track waypoints.
+
+        Returns:
+            np.ndarray: (N, 3) read-only track waypoints.
+        """
+        self._check_cache()
+
+        if self._waypoint_array is None:
+            array = np.array(
+                [tuple(waypoint) for waypoint in self.waypoints],
+                dtype=np.float64
+            )
+            array.flags.writeable = False
+            self._waypoint_array = array
+
+        return self._waypoint_array
+
+    @property
+    def segment_lengths(self) -> np.ndarray:
+        """Get cached distances between consecutive track waypoints.
+
+        Returns:
+            np.ndarray: (N - 1,) read-only segment lengths.
+        """
+        self._check_cache()
+
+        if self._segment_lengths is None:
+            array = self.waypoint_array
+            lengths = distances3D(array[:-1], array[1:])
+            lengths.flags.writeable = False
+            self._segment_lengths = lengths
+
+        return self._segment_lengths
+
+    @property
+    def cumulative_distances(self) -> np.ndarray:
+        """Get cached distances from the start to each track waypoint.
+
+        Returns:
+            np.ndarray: (N,) read-only cumulative distances, starting at 0.
+        """
+        self._check_cache()
+
+        if self._cumulative_distances is None:
+            distances = np.concatenate(
+                ([0.0], np.cumsum(self.segment_lengths))
+            )
+            distances.flags.writeable = False
+            self._cumulative_distances = distances
+
+        return self._cumulative_distances
+
+    @property
+    def path_length(self) -> float:
+        """Get cached total track distance.
+
+        Returns:
+            float: sum of the distances between consecutive waypoints.
+        """
+        self._check_cache()
+
+        if self._path_length is None:
+            self._path_length = float(self.segment_lengths.sum())
+
+        return self._path_length
+
+    def distance_remaining(
+        self,
+        index: int,
+        position: Vector3D | None = None
+    ) -> float:
+        """Get the distance left along the track from a waypoint.
+
+        Args:
+            index (int): index of the next waypoint.
+            position (Vector3D | None, optional): current position. If given,
+                its distance to the waypoint is added. Defaults to None.
+
+        Returns:
+            float: distance from the waypoint (or the position, through the
+                waypoint) to the end of the track.
+        """
+        distances = self.cumulative_distances
+        remaining = float(distances[-1] - distances[index])
+
+        if position is not None:
+            remaining += distance3D(
+                position,
+                Vector3D._from_floats(*self.waypoint_array[index].tolist())
+            )
+
+        return remaining
+
+    @property
+    def index(self) -> UniformGridIndex:
+        """Get cached spatial index of ring positions.
+
+        The index is built on first access and rebuilt whenever the track
+        version changes, like the rest of the cached waypoint data.
+
+        Returns:
+            UniformGridIndex: spatial index of ring positions.
+        """
+        self._check_cache()
+
+        if self._index is None:
+            self._index = UniformGridIndex(self.waypoint_array[1:-1])
+
+        return self._index
+
+    def nearest_rings(
+        self,
+        points: Vector3DArray | np.ndarray | list[Vector3D]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get the nearest ring to each point.
+
+        Args:
+            points (Vector3DArray | np.ndarray | list[Vector3D]): query
+                points.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: (N,) nearest ring indices and (N,)
+                distances to their positions. Indices are -1 and distances
+                are infinite if the track has no rings.
+        """
+        return self.index.nearest(as_points(points))
+
+    def rings_within(
+        self,
+        points: Vector3DArray | np.ndarray | list[Vector3D],
+        radius: int | float
+    ) -> list[np.ndarray]:
+        """Get the rings within a radius of each point.
+
+        Args:
+            points (Vector3DArray | np.ndarray | list[Vector3D]): query
+                points.
+            radius (int | float): query radius.
+
+        Returns:
+            list[np.ndarray]: sorted indices of the rings whose positions are
+                within the radius of each point.
+        """
+        return self.index.within(as_points(points), radius)
+
+    def fingerprint(self) -> str:
+        """Get track content fingerprint.
+
+        The fingerprint is a SHA-256 digest of the float64 start and end of
+        the track and the fingerprints of its rings, so it is stable across
+        runs and processes and can be used to key on-disk caches. It is
+        memoized until the track version changes, so it also reflects changes
+        made to the rings in place.
+
+        Tracks are mutable, so they are hashed by identity rather than by
+        this fingerprint.
+
+        Returns:
+            str: hexadecimal track fingerprint.
+        """
+        version = self.version
+
+        if self._fingerprint is None or self._fingerprint_version != version:
+            digest = hashlib.sha256(
+                np.array((*self._start, *self._end), dtype=np.float64)
+                .tobytes()
+            )
+            for ring in self._rings:
+                digest.update(bytes.fromhex(ring.fingerprint()))
+
+            self._fingerprint = digest.hexdigest()
+            self._fingerprint_version = version
+
+        return self._fingerprint
+
+    def _check_cache(self) -> None:
+        """Reset cached waypoint data and index if the track has changed."""
+        version = self.version
+
+        if version != self._cache_version:
+            self._waypoint_array = None
+            self._segment_lengths = None
+            self._cumulative_distances = None
+            self._path_length = None
+            self._index = None
+            self._cache_version = version
+
+    def build_surfaces(
+        self,
+        dtype: type = np.float64,
+        complexity: int | None = None
+    ) -> np.ndarray:
+        """Build the geometry surfaces of all rings of the track at once.
+
+        Rotation matrices, scales and positions of every ring are stacked and
+        applied to the shared local ring geometry in a single operation. Each
+        ring surface is then set to a view into the resulting array, until any
+        of its geometry attributes changes.
+
+        Args:
+            dtype (type, optional): output data type. Defaults to np.float64.
+            complexity (int | None, optional): geometry complexity override
+                for all rings. Ring surfaces are not replaced by views if it
+                differs from their own complexity. Defaults to None (use the
+                complexity of the rings).
+
+        Returns:
+            np.ndarray: (R, 3, C, C) ring surfaces, where R is the number of
+                rings and C is their geometry complexity.
+        """
+        complexities = {ring.complexity for ring in self._rings}
+
+        if complexity is None and len(complexities) > 1:
+            raise ValueError(
+                "expected a single ring complexity for"
+                + f" {self.__class__.__name__}.build_surfaces but got"
+                + f" {sorted(complexities)} instead"
+            )
+
+        if not complexities:
+            return np.empty((0, 3, 0, 0), dtype=dtype)
+
+        is_native = complexity is None or complexities == {complexity}
+        complexity = complexities.pop() if complexity is None else complexity
+
+        # Local surfaces (broadcast if shared by all rings):
+        local_surfaces = [
+            torus_surface(complexity, ring.tube_radius, ring.hole_radius)
+            for ring in self._rings
+        ]
+        if len({id(surface) for surface in local_surfaces}) == 1:
+            local = local_surfaces[0][np.newaxis]
+        else:
+            local = np.stack(local_surfaces)
+
+        # Stacked transformations:
+        matrices = rotation_matrices([ring.rotation for ring in self._rings])
+        scales = np.array([tuple(ring.scale) for ring in self._rings])
+        positions = np.array([tuple(ring.position) for ring in self._rings])
+
+        surfaces = np.matmul(
+            matrices.astype(dtype),
+            local.reshape(len(local), 3, -1).astype(dtype)
+        )
+        surfaces *= scales.astype(dtype).reshape(-1, 3, 1)
+        surfaces += positions.astype(dtype).reshape(-1, 3, 1)
+        surfaces = surfaces.reshape(-1, 3, complexity, complexity)
+
+        if is_native:
+            for ring, surface in zip(self._rings, surfaces):
+                ring._surface = surface
+                ring._surface_version = ring.version
+
+        return surfaces
+
+    def lod_complexity(
+        self,
+        figure_size: tuple[float, float] = DEFAULT_FIGURE_SIZE,
+        vertex_budget: int | None = None
+    ) -> int:
+        """Get the level-of-detail ring geometry complexity for a plot.
+
+        The vertex budget is scaled by the figure area and split evenly among
+        all rings. The resulting complexity is bounded by
+        `LOD_COMPLEXITY_RANGE` and never exceeds the complexity of the rings.
+
+        Args:
+            figure_size (tuple[float, float], optional): figure size in
+                inches. Defaults to DEFAULT_FIGURE_SIZE.
+            vertex_budget (int | None, optional): ring vertices per plot of
+                default figure size. Defaults to None (VERTEX_BUDGET).
+
+        Returns:
+            int: ring geometry complexity.
+        """
+        budget = (
+            (self.VERTEX_BUDGET if vertex_budget is None else vertex_budget)
+            * figure_size[0] * figure_size[1]
+            / (self.DEFAULT_FIGURE_SIZE[0] * self.DEFAULT_FIGURE_SIZE[1])
+        )
+        min_complexity, max_complexity = self.LOD_COMPLEXITY_RANGE
+        max_complexity = min(
+            max_complexity,
+            max((ring.complexity for ring in self._rings), default=0)
+        )
+
+        complexity = int((budget / max(len(self._rings), 1)) ** .5)
+
+        return max(
+            min(complexity, max_complexity),
+            min(min_complexity, max_complexity)
+        )
+
+    def detect_collisions(
+        self,
+        points: Vector3DArray | np.ndarray | list[Vector3D]
+    ) -> tuple[int | None, int | None, float]:
+        """Detect collisions between a trajectory and the ring tubes.
+
+        The trajectory is transformed into the local frame of every ring and
+        evaluated against the torus signed distance function of each of them
+        in a vectorized pass. Rings are processed in chunks of at most
+        `COLLISION_CHUNK_SIZE` ring-point pairs to bound memory usage.
+
+        Args:
+            points (Vector3DArray | np.ndarray | list[Vector3D]): (N, 3)
+                trajectory points.
+
+        Returns:
+            tuple[int | None, int | None, float]: index of the first colliding
+                trajectory point, index of the ring it collides with (both
+                None if there are no collisions) and minimum clearance
+                between the trajectory and any ring tube.
+        """
+        points = Vector3DArray(points).array
+        first_step, first_ring, min_clearance = None, None, np.inf
+
+        if not (len(points) and self._rings):
+            return first_step, first_ring, float(min_clearance)
+
+        matrices = rotation_matrices([ring.rotation for ring in self._rings])
+        positions = np.array([tuple(ring.position) for ring in self._rings])
+        scales = np.array([tuple(ring.scale) for ring in self._rings])
+        radii = np.array([
+            (ring.tube_radius, ring.hole_radius) for ring in self._rings
+        ])
+
+        chunk = max(1, self.COLLISION_CHUNK_SIZE // len(points))
+        for i in range(0, len(self._rings), chunk):
+            ring_slice = slice(i, i + chunk)
+
+            # (R, N, 3) local points and (R, N) signed distances:
+            local = np.matmul(
+                (points - positions[ring_slice, np.newaxis])
+                / scales[ring_slice, np.newaxis],
+                matrices[ring_slice]
+            )
+            distances = torus_sdf(
+                local,
+                radii[ring_slice, 0, np.newaxis],
+                radii[ring_slice, 1, np.newaxis]
+            )
+
+            min_clearance = min(min_clearance, distances.min())
+
+            colliding = distances < 0
+            steps = np.flatnonzero(colliding.any(axis=0))
+            if len(steps) and (first_step is None or steps[0] < first_step):
+                first_step = int(steps[0])
+                first_ring = i + int(np.argmin(distances[:, first_step]))
+
+        return first_step, first_ring, float(min_clearance)
+
+    @staticmethod
+    def surface_quads(surfaces: np.ndarray) -> np.ndarray:
+        """Split ring surfaces into quadrilateral faces.
+
+        Args:
+            surfaces (np.ndarray): (R, 3, C, C) ring surfaces.
+
+        Returns:
+            np.ndarray: (R * (C - 1) ** 2, 4, 3) faces, grouped by ring.
+        """
+        points = np.moveaxis(surfaces, 1, -1)
+
+        return np.stack(
+            (
+                points[:, :-1, :-1],
+                points[:, 1:, :-1],
+                points[:, 1:, 1:],
+                points[:, :-1, 1:]
+            ),
+            axis=-2
+        ).reshape(-1, 4, 3)
+
     @staticmethod
     def ax_auto_fit(ax, offset: int = 1, *waypoints: Vector3D) -> None:
         """Set axis limits automatically.
@@ -180,23 +669,38 @@ class Track:
 
         # Color gradient for rings:
         gradient = ColorGradient("#ff0000", "#0000ff", len(self.rings))
-        steps = [ColorGradient.rgb_to_hex(step) for step in gradient.steps]
-
-        # Ring plotting:
-        for color, ring in zip(steps, self.rings):
-            ring.plot(
-                ax,
-                color=color,
-                edgecolors=color,
+
+        # Ring plotting (level-of-detail geometry, not decimated, merged
+        # into a single collection with one color per ring face):
+        surfaces = self.build_surfaces(complexity=self.lod_complexity(
+            tuple(ax.figure.get_size_inches())
+        ))
+        colors = gradient.steps_array[:len(self.rings)] / 255
+        quads = self.surface_quads(surfaces)
+
+        if len(quads):
+            face_colors = np.repeat(colors, len(quads) // len(colors), axis=0)
+            ax.add_collection3d(Poly3DCollection(
+                quads,
+                facecolors=face_colors,
+                edgecolors=face_colors,
+                shade=True,
                 **kwargs
-            )
+            ))
 
-        # Title, labels and legend:
+        # Title, labels and legend (proxy artists):
         ax.set_title("Drone track view")
         ax.set_xlabel("X")
         ax.set_ylabel("Y")
         ax.set_zlabel("Z")
         ax.legend(
+            [
+                Line2D([], [], color="darkred", marker="+", linestyle=""),
+                Line2D([], [], color="darkgreen", marker="P", linestyle="")
+            ] + [
+                Patch(facecolor=color, edgecolor=color)
+                for color in colors
+            ],
             [
                 "Start",
                 "End"
@@ -248,7 +752,7 @@ class Track:
         """
         return (
             f"Track from {self._start} to {self._end} with"
-            + f" rings: {self._rings}"
+            + f" rings: {list(self._rings)}"
         )
 
     def __len__(self) -> int:
@@ -259,10 +763,26 @@ class Track:
         """
         return len(self._rings) + 2  # Start and end points compensation.
 
-    def __hash__(self) -> int:
-        """Get track hash.
+    def __getstate__(self) -> dict:
+        """Get the track state for pickling, without cached data.
+
+        Cached waypoint data, the spatial index and the fingerprint are
+        rebuilt on demand, so they are not sent to other processes. Versions
+        are only comparable within a process, so the track version is reset.
 
         Returns:
-            int: track hash.
+            dict: track state.
         """
-        return hash(tuple([self._start, *self._rings, self._end]))
+        state = self.__dict__.copy()
+        state.update(
+            _waypoint_array=None,
+            _segment_lengths=None,
+            _cumulative_distances=None,
+            _path_length=None,
+            _index=None,
+            _fingerprint=None,
+            _version=0,
+            _cache_version=None
+        )
+
+        return state
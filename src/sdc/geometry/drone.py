@@ -6,6 +6,7 @@ Author:
 
 
 import numpy as np
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 
 from ..core.vector import Rotator3D, Vector3D
 
@@ -16,6 +17,9 @@ class Drone:
     Attributes:
         position (Vector3D): drone position.
         rotation (Rotator3D): drone rotation.
+        vertices (np.ndarray): (8, 3) transformed drone vertices.
+        STRUCTURE (np.ndarray): (8, 3) drone box vertices.
+        SURFACE (np.ndarray): (6, 4) drone box faces, as vertex indices.
     """
 
     STRUCTURE = np.array([
@@ -47,6 +51,9 @@ class Drone:
         """
         self.position = position
         self.rotation = rotation
+        self._vertices = None
+        self._vertices_key = None
+        self._artist = None
 
     @property
     def position(self) -> Vector3D:
@@ -98,14 +105,55 @@ class Drone:
 
         self._rotation = value
 
-    def plot(self, ax) -> None:
+    @property
+    def vertices(self) -> np.ndarray:
+        """Get transformed drone vertices.
+
+        The box is centered on the drone position and rotated with the drone
+        rotation. Vertices are cached until either of them changes value.
+
+        Returns:
+            np.ndarray: (8, 3) read-only transformed drone vertices.
+        """
+        position, rotation = self._position, self._rotation
+        key = (
+            position._x, position._y, position._z,
+            rotation._x, rotation._y, rotation._z
+        )
+
+        if key != self._vertices_key:
+            vertices = (self.STRUCTURE - .5) @ rotation.matrix.T
+            vertices += key[:3]
+            vertices.flags.writeable = False
+            self._vertices = vertices
+            self._vertices_key = key
+
+        return self._vertices
+
+    def plot(self, ax, **kwargs) -> Poly3DCollection:
         """Plot drone.
 
+        The drone artist is created on the first call and its vertices are
+        updated in place on later calls on the same ax, so that the drone can
+        be redrawn every frame without rebuilding artists.
+
         Args:
             ax (Axes3D): ax to plot drone on.
+            **kwargs: Poly3DCollection keyword arguments, only used when the
+                artist is created.
+
+        Returns:
+            Poly3DCollection: drone artist.
         """
-        print("Warning: Drone.plot() has not been implemented yet.")
-        return None
+        faces = self.vertices[self.SURFACE]
+
+        if self._artist is None or self._artist.axes is not ax:
+            self._artist = Poly3DCollection(faces, **kwargs)
+            ax.add_collection3d(self._artist)
+        else:
+            self._artist.set_verts(faces)
+
+        return self._artist
 
     def __repr__(self) -> str:
         """Get short drone representation.
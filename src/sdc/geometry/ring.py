@@ -5,14 +5,20 @@ Author:
 """
 
 
+import functools
+import hashlib
+
 import numpy as np
 
-from ..core.vector import Rotator3D, Vector3D
+from ..core.vector import Rotator3D, Vector3D, Vector3DArray, next_version
 
 
 class Ring:
     """Ring representation class.
 
+    Position, rotation and scale are copied on assignment, so a ring never
+    shares them with the caller or with other rings.
+
     Attributes:
         position (Vector3D): ring position.
         rotation (Rotator3D): ring rotation.
@@ -20,15 +26,17 @@ class Ring:
         tube_radius (float): ring tube radius.
         hole_radius (float): ring hole radius.
         complexity (int): ring geometry complexity.
+        local_surface (np.ndarray): ring geometry surface in its local frame.
+        version (int): modification version of the ring.
         surface (tuple[np.ndarray, np.ndarray, np.ndarray]): ring geometry
             surface.
     """
 
     def __init__(
         self,
-        position: Vector3D = Vector3D(),
-        rotation: Rotator3D = Rotator3D(),
-        scale: Vector3D = Vector3D(1, 1, 1),
+        position: Vector3D | None = None,
+        rotation: Rotator3D | None = None,
+        scale: Vector3D | None = None,
         tube_radius: int | float = 1,
         hole_radius: int | float = 5,
         complexity: int = 100
@@ -36,12 +44,12 @@ class Ring:
         """Initialize a Ring instance.
 
         Args:
-            position (Vector3D, optional): ring position. Defaults to
-                Vector3D(0, 0, 0).
-            rotation (Rotator3D, optional): ring rotation. Defaults to
-                Rotator3D(0, 0, 0).
-            scale (Vector3D, optional): ring scale. Defaults to
-                Vector3D(1, 1, 1).
+            position (Vector3D | None, optional): ring position. Defaults to
+                None (Vector3D(0, 0, 0)).
+            rotation (Rotator3D | None, optional): ring rotation. Defaults to
+                None (Rotator3D(0, 0, 0)).
+            scale (Vector3D | None, optional): ring scale. Defaults to None
+                (Vector3D(1, 1, 1)).
             tube_radius (int | float, optional): ring tube radius.
                 Defaults to 1.
             hole_radius (int | float, optional): ring hole radius.
@@ -49,15 +57,18 @@ class Ring:
             complexity (int, optional): ring geometry complexity. Defaults to
                 100.
         """
-        self.position = position
-        self.rotation = rotation
-        self.scale = scale
+        self._surface: np.ndarray | None = None
+        self._surface_version = 0
+        self._fingerprint: str | None = None
+        self._fingerprint_version = 0
+
+        self.position = Vector3D() if position is None else position
+        self.rotation = Rotator3D() if rotation is None else rotation
+        self.scale = Vector3D(1, 1, 1) if scale is None else scale
         self.tube_radius = tube_radius
         self.hole_radius = hole_radius
         self.complexity = complexity
 
-        self._compute_geometry()
-
     @property
     def position(self) -> Vector3D:
         """Get ring position.
@@ -81,7 +92,8 @@ class Ring:
                 + f" {type(value).__name__} instead"
             )
 
-        self._position = value
+        self._position = value.copy()
+        self._version = next_version()
 
     @property
     def rotation(self) -> Rotator3D:
@@ -106,7 +118,8 @@ class Ring:
                 + f" {type(value).__name__} instead"
             )
 
-        self._rotation = value
+        self._rotation = value.copy()
+        self._version = next_version()
 
     @property
     def scale(self) -> Vector3D:
@@ -131,7 +144,8 @@ class Ring:
                 + f" {type(value).__name__} instead"
             )
 
-        self._scale = value
+        self._scale = value.copy()
+        self._version = next_version()
 
     @property
     def tube_radius(self) -> float:
@@ -157,6 +171,7 @@ class Ring:
             )
 
         self._tube_radius = float(value)
+        self._version = next_version()
 
     @property
     def hole_radius(self) -> float:
@@ -182,6 +197,7 @@ class Ring:
             )
 
         self._hole_radius = float(value)
+        self._version = next_version()
 
     @property
     def complexity(self) -> int:
@@ -207,65 +223,231 @@ class Ring:
             )
 
         self._complexity = int(value)
+        self._version = next_version()
+
+    @property
+    def version(self) -> int:
+        """Get modification version of the ring.
+
+        The version changes whenever an attribute of the ring is set or its
+        position, rotation or scale is changed in place.
+
+        Returns:
+            int: modification version of the ring.
+        """
+        return max(
+            self._version,
+            self._position._version,
+            self._rotation._version,
+            self._scale._version
+        )
 
     @property
     def surface(self) -> np.ndarray:
         """Get ring geometry surface.
 
+        The surface is computed on first access and recomputed whenever the
+        ring version changes, so it also reflects changes made in place
+        through the ring vectors.
+
         Returns:
             np.ndarray: ring geometry surface.
         """
-        return self._surface
+        version = self.version
 
-    def _compute_geometry(self) -> None:
-        """Compute ring geometry.
+        if self._surface is None or self._surface_version != version:
+            self._compute_geometry()
+            self._surface_version = version
 
-        This method builds the ring geometry, scales it, rotates it and
-        translates it to the correct position.
+        return self._surface  # type: ignore
+
+    @property
+    def local_surface(self) -> np.ndarray:
+        """Get ring geometry surface in its local frame.
+
+        The local surface is an untransformed torus shared between all rings
+        with the same complexity and radii, so it is read-only.
+
+        Returns:
+            np.ndarray: ring geometry surface in its local frame.
         """
-        theta, phi = np.meshgrid(
-            np.linspace(0, 2 * np.pi, self._complexity),  # type: ignore
-            np.linspace(0, 2 * np.pi, self._complexity)  # type: ignore
+        return torus_surface(
+            self._complexity,
+            self._tube_radius,
+            self._hole_radius
         )
 
-        # X, Y, Z matrix generation:
-        matrix = np.array([
-            (
-                self._hole_radius + self._tube_radius * np.cos(theta)
-            ) * np.cos(phi), (
-                self._hole_radius + self._tube_radius * np.cos(theta)
-            ) * np.sin(phi),
-            self._tube_radius * np.sin(theta)
-        ])
+    @property
+    def normal(self) -> Vector3D:
+        """Get ring plane normal.
 
-        # Surface rotation:
-        azimuth, elevation, yaw = self._rotation
-        rotation_matrix = np.array([
-            [
-                np.cos(azimuth) * np.cos(elevation),
-                (
-                    np.cos(azimuth) * np.sin(elevation) * np.sin(yaw)
-                    - np.sin(azimuth) * np.cos(yaw)
-                ),
-                np.cos(azimuth) * np.sin(elevation) * np.cos(yaw)
-                + np.sin(azimuth) * np.sin(yaw)
-            ], [
-                np.sin(azimuth) * np.cos(elevation),
+        The normal is the local Z axis of the ring, which goes through its
+        hole.
+
+        Returns:
+            Vector3D: unit ring plane normal.
+        """
+        return Vector3D._from_floats(*self._rotation.matrix[:, 2].tolist())
+
+    def crosses(self, start: Vector3D, end: Vector3D) -> bool:
+        """Check whether a segment goes through the ring hole.
+
+        The segment is intersected with the ring plane, and the intersection
+        point is then checked to be within the hole radius of the ring center.
+        The ring scale is taken into account by working on scaled
+        coordinates.
+
+        Args:
+            start (Vector3D): segment start.
+            end (Vector3D): segment end.
+
+        Returns:
+            bool: True if the segment goes through the ring hole, False
+                otherwise.
+        """
+        nx, ny, nz = self._rotation.matrix[:, 2].tolist()
+        px, py, pz = self._position
+        sx, sy, sz = self._scale
+
+        # Segment endpoints relative to the ring center, in scaled units:
+        ax, ay, az = (
+            (start.x - px) / sx, (start.y - py) / sy, (start.z - pz) / sz
+        )
+        bx, by, bz = (
+            (end.x - px) / sx, (end.y - py) / sy, (end.z - pz) / sz
+        )
+
+        # Signed distances to the ring plane:
+        da = ax * nx + ay * ny + az * nz
+        db = bx * nx + by * ny + bz * nz
+
+        if (da <= 0) == (db <= 0):
+            return False
+
+        # Intersection point with the ring plane:
+        t = da / (da - db)
+        hx, hy, hz = ax + t * (bx - ax), ay + t * (by - ay), az + t * (bz - az)
+
+        return hx * hx + hy * hy + hz * hz <= self._hole_radius ** 2
+
+    def crossed_segments(
+        self,
+        points: Vector3DArray | np.ndarray | list[Vector3D]
+    ) -> np.ndarray:
+        """Check which segments of a trajectory go through the ring hole.
+
+        This is the vectorized version of `crosses`, applied to every pair of
+        consecutive trajectory points.
+
+        Args:
+            points (Vector3DArray | np.ndarray | list[Vector3D]): (N, 3)
+                trajectory points.
+
+        Returns:
+            np.ndarray: (N - 1,) boolean array, True for each segment that
+                goes through the ring hole.
+        """
+        relative = (
+            (Vector3DArray(points).array - tuple(self._position))
+            / tuple(self._scale)
+        )
+        distances = relative @ self._rotation.matrix[:, 2]
+        start, end = relative[:-1], relative[1:]
+        da, db = distances[:-1], distances[1:]
+
+        crossing = (da <= 0) != (db <= 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.where(crossing, da / (da - db), 0)[:, np.newaxis]
+
+        hits = start + t * (end - start)
+
+        return crossing & (
+            np.einsum("ij,ij->i", hits, hits) <= self._hole_radius ** 2
+        )
+
+    def to_local(
+        self,
+        points: Vector3DArray | np.ndarray | list[Vector3D]
+    ) -> np.ndarray:
+        """Transform world points into the local frame of the ring.
+
+        This is the inverse of the transformation applied to the local ring
+        geometry (rotation, scaling and translation).
+
+        Args:
+            points (Vector3DArray | np.ndarray | list[Vector3D]): (N, 3)
+                world points.
+
+        Returns:
+            np.ndarray: (N, 3) local points.
+        """
+        return (
+            (Vector3DArray(points).array - tuple(self._position))
+            / tuple(self._scale)
+        ) @ self._rotation.matrix
+
+    def signed_distances(
+        self,
+        points: Vector3DArray | np.ndarray | list[Vector3D]
+    ) -> np.ndarray:
+        """Get the signed distances between world points and the ring tube.
+
+        Distances are measured in the local frame of the ring, so they match
+        world distances only for unit scales.
+
+        Args:
+            points (Vector3DArray | np.ndarray | list[Vector3D]): (N, 3)
+                world points.
+
+        Returns:
+            np.ndarray: (N,) signed distances, negative inside the tube.
+        """
+        return torus_sdf(
+            self.to_local(points),
+            self._tube_radius,
+            self._hole_radius
+        )
+
+    def fingerprint(self) -> str:
+        """Get ring content fingerprint.
+
+        The fingerprint is a SHA-256 digest of the float64 position, rotation,
+        scale, tube radius and hole radius of the ring, so it is stable across
+        runs and processes. Geometry complexity is not included, since it does
+        not change the ring itself. The fingerprint is memoized until the ring
+        version changes, so it also reflects changes made through the ring
+        vectors.
+
+        Returns:
+            str: hexadecimal ring fingerprint.
+        """
+        version = self.version
+
+        if self._fingerprint is None or self._fingerprint_version != version:
+            self._fingerprint = hashlib.sha256(np.array(
                 (
-                    np.sin(azimuth) * np.sin(elevation) * np.sin(yaw)
-                    + np.cos(azimuth) * np.cos(yaw)
+                    *self._position,
+                    *self._rotation,
+                    *self._scale,
+                    self._tube_radius,
+                    self._hole_radius
                 ),
-                np.sin(azimuth) * np.sin(elevation) * np.cos(yaw)
-                - np.cos(azimuth) * np.sin(yaw)
-            ], [
-                -np.sin(elevation),
-                np.cos(elevation) * np.sin(yaw),
-                np.cos(elevation) * np.cos(yaw)
-            ]
-        ])
+                dtype=np.float64
+            ).tobytes()).hexdigest()
+            self._fingerprint_version = version
+
+        return self._fingerprint
+
+    def _compute_geometry(self) -> None:
+        """Compute ring geometry.
+
+        This method takes the shared local ring geometry, rotates it, scales
+        it and translates it to the correct position.
+        """
+        # Surface rotation:
         matrix = np.dot(
-            rotation_matrix,
-            matrix.reshape(3, -1)
+            self._rotation.matrix,
+            self.local_surface.reshape(3, -1)
         ).reshape(3, self._complexity, self._complexity)
 
         # Surface scaling and translation:
@@ -289,7 +471,7 @@ class Ring:
         kwargs_.update(kwargs)
 
         ax.plot_surface(
-            *self._surface,
+            *self.surface,
             **kwargs_
         )
 
@@ -315,3 +497,89 @@ class Ring:
     hole_radius={self._hole_radius},
     complexity={self._complexity}
 )"""
+
+    def __getstate__(self) -> dict:
+        """Get the ring state for pickling, without cached data.
+
+        The surface and fingerprint are rebuilt on demand, so they are not
+        sent to other processes. Versions are only comparable within a
+        process, so the ring version is reset, as those of its vectors are.
+
+        Returns:
+            dict: ring state.
+        """
+        state = self.__dict__.copy()
+        state["_surface"] = state["_fingerprint"] = None
+        state["_version"] = 0
+
+        return state
+
+
+@functools.lru_cache(maxsize=32)
+def torus_surface(
+    complexity: int,
+    tube_radius: float,
+    hole_radius: float
+) -> np.ndarray:
+    """Compute a torus surface in its local frame.
+
+    Args:
+        complexity (int): ring geometry complexity.
+        tube_radius (float): ring tube radius.
+        hole_radius (float): ring hole radius.
+
+    Returns:
+        np.ndarray: (3, complexity, complexity) read-only torus surface.
+    """
+    theta, phi = np.meshgrid(
+        np.linspace(0, 2 * np.pi, complexity),  # type: ignore
+        np.linspace(0, 2 * np.pi, complexity)  # type: ignore
+    )
+
+    # X, Y, Z matrix generation:
+    matrix = np.array([
+        (hole_radius + tube_radius * np.cos(theta)) * np.cos(phi),
+        (hole_radius + tube_radius * np.cos(theta)) * np.sin(phi),
+        tube_radius * np.sin(theta)
+    ])
+    matrix.setflags(write=False)
+
+    return matrix
+
+
+def torus_sdf(
+    points: np.ndarray,
+    tube_radius: float | np.ndarray,
+    hole_radius: float | np.ndarray
+) -> np.ndarray:
+    """Get the signed distances between local points and a torus.
+
+    The torus lies on the local XY plane, centered at the origin. Radii can
+    also be arrays broadcastable against the points, so that many rings can
+    be evaluated at once.
+
+    Args:
+        points (np.ndarray): (..., 3) points in the local frame of the torus.
+        tube_radius (float | np.ndarray): torus tube radius.
+        hole_radius (float | np.ndarray): torus hole radius.
+
+    Returns:
+        np.ndarray: (...) signed distances, negative inside the tube.
+    """
+    x, y, z = points[..., 0], points[..., 1], points[..., 2]
+
+    return np.hypot(np.hypot(x, y) - hole_radius, z) - tube_radius
+
+
+def mesh_cache_info() -> functools._CacheInfo:
+    """Get statistics of the shared local ring surface cache.
+
+    Returns:
+        functools._CacheInfo: cache hits, misses, maximum and current size.
+    """
+    return torus_surface.cache_info()
+
+
+def clear_mesh_cache() -> None:
+    """Clear the shared local ring surface cache and its statistics."""
+    torus_surface.cache_clear()
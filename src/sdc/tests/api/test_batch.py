@@ -0,0 +1,130 @@
+import math
+
+import numpy as np
+import pytest
+
+from ...api.batch import BatchSimulationAPI
+from ...api.simulation import SimulationAPI
+from ...core.vector import Vector3D
+from ...environment.generator import TrackGenerator
+from ...environment.reader import TrackSequenceReader
+from ...environment.track import Track
+from ..environment.test_reader import EXAMPLES
+
+
+def control(
+    position: tuple[float, float, float],
+    waypoint: tuple[float, float, float] | None
+) -> tuple[float, float, float]:
+    if waypoint is None:
+        return 0.0, 0.0, 0.0
+
+    dx, dy, dz = (w - p for w, p in zip(waypoint, position))
+    distance = math.sqrt(dx * dx + dy * dy + dz * dz)
+
+    return (
+        math.atan2(dy, dx),
+        math.atan2(dz, math.hypot(dx, dy)),
+        min(20.0, 2 * distance)
+    )
+
+
+def run_serial(track: Track) -> SimulationAPI:
+    sim = SimulationAPI([track])
+
+    while not sim.is_simulation_finished:
+        waypoint = sim.next_waypoint
+        sim.set_drone_target_state(*control(
+            tuple(sim.drone.position),
+            None if waypoint is None else tuple(waypoint)
+        ))
+        sim.update(plot=False)
+
+    return sim
+
+
+def run_batch(tracks: list[Track]) -> BatchSimulationAPI:
+    batch = BatchSimulationAPI(tracks)
+
+    while not batch.is_simulation_finished:
+        targets = [
+            control(position, None if math.isnan(waypoint[0]) else waypoint)
+            for position, waypoint in zip(
+                batch.fleet.positions.tolist(),
+                batch.next_waypoints.tolist()
+            )
+        ]
+        batch.set_drone_target_states(*np.array(targets).T)
+        batch.update()
+
+    return batch
+
+
+def score_values(score: tuple) -> tuple:
+    completed, scores = score
+    return completed, [(s.value, s.score_range) for s in scores]
+
+
+class TestBatchSimulationAPI:
+
+    @pytest.mark.parametrize(("block_size", "dense_fraction"), [
+        (BatchSimulationAPI.BLOCK_SIZE, BatchSimulationAPI.DENSE_FRACTION),
+        (5, 0),
+        (5, 2)
+    ])
+    def test_matches_serial(self, monkeypatch, block_size, dense_fraction):
+        monkeypatch.setattr(BatchSimulationAPI, "BLOCK_SIZE", block_size)
+        monkeypatch.setattr(
+            BatchSimulationAPI, "DENSE_FRACTION", dense_fraction
+        )
+        tracks = [
+            *TrackSequenceReader(EXAMPLES).track_sequence,
+            *TrackGenerator(seed=3, spacing_range=(5, 15)).generate_sequence(
+                3, 12
+            ),
+            Track(Vector3D(0, 0, 0), Vector3D(3, 0, 0), [])
+        ]
+        batch = run_batch(tracks)
+
+        for i, track in enumerate(tracks):
+            sim = run_serial(track)
+            expected = sim._current_statistics
+            statistics = batch.statistics(i)
+
+            assert np.array_equal(statistics._buffer, expected._buffer[
+                :len(expected)
+            ])
+            assert statistics.is_completed == expected.is_completed
+            assert statistics.distance_to_end == expected.distance_to_end
+            assert (
+                statistics.collision_step, statistics.min_clearance
+            ) == (expected.collision_step, expected.min_clearance)
+            assert score_values(batch.scores[i]) == score_values(
+                sim._completed_scores[0]
+            )
+
+        assert batch.is_simulation_finished
+        assert not batch.scores[-1][0]  # Timed out.
+
+        # Finished drones are left out of later blocks:
+        assert len(batch._blocks[-1][1]) < len(tracks)
+
+    def test_shared_tracks(self):
+        track = TrackGenerator(seed=1).generate(4)
+        batch = BatchSimulationAPI([track] * 3)
+
+        assert batch.remaining_waypoints.tolist() == [5, 5, 5]
+        assert np.array_equal(
+            batch.next_waypoints, [tuple(track.rings[0].position)] * 3
+        )
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            BatchSimulationAPI([])
+
+        with pytest.raises(TypeError):
+            BatchSimulationAPI([Track(Vector3D(), Vector3D(), []), 1])
+
+        batch = BatchSimulationAPI([Track(Vector3D(), Vector3D(), [])] * 2)
+        with pytest.raises(TypeError):
+            batch.set_drone_target_states(0, [0, 0, 0], 0)
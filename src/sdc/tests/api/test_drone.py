@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from ...api.drone import DroneAPI, DroneFleet
+from ...core.vector import Rotator3D, Vector3D
+
+
+class TestDroneFleet:
+
+    def test_speed_clamping(self):
+        fleet = DroneFleet(np.zeros((3, 3)), speeds=[-5, 10, 50])
+        assert fleet.speeds.tolist() == [0, 10, 20]
+
+        fleet.speeds = np.array([25, -1, 3.5])
+        assert fleet.speeds.tolist() == [20, 0, 3.5]
+
+    def test_invalid_positions(self):
+        with pytest.raises(ValueError):
+            DroneFleet(np.zeros((3, 2)))
+
+    def test_invalid_shapes(self):
+        with pytest.raises(ValueError):
+            DroneFleet(np.zeros((3, 3)), rotations=np.zeros((2, 3)))
+
+        with pytest.raises(ValueError):
+            DroneFleet(np.zeros((3, 3)), speeds=[1, 2])
+
+        fleet = DroneFleet(np.zeros((3, 3)), speeds=5)
+        assert fleet.speeds.tolist() == [5, 5, 5]
+
+        with pytest.raises(ValueError):
+            fleet.positions = np.zeros((4, 3))
+
+    def test_invalid_index(self):
+        fleet = DroneFleet(np.zeros((3, 3)))
+        assert fleet[np.int64(1)].position == Vector3D(0, 0, 0)
+
+        with pytest.raises(TypeError, match="expected type int"):
+            fleet[0:2]
+
+        with pytest.raises(IndexError):
+            fleet[3]
+
+    def test_view_reads_through(self):
+        fleet = DroneFleet(
+            [[0, 0, 0], [1, 2, 3]], [[0, 0, 0], [.5, .25, 0]], [0, 4]
+        )
+        drone = fleet[-1]
+
+        assert isinstance(drone, DroneAPI)
+        assert drone.position == Vector3D(1, 2, 3)
+        assert drone.speed == 4
+
+        fleet.positions[1] = (4, 5, 6)
+        fleet.rotations[1, 0] = 1.0
+        fleet.speeds = [0, 8]
+        assert drone.position == Vector3D(4, 5, 6)
+        assert drone.rotation.x == 1.0
+        assert drone.speed == 8
+        assert drone.rotation.forward.x == pytest.approx(
+            fleet.forwards()[1, 0]
+        )
+
+    def test_view_writes_through(self):
+        fleet = DroneFleet(np.zeros((2, 3)))
+        drone = fleet[0]
+
+        drone.position = Vector3D(1, 2, 3)
+        drone.position.set(drone.position.x + 1, 2.0, 3.0)
+        drone.rotation.set(.5, .25, 0.0)
+        drone.speed = 30
+
+        assert fleet.positions.tolist() == [[2, 2, 3], [0, 0, 0]]
+        assert fleet.rotations.tolist() == [[.5, .25, 0], [0, 0, 0]]
+        assert fleet.speeds.tolist() == [20, 0]
+
+        snapshot = drone.position.copy()
+        drone.position.x = 7
+        assert snapshot == Vector3D(2, 2, 3)
+
+    def test_view_matches_drone(self):
+        drone = DroneAPI(Vector3D(1, 2, 3), Rotator3D(30, 10, 0), 5)
+        fleet = DroneFleet.from_drones([drone])
+
+        assert np.array_equal(fleet[0].vertices, drone.vertices)
+        assert str(fleet[0]) == str(drone)
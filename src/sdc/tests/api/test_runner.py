@@ -0,0 +1,108 @@
+import math
+
+import pytest
+
+from ...api.runner import SimulationRunner
+from ...api.simulation import SimulationAPI
+from ...environment.generator import TrackGenerator
+from ...environment.reader import TrackSequenceReader
+from ..environment.test_reader import EXAMPLES
+
+
+def controller(sim: SimulationAPI) -> None:
+    waypoint = sim.next_waypoint
+
+    if waypoint is None:
+        sim.set_drone_target_state(0, 0, 0)
+        return
+
+    delta = waypoint - sim.drone.position
+    sim.set_drone_target_state(
+        math.atan2(delta.y, delta.x),
+        math.atan2(delta.z, math.hypot(delta.x, delta.y)),
+        min(20.0, 2 * delta.norm())
+    )
+
+
+def make_controller():
+    return controller
+
+
+class CountingController:
+
+    created = 0
+
+    def __init__(self) -> None:
+        CountingController.created += 1
+        self.sim = None
+
+    def __call__(self, sim: SimulationAPI) -> None:
+        if self.sim is None:
+            self.sim = sim
+        elif self.sim is not sim:
+            raise RuntimeError("controller reused across tracks")
+
+        controller(sim)
+
+
+def score_values(scores: list) -> list:
+    return [
+        (completed, [(s.value, s.score_range) for s in area])
+        for completed, area in scores
+    ]
+
+
+class TestSimulationRunner:
+
+    def test_matches_serial(self, capsys):
+        tracks = [
+            *TrackSequenceReader(EXAMPLES).track_sequence[:3],
+            *TrackGenerator(seed=2, spacing_range=(5, 15)).generate_sequence(
+                2, 8
+            )
+        ]
+
+        sim = SimulationAPI(tracks)
+        while not sim.is_simulation_finished:
+            controller(sim)
+            sim.update(plot=False)
+        sim.summary()
+        serial = capsys.readouterr().out
+
+        runner = SimulationRunner(make_controller, tracks, max_workers=2)
+        runner.summary()
+
+        assert score_values(runner.scores) == score_values(sim.scores)
+        assert capsys.readouterr().out == serial
+        assert len(runner.timings) == len(runner.workers) == len(tracks)
+        assert sum(runner.worker_timings.values()) == pytest.approx(
+            sum(runner.timings)
+        )
+
+    def test_controller_per_track(self, monkeypatch):
+        monkeypatch.setattr(CountingController, "created", 0)
+        tracks = TrackGenerator(seed=4).generate_sequence(3, 4)
+
+        serial = SimulationRunner(CountingController, tracks, max_workers=1)
+        assert len(serial.scores) == 3
+        assert CountingController.created == 3
+
+        pooled = SimulationRunner(CountingController, tracks, max_workers=2)
+        assert score_values(pooled.scores) == score_values(serial.scores)
+
+    def test_in_process(self):
+        tracks = TrackGenerator(seed=0).generate_sequence(1, 3)
+        runner = SimulationRunner(make_controller, tracks)
+
+        assert len(runner.scores) == 1
+        assert list(runner.worker_timings) == runner.workers
+
+    def test_invalid(self):
+        with pytest.raises(TypeError):
+            SimulationRunner(None, [])
+
+        with pytest.raises(TypeError):
+            SimulationRunner(make_controller, [1])
+
+        with pytest.raises(ValueError):
+            SimulationRunner(make_controller, [])
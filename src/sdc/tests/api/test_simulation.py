@@ -0,0 +1,62 @@
+import pytest
+
+from ...api.simulation import SimulationAPI
+from ...core.vector import Vector3D
+from ...environment.track import Track
+from ...geometry.ring import Ring
+
+
+def drive(sim: SimulationAPI) -> None:
+    while not sim.is_simulation_finished:
+        sim.set_drone_target_state(
+            0, 0, 0 if sim.next_waypoint is None else 20
+        )
+        sim.update(plot=False)
+
+
+class TestSimulationAPI:
+
+    def test_lazy_tracks(self):
+        consumed = []
+
+        def tracks():
+            for i in range(3):
+                consumed.append(i)
+                yield Track(Vector3D(0, 0, 0), Vector3D(10 + i, 0, 0), [])
+
+        sim = SimulationAPI(tracks())
+        assert consumed == [0]
+
+        drive(sim)
+        assert consumed == [0, 1, 2]
+        assert len(sim._completed_scores) == 3
+        assert all(completed for completed, _ in sim._completed_scores)
+
+    def test_invalid_tracks(self):
+        with pytest.raises(ValueError):
+            SimulationAPI([])
+
+        with pytest.raises(TypeError):
+            SimulationAPI(None)
+
+        sim = SimulationAPI([Track(Vector3D(), Vector3D(10, 0, 0), []), 1])
+        with pytest.raises(TypeError):
+            drive(sim)
+
+    def test_aliased_state(self):
+        track = Track(
+            Vector3D(0, 0, 0), Vector3D(30, 0, 0), [Ring(Vector3D(10, 5, 0))]
+        )
+        sim = SimulationAPI([track])
+        sim.set_drone_target_state(0, 0, 10)
+        sim.update(plot=False)
+
+        waypoint = sim.next_waypoint
+        waypoint -= sim.drone.position
+        position = sim.drone.position
+        position += Vector3D(5, 0, 0)
+
+        assert track.rings[0].position == Vector3D(10, 5, 0)
+        assert sim.next_waypoint == Vector3D(10, 5, 0)
+        assert sim.drone.position != position
+        assert track.start == Vector3D(0, 0, 0)
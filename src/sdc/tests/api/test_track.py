@@ -0,0 +1,82 @@
+from ...api.track import TrackAPI
+from ...core.vector import Rotator3D, Vector3D
+from ...environment.track import Track
+from ...geometry.ring import Ring
+
+
+def make_track() -> Track:
+    return Track(
+        Vector3D(0, 0, 0),
+        Vector3D(30, 0, 0),
+        [
+            Ring(Vector3D(10, 0, 0), Rotator3D(90, 0, 90)),
+            Ring(Vector3D(20, 3, 0), Rotator3D(90, 0, 90))
+        ]
+    )
+
+
+class TestTrackAPI:
+
+    def test_track_start_not_shared(self):
+        track = make_track()
+        track_api = TrackAPI(track)
+        track_api.drone.position += Vector3D(1, 1, 1)
+
+        assert track.start == Vector3D(0, 0, 0)
+
+    def test_timeout_in_place(self):
+        track = make_track()
+        track_api = TrackAPI(track)
+        length = track.path_length
+        timeout = track_api.timeout
+
+        track.rings[1].position.y = 0
+        assert track.path_length == 30 < length
+        assert track_api.timeout == 30 * 2 / TrackAPI.MIN_TIMEOUT_SPEED
+
+        track.rings[0].position = Vector3D(10, 0, 10)
+        assert track.path_length > 30
+
+        track.rings[0].position.set(10.0, 0.0, 0.0)
+        track.end.set(20.0, 0.0, 0.0)
+        assert track.path_length == 20 and track_api.timeout < timeout
+
+        track.rings.append(Ring(Vector3D(40, 3, 0)))
+        assert len(track.rings) == 2 and track.path_length == 20
+
+    def test_swept_waypoints(self):
+        track_api = TrackAPI(make_track())
+        assert track_api.next_waypoint == Vector3D(10, 0, 0)
+
+        # Jump over the first ring, far from its center:
+        track_api.drone.position = Vector3D(14, 2, 0)
+        assert track_api.next_waypoint == Vector3D(20, 3, 0)
+
+        # Jump through the second ring and past the end in a single step:
+        track_api.drone.position = Vector3D(35, 0, 0)
+        assert track_api.next_waypoint is None
+        assert track_api.is_track_finished
+
+    def test_missed_ring(self):
+        track_api = TrackAPI(make_track())
+
+        # Go around the first ring:
+        track_api.drone.position = Vector3D(5, 8, 0)
+        track_api.next_waypoint
+        track_api.drone.position = Vector3D(15, 8, 0)
+
+        assert track_api.next_waypoint == Vector3D(10, 0, 0)
+        assert track_api.remaining_waypoints == 3
+
+    def test_segment_distance(self):
+        distance = TrackAPI._segment_distance
+
+        assert distance(
+            Vector3D(0, 0, 0), Vector3D(10, 0, 0), Vector3D(5, 3, 4)
+        ) == 5
+        assert distance(
+            Vector3D(0, 0, 0), Vector3D(10, 0, 0), Vector3D(-3, 0, 4)
+        ) == 5
+        assert distance(
+            Vector3D(1, 1, 1), Vector3D(1, 1, 1), Vector3D(1, 4, 5)
+        ) == 5
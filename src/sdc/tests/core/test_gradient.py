@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from ...core.gradient import ColorGradient
+
+
+class TestColorGradient:
+
+    def test_type(self):
+        with pytest.raises(TypeError):
+            ColorGradient(0, "#0000ff", 10)
+
+        with pytest.raises(ValueError):
+            ColorGradient("#ff0000", "0000ff", 10)
+
+    def test_steps(self):
+        gradient = ColorGradient("#ff0000", "#0000ff", 4)
+        assert gradient.steps == [
+            [255, 0, 0],
+            [191, 0, 63],
+            [127, 0, 127],
+            [63, 0, 191]
+        ]
+
+        gradient = ColorGradient("#ff0000", "#0000ff", 2)
+        assert gradient.steps == [[255, 0, 0], [0, 0, 255]]
+
+    def test_steps_array(self):
+        gradient = ColorGradient("#dc143c", "#15b01a", 1000)
+        steps = gradient.steps_array
+
+        assert steps.shape == (1000, 3)
+        assert not steps.flags.writeable
+        assert ColorGradient("#dc143c", "#15b01a", 1000).steps_array is steps
+        assert np.array_equal(steps[0], ColorGradient.hex_to_rgb("#dc143c"))
+
+    def test_hex_steps(self):
+        gradient = ColorGradient("#ff0000", "#0000ff", 4)
+        assert gradient.hex_steps == (
+            "#ff0000", "#bf003f", "#7f007f", "#3f00bf"
+        )
+        assert gradient.hex_steps == tuple(
+            ColorGradient.rgb_to_hex(step) for step in gradient.steps
+        )
@@ -1,6 +1,11 @@
+import pickle
+
+import numpy as np
 import pytest
 
-from ...core.vector import Rotator3D, Vector3D, distance3D
+from ...core.vector import (Rotator3D, Vector3D, Vector3DArray, as_points,
+                            distance3D, distances3D, pairwise_distances,
+                            path_length, rotation_matrices)
 
 
 class TestVector3D:
@@ -96,6 +101,47 @@ class TestVector3D:
         c = -1
         assert v / c == Vector3D(-1, -2, -3)
 
+    def test_augmented_assignment(self):
+        v = Vector3D(1, 2, 3)
+        alias = v
+
+        v += Vector3D(1, 1, 1)
+        v -= Vector3D(2, 2, 2)
+        v *= 2
+        assert v == Vector3D(0, 2, 4)
+        assert alias == Vector3D(1, 2, 3)
+
+        with pytest.raises(TypeError):
+            v *= "2"
+
+    def test_set(self):
+        v = Vector3D(1, 2, 3)
+        assert v.set(4.0, 5.0, 6.0) is v and v == Vector3D(4, 5, 6)
+
+    def test_version(self):
+        v = Vector3D(1, 2, 3)
+        version = v.version
+        v.x = 4
+        assert v.version > version
+
+        version = v.version
+        v.set(1.0, 2.0, 3.0)
+        assert v.version > version
+        assert v.copy().version == 0
+
+        r = pickle.loads(pickle.dumps(Rotator3D(10, 20, 30)))
+        assert r.version == 0 and r == Rotator3D(10, 20, 30)
+        assert np.allclose(r.matrix, Rotator3D(10, 20, 30).matrix)
+
+    def test_copy(self):
+        v = Vector3D(1, 2, 3)
+        snapshot = v.copy()
+        v += Vector3D(1, 1, 1)
+
+        assert snapshot is not v
+        assert snapshot == Vector3D(1, 2, 3)
+        assert type(Rotator3D(1, 2, 3).copy()) is Rotator3D
+
     def test_eq(self):
         v1 = Vector3D(1, 2, 3)
         v2 = Vector3D(1, 2, 3)
@@ -173,6 +219,17 @@ class TestVector3D:
         v = Vector3D(0, 0, 0)
         assert abs(v) == Vector3D(0, 0, 0)
 
+    def test_from_floats(self):
+        v = Vector3D._from_floats(1.0, 2.0, 3.0)
+        assert v == Vector3D(1, 2, 3)
+        assert type(v + v) is Vector3D
+        assert not hasattr(v, "__dict__")
+
+        r = Rotator3D._from_floats(0.5, 0.25, 0.0)
+        assert isinstance(r, Rotator3D)
+        assert (r.x, r.y, r.z) == (0.5, 0.25, 0.0)
+        assert not hasattr(r, "__dict__")
+
     def test_hash(self):
         v = Vector3D(1, 2, 3)
         assert hash(v) == hash((1, 2, 3))
@@ -236,53 +293,140 @@ class TestRotator3D:
 
     def test_str(self):
         v = Rotator3D(1, 2, 3)
-        assert str(v) == "(0.017453292519943295, 0.03490658503988659, 0.05235987755982989)"
+        assert str(v) == (
+            "(0.017453292519943295, 0.03490658503988659,"
+            " 0.05235987755982989)"
+        )
 
         v = Rotator3D(1.0, 2.0, 3.0)
-        assert str(v) == "(0.017453292519943295, 0.03490658503988659, 0.05235987755982989)"
+        assert str(v) == (
+            "(0.017453292519943295, 0.03490658503988659,"
+            " 0.05235987755982989)"
+        )
 
         v = Rotator3D(1.0, 2, 3)
-        assert str(v) == "(0.017453292519943295, 0.03490658503988659, 0.05235987755982989)"
+        assert str(v) == (
+            "(0.017453292519943295, 0.03490658503988659,"
+            " 0.05235987755982989)"
+        )
 
         v = Rotator3D(1, 2.0, 3)
-        assert str(v) == "(0.017453292519943295, 0.03490658503988659, 0.05235987755982989)"
+        assert str(v) == (
+            "(0.017453292519943295, 0.03490658503988659,"
+            " 0.05235987755982989)"
+        )
 
         v = Rotator3D(1, 2, 3.0)
-        assert str(v) == "(0.017453292519943295, 0.03490658503988659, 0.05235987755982989)"
+        assert str(v) == (
+            "(0.017453292519943295, 0.03490658503988659,"
+            " 0.05235987755982989)"
+        )
 
         v = Rotator3D(-1, -2, -3)
-        assert str(v) == "(-0.017453292519943295, -0.03490658503988659, -0.05235987755982989)"
+        assert str(v) == (
+            "(-0.017453292519943295, -0.03490658503988659,"
+            " -0.05235987755982989)"
+        )
 
     def test_repr(self):
         v = Rotator3D(1, 2, 3)
-        assert repr(v) == "Rotator3D(0.017453292519943295, 0.03490658503988659, 0.05235987755982989)"
+        assert repr(v) == (
+            "Rotator3D(0.017453292519943295, 0.03490658503988659,"
+            " 0.05235987755982989)"
+        )
 
         v = Rotator3D(1.0, 2.0, 3.0)
-        assert repr(v) == "Rotator3D(0.017453292519943295, 0.03490658503988659, 0.05235987755982989)"
+        assert repr(v) == (
+            "Rotator3D(0.017453292519943295, 0.03490658503988659,"
+            " 0.05235987755982989)"
+        )
 
         v = Rotator3D(1.0, 2, 3)
-        assert repr(v) == "Rotator3D(0.017453292519943295, 0.03490658503988659, 0.05235987755982989)"
+        assert repr(v) == (
+            "Rotator3D(0.017453292519943295, 0.03490658503988659,"
+            " 0.05235987755982989)"
+        )
 
         v = Rotator3D(1, 2.0, 3)
-        assert repr(v) == "Rotator3D(0.017453292519943295, 0.03490658503988659, 0.05235987755982989)"
+        assert repr(v) == (
+            "Rotator3D(0.017453292519943295, 0.03490658503988659,"
+            " 0.05235987755982989)"
+        )
 
         v = Rotator3D(1, 2, 3.0)
-        assert repr(v) == "Rotator3D(0.017453292519943295, 0.03490658503988659, 0.05235987755982989)"
+        assert repr(v) == (
+            "Rotator3D(0.017453292519943295, 0.03490658503988659,"
+            " 0.05235987755982989)"
+        )
 
         v = Rotator3D(-1, -2, -3)
-        assert repr(v) == "Rotator3D(-0.017453292519943295, -0.03490658503988659, -0.05235987755982989)"
+        assert repr(v) == (
+            "Rotator3D(-0.017453292519943295, -0.03490658503988659,"
+            " -0.05235987755982989)"
+        )
+
+    def test_matrix(self):
+        r = Rotator3D(90, 0, 90)
+        assert np.allclose(r.matrix, [[0, 0, 1], [1, 0, 0], [0, 1, 0]])
+        assert r.matrix is r.matrix
+        assert not r.matrix.flags.writeable
+        assert np.allclose(r.matrix @ r.matrix.T, np.eye(3))
+
+        r.x = 0
+        assert np.allclose(r.matrix, [[1, 0, 0], [0, 0, -1], [0, 1, 0]])
+
+    def test_forward(self):
+        assert Rotator3D().forward == Vector3D(1, 0, 0)
+
+        r = Rotator3D()
+        forward = r.forward
+        r.set(np.pi / 2, 0.0, 0.0)
+        assert r.forward is forward
+        assert np.allclose([*r.forward], [0, 1, 0])
+
+        assert np.isclose(Rotator3D(0, 90, 0).forward.z, 1)
+        assert np.isclose(Rotator3D(45, 30, 10).forward.norm(), 1)
+
+    def test_rotation_matrices(self):
+        rotators = [Rotator3D(*angles) for angles in (
+            (0, 0, 0), (90, 0, 90), (12, -34, 56), (-170, 80, -5)
+        )]
+        matrices = rotation_matrices(rotators)
+
+        assert matrices.shape == (4, 3, 3)
+        assert np.array_equal(matrices, [r.matrix for r in rotators])
+        assert np.array_equal(
+            rotation_matrices(Vector3DArray(rotators)),
+            matrices
+        )
 
 
 class TestDistance3D:
     def test_operation(self):
-        assert distance3D(Vector3D(0, 0, 0), Vector3D(0, 0, 0)) == 0
-        assert distance3D(Vector3D(0, 0, 0), Vector3D(1, 0, 0)) == 1
-        assert distance3D(Vector3D(0, 0, 0), Vector3D(0, 1, 0)) == 1
-        assert distance3D(Vector3D(0, 0, 0), Vector3D(0, 0, 1)) == 1
-        assert distance3D(Vector3D(0, 0, 0), Vector3D(1, 1, 1)) == 1.7320508075688772
-        assert distance3D(Vector3D(0, 0, 0), Vector3D(1, 2, 3)) == 3.7416573867739413
-        assert distance3D(Vector3D(0, 0, 0), Vector3D(-1, -2, -3)) == 3.7416573867739413
-        assert distance3D(Vector3D(1, 2, 3), Vector3D(1, 2, 3)) == 0
+        assert distance3D(Vector3D(0, 0, 0), Vector3D(0, 0, 0)) == (
+            0
+        )
+        assert distance3D(Vector3D(0, 0, 0), Vector3D(1, 0, 0)) == (
+            1
+        )
+        assert distance3D(Vector3D(0, 0, 0), Vector3D(0, 1, 0)) == (
+            1
+        )
+        assert distance3D(Vector3D(0, 0, 0), Vector3D(0, 0, 1)) == (
+            1
+        )
+        assert distance3D(Vector3D(0, 0, 0), Vector3D(1, 1, 1)) == (
+            1.7320508075688772
+        )
+        assert distance3D(Vector3D(0, 0, 0), Vector3D(1, 2, 3)) == (
+            3.7416573867739413
+        )
+        assert distance3D(Vector3D(0, 0, 0), Vector3D(-1, -2, -3)) == (
+            3.7416573867739413
+        )
+        assert distance3D(Vector3D(1, 2, 3), Vector3D(1, 2, 3)) == (
+            0
+        )
 
     def test_type(self):
         with pytest.raises(TypeError):
@@ -295,3 +439,114 @@ class TestDistance3D:
             distance3D({1: 1}, Vector3D(0, 0, 0))
             distance3D(True, Vector3D(0, 0, 0))
             distance3D(None, Vector3D(0, 0, 0))
+
+
+class TestVector3DArray:
+
+    def test_instance(self):
+        Vector3DArray()
+        Vector3DArray([[1, 2, 3], [4, 5, 6]])
+        Vector3DArray([Vector3D(1, 2, 3), Vector3D(4, 5, 6)])
+        Vector3DArray(np.zeros((10, 3)))
+
+        assert len(Vector3DArray()) == 0
+        assert Vector3DArray([[1, 2, 3]]).array.dtype == np.float64
+
+    def test_shape(self):
+        with pytest.raises(ValueError):
+            Vector3DArray([1, 2, 3])
+
+        with pytest.raises(ValueError):
+            Vector3DArray(np.zeros((2, 4)))
+
+    def test_conversion(self):
+        vectors = [Vector3D(1, 2, 3), Vector3D(-1, 0, 2.5)]
+        array = Vector3DArray.from_vectors(vectors)
+
+        assert array.to_vectors() == vectors
+        assert list(array) == vectors
+        assert array[1] == Vector3D(-1, 0, 2.5)
+        assert array[:1] == Vector3DArray([[1, 2, 3]])
+        assert np.array_equal(array.x, [1, -1])
+        assert np.array_equal(array.y, [2, 0])
+        assert np.array_equal(array.z, [3, 2.5])
+
+        with pytest.raises(TypeError):
+            Vector3DArray.from_vectors([Vector3D(), (1, 2, 3)])
+
+    def test_arithmetic(self):
+        a = Vector3DArray([[1, 2, 3], [4, 5, 6]])
+        b = Vector3DArray([[1, 1, 1], [2, 2, 2]])
+
+        assert a + b == Vector3DArray([[2, 3, 4], [6, 7, 8]])
+        assert a - b == Vector3DArray([[0, 1, 2], [2, 3, 4]])
+        assert a + Vector3D(1, 0, 0) == Vector3DArray([[2, 2, 3], [5, 5, 6]])
+        assert a * 2 == 2 * a == Vector3DArray([[2, 4, 6], [8, 10, 12]])
+        assert a / 2 == Vector3DArray([[.5, 1, 1.5], [2, 2.5, 3]])
+        assert -a == Vector3DArray([[-1, -2, -3], [-4, -5, -6]])
+        assert abs(-a) == a
+
+        with pytest.raises(TypeError):
+            a * "2"
+
+        with pytest.raises(TypeError):
+            a + 1
+
+        with pytest.raises(ValueError):
+            a + Vector3DArray([[1, 2, 3]])
+
+    def test_products(self):
+        a = Vector3DArray([[1, 2, 3], [3, 4, 0]])
+        vectors = a.to_vectors()
+        other = Vector3D(0, 1, 0)
+
+        assert np.allclose(a.norm(), [v.norm() for v in vectors])
+        assert np.array_equal(a.dot(other), [v.dot(other) for v in vectors])
+        assert a.cross(other).to_vectors() == [
+            v.cross(other) for v in vectors
+        ]
+
+
+class TestBatchedDistances:
+
+    def test_as_points(self):
+        array = Vector3DArray([Vector3D(1, 2, 3)])
+
+        assert as_points(array) is array.array
+        assert np.array_equal(as_points(Vector3D(1, 2, 3)), [[1, 2, 3]])
+        assert np.array_equal(as_points([(1, 2, 3), (4, 5, 6)]), [
+            [1, 2, 3], [4, 5, 6]
+        ])
+
+    def test_distances(self):
+        a = [Vector3D(0, 0, 0), Vector3D(1, 2, 3), Vector3D(-1, -2, -3)]
+        b = [Vector3D(1, 1, 1), Vector3D(1, 2, 3), Vector3D(0, 0, 0)]
+
+        assert np.array_equal(
+            distances3D(a, b),
+            [distance3D(u, v) for u, v in zip(a, b)]
+        )
+        assert np.array_equal(
+            distances3D(Vector3DArray(a), Vector3D()),
+            [distance3D(u, Vector3D()) for u in a]
+        )
+
+        with pytest.raises(ValueError):
+            distances3D(a, b[:2])
+
+    def test_pairwise_distances(self):
+        a = [Vector3D(0, 0, 0), Vector3D(1, 2, 3)]
+        b = [Vector3D(1, 1, 1), Vector3D(0, 0, 1), Vector3D(3, 2, 1)]
+
+        assert np.allclose(
+            pairwise_distances(a, b),
+            [[distance3D(u, v) for v in b] for u in a]
+        )
+        assert pairwise_distances(a, b).shape == (2, 3)
+
+    def test_path_length(self):
+        assert path_length([]) == 0
+        assert path_length([Vector3D(1, 2, 3)]) == 0
+        assert path_length(
+            [Vector3D(0, 0, 0), Vector3D(3, 4, 0), Vector3D(3, 4, 12)]
+        ) == 17
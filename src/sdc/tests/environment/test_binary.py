@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from ...environment.binary import BinaryTrackSequence, is_binary, write_binary
+from ...environment.generator import TrackGenerator
+from ...environment.reader import TrackSequenceReader
+from .test_reader import EXAMPLES
+
+
+class TestBinaryTrackSequence:
+
+    def test_convert(self, tmp_path):
+        path = str(tmp_path / "tracks.sdct")
+        reader = TrackSequenceReader(EXAMPLES)
+        reader.to_binary(path)
+
+        assert is_binary(path)
+        assert not is_binary(EXAMPLES)
+
+        sequence = TrackSequenceReader(path).track_sequence
+        assert isinstance(sequence, BinaryTrackSequence)
+        assert len(sequence) == len(reader.track_sequence)
+        assert [t.fingerprint() for t in sequence] == [
+            t.fingerprint() for t in reader.track_sequence
+        ]
+        assert sequence[-1].fingerprint() == (
+            reader.track_sequence[-1].fingerprint()
+        )
+        assert len(sequence[1:3]) == 2
+
+        with pytest.raises(IndexError):
+            sequence[len(sequence)]
+
+    def test_layout(self, tmp_path):
+        path = str(tmp_path / "tracks.sdct")
+        write_binary(
+            path,
+            [[0, 0, 0], [1, 1, 1]],
+            [[10, 0, 0], [11, 1, 1]],
+            [0, 0, 2],
+            [[5, 0, 0], [6, 1, 1]],
+            [[0, 90, 0], [45, 90, 0]]
+        )
+        sequence = BinaryTrackSequence(path)
+
+        assert sequence.offsets.tolist() == [0, 0, 2]
+        assert np.array_equal(sequence.positions, [[5, 0, 0], [6, 1, 1]])
+        assert [len(track.rings) for track in sequence] == [0, 2]
+        assert np.isclose(sequence[1].rings[1].rotation.x, np.pi / 4)
+
+    def test_generator(self, tmp_path):
+        path = str(tmp_path / "tracks.sdct")
+        TrackGenerator(seed=5).write_binary(path, 3, 7)
+
+        assert [t.fingerprint() for t in BinaryTrackSequence(path)] == [
+            t.fingerprint()
+            for t in TrackGenerator(seed=5).generate_sequence(3, 7)
+        ]
+
+    def test_invalid(self, tmp_path):
+        path = tmp_path / "tracks.sdct"
+
+        with pytest.raises(ValueError):
+            write_binary(str(path), [[0, 0, 0]], [], [0, 0], [], [])
+
+        path.write_bytes(b"SDCTRACK" + bytes(40))
+        with pytest.raises(ValueError):
+            BinaryTrackSequence(str(path))
+
+    def test_corrupted(self, tmp_path):
+        path = str(tmp_path / "tracks.sdct")
+        write_binary(
+            path,
+            [[0, 0, 0], [1, 1, 1]],
+            [[10, 0, 0], [11, 1, 1]],
+            [0, 1, 2],
+            [[5, 0, 0], [6, 1, 1]],
+            [[0, 90, 0], [45, 90, 0]]
+        )
+        data = open(path, mode="rb").read()
+        offsets = 32 + 2 * 2 * 24
+
+        for corrupted in ([1, 1, 2], [0, 1, 1], [0, 3, 2], [0, -1, 2]):
+            with open(path, mode="wb") as fp:
+                fp.write(data[:offsets])
+                fp.write(np.array(corrupted, dtype="<i8").tobytes())
+                fp.write(data[offsets + 24:])
+
+            with pytest.raises(ValueError, match="ring offsets"):
+                BinaryTrackSequence(path)
+
+        positions = bytearray(data)
+        positions[offsets + 24 + 24:offsets + 24 + 32] = (
+            np.array(np.nan, dtype="<f8").tobytes()
+        )
+        with open(path, mode="wb") as fp:
+            fp.write(positions)
+
+        sequence = BinaryTrackSequence(path)
+        assert len(sequence[0].rings) == 1
+
+        with pytest.raises(ValueError, match="track 1"):
+            sequence[1]
+
+        with pytest.raises(ValueError, match="finite"):
+            sequence.track_arrays(-1)
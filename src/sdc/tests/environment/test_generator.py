@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from ...environment.generator import TrackGenerator
+from ...environment.reader import TrackSequenceReader
+
+
+class TestTrackGenerator:
+
+    def test_seed(self):
+        a = TrackGenerator(seed=3).generate_sequence(3, 20)
+        b = TrackGenerator(seed=3).generate_sequence(3, 20)
+        c = TrackGenerator(seed=4).generate(20)
+
+        assert [t.fingerprint() for t in a] == [t.fingerprint() for t in b]
+        assert c.fingerprint() != a[0].fingerprint()
+        assert len(a[0].rings) == 20
+
+    def test_limits(self):
+        generator = TrackGenerator(
+            seed=0,
+            spacing_range=(5, 10),
+            bounds=((0, 50), (0, 50), (0, 10))
+        )
+        track = generator.generate(500)
+        waypoints = track.waypoint_array
+
+        assert np.all(waypoints >= 0)
+        assert np.all(waypoints <= [50, 50, 10])
+        assert np.all(track.segment_lengths <= 10)
+
+    def test_ring_orientation(self):
+        track = TrackGenerator(seed=1).generate(50)
+        waypoints = track.waypoint_array
+
+        for i, ring in enumerate(track.rings):
+            tangent = waypoints[i + 2] - waypoints[i]
+            tangent /= np.linalg.norm(tangent)
+            assert np.isclose(np.dot(tuple(ring.normal), tangent), 1)
+
+    def test_write_json(self, tmp_path):
+        path = str(tmp_path / "tracks.json")
+        TrackGenerator(seed=2).write_json(path, 2, 15)
+
+        expected = TrackGenerator(seed=2).generate_sequence(2, 15)
+        tracks = TrackSequenceReader(path).track_sequence
+
+        assert [t.fingerprint() for t in tracks] == [
+            t.fingerprint() for t in expected
+        ]
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            TrackGenerator(spacing_range=(0, 1))
+
+        with pytest.raises(ValueError):
+            TrackGenerator(bounds=((0, 1), (0, 1), (1, 1)))
+
+        with pytest.raises(ValueError):
+            TrackGenerator(pitch_limit=91)
+
+        with pytest.raises(TypeError):
+            TrackGenerator(seed=1.5)
+
+        with pytest.raises(ValueError):
+            TrackGenerator().generate(-1)
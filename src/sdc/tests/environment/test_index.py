@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from ...environment.index import UniformGridIndex
+
+
+def brute_force(points: np.ndarray, queries: np.ndarray) -> np.ndarray:
+    difference = queries[:, None, :] - points[None, :, :]
+    return np.sqrt((difference ** 2).sum(axis=-1))
+
+
+class TestUniformGridIndex:
+
+    @pytest.mark.parametrize("flat", [False, True])
+    def test_nearest(self, flat):
+        rng = np.random.default_rng(0)
+        points = rng.uniform(-100, 100, (500, 3))
+        if flat:
+            points[:, 2] = 0
+        queries = np.concatenate((
+            rng.uniform(-300, 300, (200, 3)),
+            points[:10]
+        ))
+
+        indices, distances = UniformGridIndex(points).nearest(queries)
+        expected = brute_force(points, queries)
+
+        assert np.array_equal(indices, expected.argmin(axis=1))
+        assert np.allclose(distances, expected.min(axis=1))
+        assert np.all(distances[-10:] == 0)
+
+    def test_nearest_ties(self):
+        index = UniformGridIndex(np.zeros((4, 3)))
+        indices, distances = index.nearest([[1, 1, 1], [0, 0, 0]])
+
+        assert indices.tolist() == [0, 0]
+        assert np.allclose(distances, [3 ** .5, 0])
+
+    @pytest.mark.parametrize("radius", [0, 15, 1000])
+    def test_within(self, radius):
+        rng = np.random.default_rng(1)
+        points = rng.uniform(-50, 50, (300, 3))
+        queries = rng.uniform(-80, 80, (100, 3))
+
+        result = UniformGridIndex(points, cell_size=10).within(
+            queries, radius
+        )
+        expected = brute_force(points, queries)
+
+        assert len(result) == len(queries)
+        for found, row in zip(result, expected):
+            assert np.array_equal(found, np.flatnonzero(row <= radius))
+
+    def test_empty(self):
+        index = UniformGridIndex(np.empty((0, 3)))
+        indices, distances = index.nearest([[0, 0, 0]])
+
+        assert indices.tolist() == [-1]
+        assert distances.tolist() == [np.inf]
+        assert [len(found) for found in index.within([[0, 0, 0]], 1)] == [0]
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            UniformGridIndex(np.zeros((1, 3)), cell_size=0)
+
+        with pytest.raises(ValueError):
+            UniformGridIndex(np.zeros((1, 3))).within([[0, 0, 0]], -1)
@@ -0,0 +1,172 @@
+import json
+import math
+import os
+
+import pytest
+
+from ...environment.generator import TrackGenerator
+from ...environment.reader import (
+    MultiTrackSequenceReader,
+    TrackSequenceError,
+    TrackSequenceReader
+)
+
+EXAMPLES = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "examples", "tracks.json"
+)
+
+
+class TestTrackSequenceReader:
+
+    def test_lazy(self, tmp_path):
+        path = tmp_path / "tracks.json"
+        reader = TrackSequenceReader(str(path))  # File does not exist yet.
+
+        path.write_text("{}")
+        assert reader.track_sequence == []
+
+    def test_iter_tracks(self):
+        reader = TrackSequenceReader(EXAMPLES)
+        with open(EXAMPLES, mode="r", encoding="utf-8") as fp:
+            data = json.load(fp)
+
+        tracks = list(reader.iter_tracks())
+        assert len(tracks) == len(data)
+        assert [len(track.rings) for track in tracks] == [
+            len(value["rings"]) for value in data.values()
+        ]
+        assert [t.fingerprint() for t in tracks] == [
+            t.fingerprint() for t in reader.track_sequence
+        ]
+
+    def test_iter_tracks_chunks(self, tmp_path):
+        path = str(tmp_path / "tracks.json")
+        TrackGenerator(seed=0).write_json(path, 3, 40)
+
+        reader = TrackSequenceReader(path)
+        reader.CHUNK_SIZE = 7
+
+        assert [t.fingerprint() for t in reader.iter_tracks()] == [
+            t.fingerprint() for t in TrackGenerator(seed=0).generate_sequence(
+                3, 40
+            )
+        ]
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "[]",
+        '{"track1": {"start": [0, 0, 0], "end": [1, 0, 0], "rings": []}',
+        '{"track1": {"start": [0, 0, 0], "end": [1, 0, 0], "rings": []},}',
+        '{"track1" {"start": [0, 0, 0], "end": [1, 0, 0], "rings": []}}',
+        '{"track1": {"start": [0, 0, 0], "end": [1, 0, 0], "rings": []}} {',
+        '{1: {"start": [0, 0, 0], "end": [1, 0, 0], "rings": []}}'
+    ])
+    def test_iter_tracks_invalid(self, tmp_path, text):
+        path = tmp_path / "tracks.json"
+        path.write_text(text)
+
+        with pytest.raises(json.JSONDecodeError):
+            list(TrackSequenceReader(str(path)).iter_tracks())
+
+    def test_read_invalid_fields(self, tmp_path):
+        path = tmp_path / "tracks.json"
+        path.write_text(json.dumps({
+            "track1": {
+                "start": [0, 0, float("nan")],
+                "end": [1, 0, 0],
+                "rings": [
+                    {"position": [0, 0, 0], "rotation": [0, 0, 0]},
+                    {"position": [0, 0], "rotation": [0, 0, "0"]}
+                ]
+            },
+            "track2": {"start": [0, 0, 0], "rings": [1]},
+            "track3": {
+                "start": [0, 0, 0],
+                "end": [1, 0, 0],
+                "rings": [{"position": [0, 0, 0]}]
+            },
+            "track4": {"start": [0, 0, 0], "end": [1, 0, 0], "rings": []}
+        }))
+
+        with pytest.raises(TrackSequenceError) as info:
+            TrackSequenceReader(str(path)).read()
+
+        assert isinstance(info.value, ValueError)
+        assert [path for path, _ in info.value.errors] == [
+            "$.track1.start",
+            "$.track1.rings[1].position",
+            "$.track1.rings[1].rotation",
+            "$.track2.end",
+            "$.track2.rings[0]",
+            "$.track3.rings[0].rotation"
+        ]
+        assert "$.track2.end: missing field" in str(info.value)
+        assert "$.track3.rings[0].rotation: missing field" in str(info.value)
+
+    def test_read_valid_fields(self, tmp_path):
+        path = tmp_path / "tracks.json"
+        path.write_text(json.dumps({
+            "track1": {
+                "start": [0, 0, 2 ** 70],  # Object dtype, slow path.
+                "end": [1.5, 0, 0],
+                "rings": [{"position": [0, 1, 0], "rotation": [90, 0, 0]}]
+            }
+        }))
+
+        track, = TrackSequenceReader(str(path)).read()
+        assert (track.start.x, track.start.z) == (0, 2.0 ** 70)
+        assert track.end.x == 1.5
+        assert track.rings[0].rotation.x == pytest.approx(math.pi / 2)
+
+
+class TestMultiTrackSequenceReader:
+
+    def test_cache(self, tmp_path):
+        directory, cache = tmp_path / "tracks", str(tmp_path / "cache")
+        directory.mkdir()
+        for seed in range(3):
+            TrackGenerator(seed=seed).write_json(
+                str(directory / f"tracks{seed}.json"), 2, 5
+            )
+
+        expected = [
+            track.fingerprint()
+            for seed in range(3)
+            for track in TrackGenerator(seed=seed).generate_sequence(2, 5)
+        ]
+
+        cold = MultiTrackSequenceReader(str(directory), cache, max_workers=2)
+        assert [t.fingerprint() for t in cold.track_sequence] == expected
+        assert (cold.cache_hits, cold.cache_misses) == (0, 3)
+
+        warm = MultiTrackSequenceReader(str(directory / "*.json"), cache)
+        assert [t.fingerprint() for t in warm.iter_tracks()] == expected
+        assert (warm.cache_hits, warm.cache_misses) == (3, 0)
+
+        TrackGenerator(seed=9).write_json(
+            str(directory / "tracks1.json"), 1, 5
+        )
+        changed = MultiTrackSequenceReader(str(directory), cache)
+        assert [len(sequence) for sequence in changed.sequences] == [2, 1, 2]
+        assert (changed.cache_hits, changed.cache_misses) == (2, 1)
+
+    def test_cache_eviction(self, tmp_path):
+        directory, cache = tmp_path / "tracks", tmp_path / "cache"
+        directory.mkdir()
+        for seed in range(3):
+            TrackGenerator(seed=seed).write_json(
+                str(directory / f"tracks{seed}.json"), 2, 5
+            )
+
+        MultiTrackSequenceReader(str(directory), str(cache)).load()
+        assert len(list(cache.glob("*.sdct"))) == 3
+
+        reader = MultiTrackSequenceReader(
+            str(directory / "tracks0.json"), str(cache), max_cache_size=0
+        )
+        reader.load()
+
+        assert [path.name for path in cache.glob("*.sdct")] == [
+            f"{reader.cache_key(reader.paths[0])}.sdct"
+        ]
+        assert len(reader.track_sequence) == 2
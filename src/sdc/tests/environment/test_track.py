@@ -0,0 +1,279 @@
+import pickle
+
+import matplotlib
+import numpy as np
+import pytest
+
+from ...core.vector import Rotator3D, Vector3D, path_length
+from ...environment.track import Track
+from ...geometry.ring import Ring
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+
+def make_track(ring_count: int = 5, **kwargs) -> Track:
+    return Track(
+        Vector3D(0, 0, 0),
+        Vector3D(10 * (ring_count + 1), 0, 0),
+        [
+            Ring(
+                Vector3D(10 * (i + 1), i % 3, -i),
+                Rotator3D(90, 10 * i, 90),
+                Vector3D(1, 1 + i / 10, 1),
+                **kwargs
+            )
+            for i in range(ring_count)
+        ]
+    )
+
+
+class TestTrack:
+
+    def test_build_surfaces(self):
+        track = make_track(complexity=16)
+        expected = [
+            Ring(r.position, r.rotation, r.scale, complexity=16).surface
+            for r in track.rings
+        ]
+
+        surfaces = track.build_surfaces()
+        assert surfaces.shape == (5, 3, 16, 16)
+        assert np.allclose(surfaces, expected)
+
+        for ring, surface in zip(track.rings, surfaces):
+            assert np.shares_memory(ring.surface, surface)
+
+        assert track.build_surfaces(np.float32).dtype == np.float32
+
+    def test_build_surfaces_radii(self):
+        track = make_track(complexity=8)
+        track.rings[0].tube_radius = 2
+
+        expected = [
+            Ring(r.position, r.rotation, r.scale, r.tube_radius, complexity=8)
+            .surface for r in track.rings
+        ]
+        assert np.allclose(track.build_surfaces(), expected)
+
+    def test_build_surfaces_complexity(self):
+        track = make_track(complexity=8)
+        track.rings[0].complexity = 10
+
+        with pytest.raises(ValueError):
+            track.build_surfaces()
+
+    def test_plot_complexities(self):
+        track = make_track(complexity=8)
+        track.rings[0].complexity = 10
+
+        fig = plt.figure()
+        track.plot(fig.add_subplot(projection="3d"))
+        plt.close(fig)
+
+        assert track.rings[0].surface.shape == (3, 10, 10)
+
+    def test_waypoint_cache(self):
+        track = make_track()
+        waypoints = track.waypoints
+
+        assert np.array_equal(
+            track.waypoint_array, [tuple(w) for w in waypoints]
+        )
+        assert track.path_length == path_length(waypoints)
+        assert track.cumulative_distances[0] == 0
+        assert np.isclose(track.cumulative_distances[-1], track.path_length)
+        assert track.waypoint_array is track.waypoint_array
+
+        track.end = Vector3D(100, 0, 0)
+        assert tuple(track.waypoint_array[-1]) == (100, 0, 0)
+        assert track.path_length == path_length(track.waypoints)
+
+        track.rings = track.rings[:2]
+        assert track.waypoint_array.shape == (4, 3)
+        assert len(track.segment_lengths) == 3
+
+    def test_waypoint_cache_in_place(self):
+        track = make_track()
+        array = track.waypoint_array
+        track.path_length
+
+        track.rings[0].position.x = 100
+        track.start.z = 5
+        assert track.waypoint_array is not array
+        assert tuple(track.waypoint_array[0]) == (0, 0, 5)
+        assert track.waypoint_array[1, 0] == 100
+        assert track.path_length == path_length(track.waypoints)
+        assert np.isclose(
+            track.cumulative_distances[-1], track.path_length
+        )
+
+        rings = track.rings
+        rings.append(Ring(Vector3D(100, 0, 0)))
+        assert len(track) == 7 and track.waypoint_array.shape == (7, 3)
+
+    def test_distance_remaining(self):
+        track = Track(
+            Vector3D(0, 0, 0),
+            Vector3D(30, 0, 0),
+            [Ring(Vector3D(10, 0, 0)), Ring(Vector3D(20, 0, 0))]
+        )
+
+        assert track.distance_remaining(0) == 30
+        assert track.distance_remaining(2) == 10
+        assert track.distance_remaining(3) == 0
+        assert track.distance_remaining(2, Vector3D(15, 0, 0)) == 15
+
+    def test_nearest_rings(self):
+        track = make_track(ring_count=3)
+        indices, distances = track.nearest_rings(
+            [Vector3D(9, 0, 0), Vector3D(31, 2, -2), Vector3D(100, 0, 0)]
+        )
+
+        assert indices.tolist() == [0, 2, 2]
+        assert np.allclose(distances[:2], [1, 1])
+        assert [
+            found.tolist()
+            for found in track.rings_within([Vector3D(15, 0, 0)], 6)
+        ] == [[0, 1]]
+
+        index = track.index
+        assert track.index is index
+
+        track.rings = track.rings[:1]
+        assert track.index is not index
+        assert track.nearest_rings(Vector3D(31, 2, -2))[0].tolist() == [0]
+
+    def test_nearest_rings_in_place(self):
+        track = make_track(ring_count=3)
+        index = track.index
+
+        track.rings[0].position.set(100.0, 0.0, 0.0)
+        assert track.index is not index
+        assert track.nearest_rings(Vector3D(99, 0, 0))[0].tolist() == [0]
+        assert [
+            found.tolist()
+            for found in track.rings_within([Vector3D(9, 0, 0)], 2)
+        ] == [[]]
+
+        track.rings[1].position.y = 50
+        indices, distances = track.nearest_rings(Vector3D(20, 50, -1))
+        assert indices.tolist() == [1] and np.allclose(distances, [0])
+
+    def test_build_surfaces_lod(self):
+        track = make_track(complexity=30)
+        surfaces = track.build_surfaces(complexity=10)
+        expected = [
+            Ring(r.position, r.rotation, r.scale, complexity=10).surface
+            for r in track.rings
+        ]
+
+        assert surfaces.shape == (5, 3, 10, 10)
+        assert np.allclose(surfaces, expected)
+        assert track.rings[0].surface.shape == (3, 30, 30)
+
+    def test_lod_complexity(self):
+        track = make_track(ring_count=100, complexity=100)
+        assert track.lod_complexity() == 20
+        assert track.lod_complexity(vertex_budget=0) == 8
+        assert track.lod_complexity((12.8, 9.6)) == 21
+
+        assert make_track(complexity=12).lod_complexity() == 12
+        assert make_track(complexity=4).lod_complexity() == 4
+
+    def test_fingerprint(self):
+        track = make_track()
+        fingerprint = track.fingerprint()
+
+        assert make_track().fingerprint() == fingerprint
+        assert track.fingerprint() is fingerprint
+        assert hash(make_track()) != hash(track)
+
+        track.rings[0].position = Vector3D(0, 0, 0)
+        assert track.fingerprint() != fingerprint
+
+        track = make_track()
+        track.rings[0].position.x = 123.0
+        assert track.fingerprint() != fingerprint
+
+        track.rings[0].position.x = 10.0
+        assert track.fingerprint() == fingerprint
+
+        track.end.z = 1
+        assert track.fingerprint() != fingerprint
+
+        track = make_track()
+
+        track.rings = track.rings[::-1]
+        assert track.fingerprint() != fingerprint
+
+        track.rings = track.rings[::-1]
+        track.end = Vector3D(0, 0, 1)
+        assert track.fingerprint() != fingerprint
+
+    def test_pickle(self):
+        track = make_track(complexity=8)
+        track.build_surfaces()
+        track.nearest_rings(track.waypoints)
+
+        copy = pickle.loads(pickle.dumps(track))
+        assert copy._waypoint_array is copy._index is None
+        assert copy.rings[0]._surface is None
+        assert copy.fingerprint() == track.fingerprint()
+        assert np.array_equal(copy.waypoint_array, track.waypoint_array)
+
+    def test_surface_quads(self):
+        surfaces = make_track(complexity=4).build_surfaces()
+        quads = Track.surface_quads(surfaces)
+
+        assert quads.shape == (5 * 3 * 3, 4, 3)
+        assert np.array_equal(quads[0, 0], surfaces[0, :, 0, 0])
+        assert np.array_equal(quads[0, 2], surfaces[0, :, 1, 1])
+        assert np.array_equal(quads[-1, 2], surfaces[-1, :, 3, 3])
+
+    def test_plot(self):
+        fig = plt.figure()
+        ax = fig.add_subplot(projection="3d")
+        make_track(complexity=30).plot(ax)
+
+        assert len(ax.collections) == 1
+        assert [text.get_text() for text in ax.get_legend().get_texts()] == [
+            "Start", "End", "Ring 1", "Ring 2", "Ring 3", "Ring 4", "Ring 5"
+        ]
+
+        plt.close(fig)
+
+    def test_detect_collisions(self):
+        track = Track(
+            Vector3D(0, 0, 0),
+            Vector3D(30, 0, 0),
+            [
+                Ring(Vector3D(10, 0, 0), Rotator3D(90, 0, 90)),
+                Ring(Vector3D(20, 0, 0), Rotator3D(90, 0, 90))
+            ]
+        )
+
+        step, ring, clearance = track.detect_collisions(track.waypoints)
+        assert (step, ring) == (None, None)
+        assert np.isclose(clearance, 4)
+
+        # Hit the tube of the second ring (hole radius 5, tube radius 1):
+        trajectory = [
+            Vector3D(10, 0, 0), Vector3D(15, 0, 5), Vector3D(20, 0, 5)
+        ]
+        step, ring, clearance = track.detect_collisions(trajectory)
+        assert (step, ring) == (2, 1)
+        assert np.isclose(clearance, -1)
+
+        assert track.detect_collisions(np.empty((0, 3))) == (
+            None, None, float("inf")
+        )
+
+    def test_detect_collisions_chunks(self):
+        track = make_track(20)
+        trajectory = np.random.default_rng(0).uniform(-5, 200, (300, 3))
+        expected = track.detect_collisions(trajectory)
+
+        track.COLLISION_CHUNK_SIZE = 300
+        assert track.detect_collisions(trajectory) == expected
@@ -0,0 +1,47 @@
+import matplotlib
+import numpy as np
+
+from ...core.vector import Rotator3D, Vector3D
+from ...geometry.drone import Drone
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+
+class TestDrone:
+
+    def test_vertices(self):
+        drone = Drone(Vector3D(1, 2, 3), Rotator3D())
+
+        assert np.allclose(drone.vertices.mean(axis=0), [1, 2, 3])
+        assert np.allclose(drone.vertices, Drone.STRUCTURE + [.5, 1.5, 2.5])
+
+    def test_vertices_cache(self):
+        drone = Drone(Vector3D(0, 0, 0), Rotator3D(90, 0, 0))
+        vertices = drone.vertices
+        assert drone.vertices is vertices
+
+        drone.position.set(1, 0, 0)
+        assert drone.vertices is not vertices
+        assert np.allclose(drone.vertices, vertices + [1, 0, 0])
+
+        expected = (Drone.STRUCTURE - .5) @ drone.rotation.matrix.T
+        assert np.allclose(vertices, expected)
+
+    def test_plot(self):
+        fig = plt.figure()
+        ax = fig.add_subplot(projection="3d")
+        drone = Drone(Vector3D(0, 0, 0), Rotator3D())
+
+        artist = drone.plot(ax)
+        assert artist in ax.collections
+
+        drone.position.set(5, 0, 0)
+        assert drone.plot(ax) is artist
+        assert len(ax.collections) == 1
+
+        other = fig.add_subplot(projection="3d")
+        assert drone.plot(other) is not artist
+
+        plt.close(fig)
@@ -0,0 +1,162 @@
+import numpy as np
+
+from ...core.vector import Rotator3D, Vector3D
+from ...geometry.ring import Ring, clear_mesh_cache, mesh_cache_info
+
+
+class TestRing:
+
+    def test_defaults_not_shared(self):
+        a, b = Ring(), Ring()
+        a.scale *= 2
+        a.position += Vector3D(1, 0, 0)
+
+        assert a.scale == Vector3D(2, 2, 2)
+        assert b.scale == Vector3D(1, 1, 1)
+        assert Ring().position == Vector3D(0, 0, 0)
+        assert a.position is not b.position
+
+    def test_values_copied(self):
+        position = Vector3D(1, 2, 3)
+        ring = Ring(position)
+        position.x = 10
+
+        assert ring.position == Vector3D(1, 2, 3)
+
+    def test_lazy_surface(self):
+        ring = Ring(Vector3D(1, 2, 3), Rotator3D(90, 0, 90), complexity=10)
+        assert ring._surface is None
+
+        surface = ring.surface
+        assert surface.shape == (3, 10, 10)
+        assert ring.surface is surface
+
+    def test_surface_invalidation(self):
+        ring = Ring(complexity=10)
+        surface = ring.surface
+
+        ring.position = Vector3D(10, 0, 0)
+        assert np.allclose(ring.surface, surface + [[[10]], [[0]], [[0]]])
+
+        for attribute, value in (
+            ("rotation", Rotator3D(0, 90, 0)),
+            ("scale", Vector3D(2, 2, 2)),
+            ("tube_radius", 2),
+            ("hole_radius", 3),
+            ("complexity", 20)
+        ):
+            surface = ring.surface
+            setattr(ring, attribute, value)
+            assert ring.surface is not surface
+
+        assert ring.surface.shape == (3, 20, 20)
+
+    def test_surface_in_place(self):
+        ring = Ring(complexity=10)
+        surface = ring.surface
+        version = ring.version
+
+        ring.position.x = 100
+        assert ring.version > version
+        assert np.allclose(ring.surface, surface + [[[100]], [[0]], [[0]]])
+
+        ring.position.set(0.0, 0.0, 0.0)
+        assert np.allclose(ring.surface, surface)
+
+        ring.rotation.set(0.0, np.pi / 2, 0.0)
+        assert not np.allclose(ring.surface, surface)
+
+        surface = ring.surface
+        ring.scale.z = 2
+        assert np.allclose(ring.surface[2], surface[2] * 2)
+        assert ring.surface is ring.surface
+
+    def test_mesh_cache(self):
+        clear_mesh_cache()
+        rings = [
+            Ring(Vector3D(i, 0, 0), Rotator3D(i, 0, 0), complexity=12)
+            for i in range(5)
+        ]
+
+        for ring in rings:
+            ring.surface
+
+        info = mesh_cache_info()
+        assert (info.hits, info.misses) == (4, 1)
+        assert rings[0].local_surface is rings[-1].local_surface
+        assert not rings[0].local_surface.flags.writeable
+
+        Ring(tube_radius=2, complexity=12).surface
+        assert mesh_cache_info().misses == 2
+
+    def test_crosses(self):
+        ring = Ring(Vector3D(10, 0, 0), Rotator3D(90, 0, 90))
+        assert np.allclose([*ring.normal], [1, 0, 0])
+
+        assert ring.crosses(Vector3D(9, 0, 0), Vector3D(11, 0, 0))
+        assert ring.crosses(Vector3D(11, 4, 0), Vector3D(9, 4, 1))
+        assert not ring.crosses(Vector3D(9, 0, 0), Vector3D(9.5, 0, 0))
+        assert not ring.crosses(Vector3D(9, 6, 0), Vector3D(11, 6, 0))
+
+        ring.scale = Vector3D(1, 2, 2)
+        assert ring.crosses(Vector3D(9, 6, 0), Vector3D(11, 6, 0))
+
+    def test_crossed_segments(self):
+        ring = Ring(
+            Vector3D(1, 2, 3),
+            Rotator3D(30, 20, 10),
+            Vector3D(1, 1.5, 1)
+        )
+        points = np.random.default_rng(0).uniform(-10, 10, (500, 3))
+        crossed = ring.crossed_segments(points)
+
+        assert crossed.shape == (499,)
+        assert crossed.any()
+        assert crossed.tolist() == [
+            ring.crosses(Vector3D(*a), Vector3D(*b))
+            for a, b in zip(points[:-1].tolist(), points[1:].tolist())
+        ]
+
+    def test_signed_distances(self):
+        ring = Ring(Vector3D(10, 0, 0), Rotator3D(90, 0, 90))
+        distances = ring.signed_distances([
+            Vector3D(10, 0, 0),
+            Vector3D(10, 5, 0),
+            Vector3D(10, 0, 6.5),
+            Vector3D(12, 0, 5)
+        ])
+
+        assert np.allclose(distances, [4, -1, 0.5, 1])
+        assert np.allclose(ring.to_local([Vector3D(10, 0, 5)]), [[0, 5, 0]])
+
+    def test_fingerprint(self):
+        ring = Ring(Vector3D(1, 2, 3), Rotator3D(10, 20, 30))
+        fingerprint = ring.fingerprint()
+
+        assert fingerprint == Ring(
+            Vector3D(1, 2, 3), Rotator3D(10, 20, 30), complexity=10
+        ).fingerprint()
+        assert len(fingerprint) == 64
+        assert ring.fingerprint() is fingerprint
+
+        ring.complexity = 10
+        assert ring.fingerprint() == fingerprint
+
+        ring.hole_radius = 4
+        assert ring.fingerprint() != fingerprint
+
+        ring.hole_radius = 5
+        assert ring.fingerprint() == fingerprint
+
+        ring.rotation = Rotator3D(10, 20, 31)
+        assert ring.fingerprint() != fingerprint
+
+        ring.rotation = Rotator3D(10, 20, 30)
+        ring.position.x = 123.0
+        assert ring.fingerprint() != fingerprint
+
+        ring.position.set(1.0, 2.0, 3.0)
+        assert ring.fingerprint() == fingerprint
+
+        ring.scale.z = 2
+        assert ring.fingerprint() != fingerprint